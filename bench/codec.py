@@ -0,0 +1,61 @@
+"""Bytes per sample and encode cost of the log codec on typical curing data.
+
+Run from the repository root: python bench/codec.py
+On the Pico: mpremote mount . run bench/codec.py
+"""
+
+import math
+import sys
+
+sys.path.append("bench")
+
+from harness import setup_path, ticks_diff, ticks_us
+
+setup_path()
+
+from codec import BlockEncoder, decode_block
+
+BLOCK_SIZE = 512
+SAMPLES = 10080  # a week at one record per minute
+RAW_RECORD_SIZE = 10  # struct "<IhhBB"
+
+
+def curing_data(count: int):
+    """A chamber around 6 C and 75 %: slow drift, sensor noise and a fridge
+    cycling every 20 minutes."""
+    seed = 12345
+    for i in range(count):
+        seed = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+        noise = seed % 3 - 1
+        fridge = (i // 10) % 2
+        temperature = 60 + int(5 * math.sin(i / 20)) - 4 * fridge + noise
+        humidity = 750 + int(30 * math.sin(i / 300)) + noise
+        yield (1700000000 + i * 60, temperature, humidity, fridge | 8, 0)
+
+
+def main():
+    data = list(curing_data(SAMPLES))
+    encoder = BlockEncoder(BLOCK_SIZE)
+    blocks = []
+    start = ticks_us()
+    for record in data:
+        if not encoder.add(*record):
+            blocks.append(bytes(encoder.block()))
+            encoder.reset()
+            encoder.add(*record)
+    elapsed = ticks_diff(ticks_us(), start)
+    blocks.append(bytes(encoder.block()))
+
+    decoded = [record for block in blocks for record in decode_block(block)]
+    assert decoded == data, "round trip failed"
+
+    size = len(blocks) * BLOCK_SIZE
+    print(f"{SAMPLES} samples in {len(blocks)} blocks of {BLOCK_SIZE} bytes")
+    print(
+        f"{size / SAMPLES:.2f} bytes/sample with padding, "
+        f"raw records {RAW_RECORD_SIZE}, {RAW_RECORD_SIZE * SAMPLES / size:.1f}x smaller"
+    )
+    print(f"encode {elapsed / SAMPLES:.1f} us/sample")
+
+
+main()
@@ -0,0 +1,48 @@
+"""Compare two JSON reports of bench/hot_paths.py.
+
+    python bench/compare.py before.json after.json [--threshold 10]
+
+Exits with status 1 if the p50 of a case got slower by more than threshold percent.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict:
+    with open(path) as file:
+        text = file.read().strip()
+    # reports captured from the device console end with the JSON line
+    return json.loads(text.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    before = {r["name"]: r for r in load(args.before)["results"]}
+    after = load(args.after)["results"]
+    regressed = False
+    for result in after:
+        old = before.get(result["name"])
+        if old is None:
+            print(f"{result['name']:32} new      p50 {result['p50_us']:>8} us")
+            continue
+        change = (result["p50_us"] - old["p50_us"]) * 100 / max(old["p50_us"], 1)
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressed = True
+        print(
+            f"{result['name']:32} p50 {old['p50_us']:>8} -> {result['p50_us']:>8} us"
+            f" {change:+7.1f}%{flag}"
+        )
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Startup to first frame of the ILI9225, table driven init against the old
+register by register init. Run from the repository root:
+
+    python bench/display_startup.py
+    mpremote mount . run bench/display_startup.py
+
+Startup is the driver's constructor, which initializes the display, the first
+frame a rendered overview page written in full. Both include the 150 ms the
+init sequence waits for the display's power supply on the Pico, on CPython
+those waits follow the virtual clock and take no time. On CPython the SPI and
+pin stand-ins also count the writes and pin changes.
+"""
+
+import sys
+
+sys.path.append("bench")
+
+from harness import Runner, setup_path, ticks_diff, ticks_us
+
+setup_path()
+
+from framebuf import RGB565
+from machine import SPI, Pin
+from time import sleep
+
+from display.dirty import TrackedFrameBuffer
+from display import ili9225
+from display.ili9225 import ILI9225
+from display.pages import OverviewPage
+
+WIDTH = 176
+HEIGHT = 220
+CHIP_SELECT = 5
+DATA_COMMAND = 8
+
+
+class LegacyILI9225(ILI9225):
+    """The driver's writes as they were: new bytes for every register and
+    command, chip select toggled around each of them."""
+
+    def _init_display(self):
+        self.writeRegister(ili9225.ILI9225_DRIVER_OUTPUT_CTRL, 0x031C)
+        self.writeRegister(ili9225.ILI9225_LCD_AC_DRIVING_CTRL, 0x0100)
+        self.writeRegister(ili9225.ILI9225_ENTRY_MODE, 0x0010)
+        self.writeRegister(ili9225.ILI9225_BLANK_PERIOD_CTRL1, 0x0808)
+        self.writeRegister(ili9225.ILI9225_INTERFACE_CTRL, 0x0000)
+        self.writeRegister(ili9225.ILI9225_OSC_CTRL, 0x0801)
+        self.writeRegister(ili9225.ILI9225_RAM_ADDR_SET1, 0x0000)
+        self.writeRegister(ili9225.ILI9225_RAM_ADDR_SET2, 0x0000)
+        sleep(0.05)
+        self.writeRegister(ili9225.ILI9225_POWER_CTRL1, 0x0A00)
+        self.writeRegister(ili9225.ILI9225_POWER_CTRL2, 0x1038)
+        sleep(0.05)
+        self.writeRegister(ili9225.ILI9225_POWER_CTRL3, 0x1121)
+        self.writeRegister(ili9225.ILI9225_POWER_CTRL4, 0x0066)
+        self.writeRegister(ili9225.ILI9225_POWER_CTRL5, 0x5F60)
+        self.writeRegister(ili9225.ILI9225_GATE_SCAN_CTRL, 0x0000)
+        self.writeRegister(ili9225.ILI9225_VERTICAL_SCROLL_CTRL1, 0x00DB)
+        self.writeRegister(ili9225.ILI9225_VERTICAL_SCROLL_CTRL2, 0x0000)
+        self.writeRegister(ili9225.ILI9225_VERTICAL_SCROLL_CTRL3, 0x0000)
+        self.writeRegister(ili9225.ILI9225_PARTIAL_DRIVING_POS1, 0x00DB)
+        self.writeRegister(ili9225.ILI9225_PARTIAL_DRIVING_POS2, 0x0000)
+        self.writeRegister(ili9225.ILI9225_HORIZONTAL_WINDOW_ADDR1, 0x00AF)
+        self.writeRegister(ili9225.ILI9225_HORIZONTAL_WINDOW_ADDR2, 0x0000)
+        self.writeRegister(ili9225.ILI9225_VERTICAL_WINDOW_ADDR1, 0x00DB)
+        self.writeRegister(ili9225.ILI9225_VERTICAL_WINDOW_ADDR2, 0x0000)
+        self.writeRegister(ili9225.ILI9225_GAMMA_CTRL1, 0x4000)
+        self.writeRegister(ili9225.ILI9225_GAMMA_CTRL2, 0x060B)
+        self.writeRegister(ili9225.ILI9225_GAMMA_CTRL3, 0x0C0A)
+        self.writeRegister(ili9225.ILI9225_GAMMA_CTRL4, 0x0105)
+        self.writeRegister(ili9225.ILI9225_GAMMA_CTRL5, 0x0A0C)
+        self.writeRegister(ili9225.ILI9225_GAMMA_CTRL6, 0x0B06)
+        self.writeRegister(ili9225.ILI9225_GAMMA_CTRL7, 0x0004)
+        self.writeRegister(ili9225.ILI9225_GAMMA_CTRL8, 0x0501)
+        self.writeRegister(ili9225.ILI9225_GAMMA_CTRL9, 0x0E00)
+        self.writeRegister(ili9225.ILI9225_GAMMA_CTRL10, 0x000E)
+        sleep(0.05)
+        self.writeRegister(ili9225.ILI9225_DISP_CTRL1, 0x1017)
+
+    def writeRegister(self, command, value):
+        self._chip_select(0)
+        self._data_command(0)
+        self._write(command.to_bytes(2, "big"))
+        self._data_command(1)
+        self._write(value.to_bytes(2, "big"))
+        self._chip_select(1)
+
+    def write_command(self, command: int):
+        self._data_command.value(0)
+        self._chip_select.value(0)
+        self._write(bytearray([command]))
+        self._chip_select.value(1)
+
+    def write_data(self, data: bytearray | int):
+        self._data_command.value(1)
+        self._chip_select.value(0)
+        if isinstance(data, int):
+            self._write(bytearray([data]))
+        else:
+            self._write(data)
+        self._chip_select.value(1)
+
+    def set_window(self, x0, y0, x1, y1):
+        self.write_command(0x36)
+        self.write_data(x0)
+        self.write_command(0x37)
+        self.write_data(x1)
+        self.write_command(0x38)
+        self.write_data(y0)
+        self.write_command(0x39)
+        self.write_data(y1)
+        self.write_command(0x20)
+        self.write_data(x0)
+        self.write_command(0x21)
+        self.write_data(y0)
+
+    def _flush(self, x0: int, y0: int, x1: int, y1: int):
+        self.set_window(x0, y0, x1, y1)
+        self.write_command(0x22)
+        self._data_command.value(1)
+        self._chip_select.value(0)
+        for view in self._slice(x0, y0, x1, y1):
+            self._write(view)
+        self._chip_select.value(1)
+
+
+def pin_changes() -> int:
+    """Chip select and data/command changes so far, where the stand-ins count them."""
+    pins = getattr(Pin, "pins", {})
+    return sum(
+        len(getattr(pins[id], "history", ())) for id in (CHIP_SELECT, DATA_COMMAND)
+    )
+
+
+def startup(driver, buffer, framebuffer) -> dict:
+    spi = SPI(0, baudrate=40000000, sck=Pin(2), mosi=Pin(3))
+    start = ticks_us()
+    display = driver(spi, CHIP_SELECT, DATA_COMMAND, 9, framebuffer, buffer)
+    initialized = ticks_us()
+    init_writes = getattr(spi, "writes", 0)
+    init_pins = pin_changes()
+    page = OverviewPage(framebuffer, WIDTH, HEIGHT)
+    page.set_data(205, 705, 6.0, 75.0, True, 2, 60, 10)
+    page.render()
+    display.update()
+    first_frame = ticks_us()
+    return {
+        "display": display,
+        "init_us": ticks_diff(initialized, start),
+        "first_frame_us": ticks_diff(first_frame, start),
+        "init_writes": init_writes,
+        "init_pin_changes": init_pins,
+        "frame_writes": getattr(spi, "writes", 0) - init_writes,
+        "frame_pin_changes": pin_changes() - init_pins,
+    }
+
+
+def main():
+    buffer = bytearray(WIDTH * HEIGHT * 2)
+    framebuffer = TrackedFrameBuffer(buffer, WIDTH, HEIGHT, RGB565)
+    runner = Runner()
+    for name, driver in (("legacy", LegacyILI9225), ("table", ILI9225)):
+        framebuffer.fill(0)
+        framebuffer.dirty.clear()
+        result = startup(driver, buffer, framebuffer)
+        print(
+            f"{name:6} init {result['init_us']:>8} us  "
+            f"first frame {result['first_frame_us']:>8} us"
+        )
+        print(
+            f"{'':6} init {result['init_writes']} SPI writes, "
+            f"{result['init_pin_changes']} pin changes; first frame "
+            f"{result['frame_writes']} SPI writes, "
+            f"{result['frame_pin_changes']} pin changes"
+        )
+        display = result["display"]
+        runner.run(f"{name} _init_display", display._init_display, rounds=5, warmup=1)
+        runner.run(
+            f"{name} set_window",
+            lambda display=display: display.set_window(5, 16, 60, 31),
+        )
+        runner.run(
+            f"{name} _flush 56x16",
+            lambda display=display: display._flush(5, 16, 60, 31),
+        )
+    runner.print_summary()
+    print(runner.report())
+
+
+main()
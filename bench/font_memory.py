@@ -0,0 +1,60 @@
+"""Heap used by the fonts at import, compared with the int lists they replaced.
+
+Run from the repository root:
+
+    python bench/font_memory.py
+    mpremote mount . run bench/font_memory.py
+
+The Pico reports its heap, CPython has no heap counter and reports what
+tracemalloc traced instead, so its numbers only compare with each other.
+"""
+
+import gc
+import sys
+
+sys.path.append("bench")
+
+from harness import setup_path
+
+setup_path()
+
+
+# MicroPython's heap counter, tracemalloc on CPython
+_mem_alloc = getattr(gc, "mem_alloc", None)
+if _mem_alloc is None:
+    import tracemalloc
+
+    tracemalloc.start()
+
+
+def mem_used() -> int:
+    gc.collect()
+    if _mem_alloc is not None:
+        return _mem_alloc()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main():
+    before = mem_used()
+    from display.fonts.petme128_8x8 import font as petme
+    from display.fonts.font16x16 import font as font16
+    from display.fonts.Icons16x16 import Icons16x16
+
+    fonts = mem_used()
+    print(f"bytes fonts: {fonts - before} bytes of heap")
+
+    legacy = [
+        [b for code in range(32, 128) for b in petme.glyph(chr(code))],
+        [
+            font16.column(chr(code), column)
+            for code in range(32, 128)
+            for column in range(font16.width)
+        ],
+        [b for code in range(32, 128) for b in Icons16x16.glyph(chr(code))],
+    ]
+    lists = mem_used()
+    print(f"int list fonts: {lists - fonts} bytes of heap")
+    del legacy
+
+
+main()
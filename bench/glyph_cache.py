@@ -0,0 +1,71 @@
+"""Compare the old per-pixel scaled_text with the blit based glyph cache.
+
+Run from the repository root, on the Pico: mpremote mount . run bench/glyph_cache.py
+"""
+
+import sys
+
+sys.path.append("bench")
+
+from harness import setup_path, ticks_diff, ticks_us
+
+setup_path()
+
+from framebuf import FrameBuffer, RGB565
+
+from display.fonts.petme128_8x8 import font as petme
+from display.glyphs import GlyphCache
+
+ROUNDS = 100
+TEXT = "23.4"
+# the font as the int list the old implementation indexed into
+LEGACY_FONT = [b for code in range(32, 128) for b in petme.glyph(chr(code))]
+
+
+def legacy_scaled_text(framebuffer, string, x, y, c, s=2):
+    x0 = x
+    y0 = y
+    iterator = list(range(8)) * s
+    iterator.sort()
+    for char in string:
+        char_index = (ord(char) - 32) * 8
+        for column_offset in iterator:
+            column = LEGACY_FONT[char_index + column_offset]
+            for pixel_offset in range(8):
+                pixel = column >> pixel_offset
+                if pixel & 1:
+                    y00 = pixel_offset * s + y0
+                    for y_offset in range(s):
+                        framebuffer.pixel(x0, y00 + y_offset, c)
+            x0 = x0 + 1
+    return (x0, y + 8 * s)
+
+
+def measure(draw) -> int:
+    start = ticks_us()
+    for _ in range(ROUNDS):
+        draw()
+    return ticks_diff(ticks_us(), start) // ROUNDS
+
+
+def main():
+    framebuffer = FrameBuffer(bytearray(176 * 220 * 2), 176, 220, RGB565)
+    cache = GlyphCache()
+    cache.text(framebuffer, TEXT, 5, 16, 0x07E0)  # warm the cache
+    for scale in (2, 3):
+        legacy = measure(
+            lambda scale=scale: legacy_scaled_text(
+                framebuffer, TEXT, 5, 16, 0x07E0, scale
+            )
+        )
+        cached = measure(
+            lambda scale=scale: cache.text(framebuffer, TEXT, 5, 16, 0x07E0, scale)
+        )
+        print(
+            f"scale {scale}: legacy {legacy} us, cached {cached} us, "
+            f"{legacy / max(cached, 1):.1f}x faster"
+        )
+    print(f"cache: {cache.size()} bytes, {cache.hits} hits, {cache.misses} misses")
+
+
+main()
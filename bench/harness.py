@@ -0,0 +1,93 @@
+"""Timing helpers shared by the benchmarks, on CPython and on the Pico.
+
+Every case is warmed up, then timed call by call. The result holds the
+percentiles in microseconds and is collected into one JSON document so runs
+can be compared with bench/compare.py.
+"""
+
+import gc
+import json
+import sys
+
+try:
+    # CPython times with its real clock, not the stand-ins' virtual one, so the
+    # benchmarks measure the host's actual speed
+    from time import perf_counter_ns
+
+    def ticks_us():
+        return perf_counter_ns() // 1000
+
+    def ticks_diff(end, start):
+        return end - start
+
+except ImportError:
+    from time import ticks_diff, ticks_us
+
+
+def setup_path():
+    """Make src/ importable, on CPython together with the hardware stand-ins."""
+    if "src" not in sys.path:
+        sys.path.append("src")
+    try:
+        import framebuf  # noqa: F401
+    except ImportError:
+        sys.path.append("host")
+        import hostenv
+
+        hostenv.install()
+
+
+def percentile(samples: list, fraction: float):
+    index = int(fraction * len(samples))
+    return samples[min(index, len(samples) - 1)]
+
+
+class Runner:
+    def __init__(self, rounds: int = 200, warmup: int = 20):
+        self.rounds = rounds
+        self.warmup = warmup
+        self.results = []
+
+    def run(
+        self, name: str, func, rounds: int | None = None, warmup: int | None = None
+    ):
+        rounds = self.rounds if rounds is None else rounds
+        warmup = self.warmup if warmup is None else warmup
+        for _ in range(warmup):
+            func()
+        gc.collect()
+        samples = []
+        for _ in range(rounds):
+            start = ticks_us()
+            func()
+            samples.append(ticks_diff(ticks_us(), start))
+        samples.sort()
+        result = {
+            "name": name,
+            "rounds": rounds,
+            "min_us": samples[0],
+            "p50_us": percentile(samples, 0.5),
+            "p90_us": percentile(samples, 0.9),
+            "p99_us": percentile(samples, 0.99),
+            "max_us": samples[-1],
+            "mean_us": sum(samples) // rounds,
+        }
+        self.results.append(result)
+        return result
+
+    def report(self) -> str:
+        return json.dumps(
+            {
+                "implementation": sys.implementation.name,
+                "platform": sys.platform,
+                "version": sys.version.split()[0],
+                "results": self.results,
+            }
+        )
+
+    def print_summary(self):
+        for result in self.results:
+            print(
+                "{name:32} p50 {p50_us:>8} us  p90 {p90_us:>8} us  "
+                "p99 {p99_us:>8} us".format(**result)
+            )
@@ -0,0 +1,158 @@
+"""Time the paths the main loop spends its time in. Run from the repository root:
+
+    python bench/hot_paths.py [--out results.json] [--rounds N]
+    mpremote mount . run bench/hot_paths.py
+
+The JSON report is the last line printed, and is also written to --out.
+"""
+
+import os
+import sys
+
+sys.path.append("bench")
+
+from harness import Runner, setup_path
+
+setup_path()
+
+from framebuf import RGB565
+from machine import SPI, Pin
+
+from config import Config
+from display.banded import BandedFrameBuffer
+from display.dirty import TrackedFrameBuffer
+from display.ili9225 import COLOR_GREEN, ILI9225
+from display.pages import ConfigPage, OverviewPage
+from environment_control import EnvironmentControl
+
+WIDTH = 176
+HEIGHT = 220
+BENCH_CONFIG = "bench_config.json"
+
+
+class RelayStub:
+    """Keeps the benchmark off the real relays."""
+
+    def __init__(self):
+        self._value = 0
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+        self._value = value
+
+
+def option(name: str, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def main():
+    runner = Runner(rounds=int(option("--rounds", 200)))
+    buffer = bytearray(WIDTH * HEIGHT * 2)
+    framebuffer = TrackedFrameBuffer(buffer, WIDTH, HEIGHT, RGB565)
+    config = Config("")
+
+    overview = OverviewPage(framebuffer, WIDTH, HEIGHT)
+    step = [0]
+
+    def overview_changed():
+        step[0] += 1
+        overview.set_data(
+            200 + step[0] % 10, 705, 6.0, 75.0, True, 2, 60, step[0] % 120
+        )
+        overview.render()
+
+    def overview_steady():
+        overview.set_data(205, 705, 6.0, 75.0, True, 2, 60, 10)
+        overview.render()
+
+    runner.run("OverviewPage.render changed", overview_changed)
+    runner.run("OverviewPage.render steady", overview_steady)
+
+    config_page = ConfigPage(framebuffer, WIDTH, HEIGHT, config)
+
+    def config_cursor():
+        config_page.handle_button_down()
+        config_page.render()
+
+    runner.run("ConfigPage.render cursor", config_cursor)
+    runner.run("ConfigPage.render steady", config_page.render)
+
+    runner.run(
+        "Page.scaled_text",
+        lambda: overview.scaled_text("23.4", 5, 16, COLOR_GREEN),
+    )
+
+    spi = SPI(0, baudrate=40000000, sck=Pin(2), mosi=Pin(3))
+    display = ILI9225(spi, 5, 8, 9, framebuffer, buffer)
+
+    def update_full():
+        framebuffer.dirty.add_all()
+        display.update()
+
+    def update_value():
+        overview_changed()
+        display.update()
+
+    runner.run("ILI9225.update full", update_full, rounds=20, warmup=2)
+    runner.run("ILI9225.update overview", update_value)
+
+    banded = BandedFrameBuffer(WIDTH, HEIGHT)
+    banded_overview = OverviewPage(banded, WIDTH, HEIGHT)
+    banded_display = ILI9225(spi, 5, 8, 9, banded, banded.buffer)
+
+    def update_banded():
+        step[0] += 1
+        banded_overview.set_data(
+            200 + step[0] % 10, 705, 6.0, 75.0, True, 2, 60, step[0] % 120
+        )
+        banded_overview.render()
+        banded_display.update()
+
+    runner.run("ILI9225.update overview banded", update_banded)
+
+    control = EnvironmentControl(
+        RelayStub(), RelayStub(), RelayStub(), RelayStub(), config
+    )
+    readings = [(5.0, 70.0), (6.5, 74.0), (7.5, 76.0), (6.0, 72.5)]
+
+    def control_step():
+        step[0] += 1
+        temperature, humidity = readings[step[0] % 4]
+        control.control(temperature, humidity)
+
+    runner.run("EnvironmentControl.control", control_step)
+
+    def set_values():
+        step[0] += 1
+        config.set_target_temperature(6 + step[0] % 2)
+        config.set_target_humidity(75 + step[0] % 2)
+
+    runner.run("Config.set_* memory", set_values)
+
+    stored = Config(BENCH_CONFIG)
+
+    def set_stored():
+        step[0] += 1
+        stored.set_target_temperature(6 + step[0] % 2)
+
+    def write_stored():
+        set_stored()
+        stored.flush()
+
+    runner.run("Config.set_* file", set_stored)
+    runner.run("Config.flush file", write_stored, rounds=20, warmup=2)
+    os.remove(BENCH_CONFIG)
+
+    runner.print_summary()
+    report = runner.report()
+    out = option("--out", None)
+    if out:
+        with open(out, "w") as file:
+            file.write(report)
+    print(report)
+
+
+main()
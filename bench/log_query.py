@@ -0,0 +1,66 @@
+"""Time a one day query against record logs of growing size.
+
+Run from the repository root: python bench/log_query.py
+On the Pico: mpremote mount . run bench/log_query.py
+"""
+
+import os
+import sys
+
+sys.path.append("bench")
+
+from harness import setup_path, ticks_diff, ticks_us
+
+setup_path()
+
+from datalog import RecordLog
+
+DIRECTORY = "bench_log"
+DAY = 24 * 60  # records at one per minute
+START = 1700000000
+
+
+def remove_log():
+    try:
+        names = os.listdir(DIRECTORY)
+    except OSError:
+        return
+    for name in names:
+        os.remove(f"{DIRECTORY}/{name}")
+    os.rmdir(DIRECTORY)
+
+
+def measure(func) -> int:
+    start = ticks_us()
+    count = func()
+    elapsed = ticks_diff(ticks_us(), start)
+    assert count == DAY, count
+    return elapsed
+
+
+def main():
+    remove_log()
+    log = RecordLog(DIRECTORY, max_segments=64)
+    written = 0
+    for days in (7, 14, 28):
+        for i in range(written, days * DAY):
+            log.append(START + i * 60, 60 + i % 5, 750 - i % 7, 1, 0)
+        written = days * DAY
+        log.flush()
+        first = START + (written - 2 * DAY) * 60
+        last = first + DAY * 60 - 1
+
+        def query(first=first, last=last):
+            return sum(1 for _ in log.query(first, last))
+
+        def scan(first=first, last=last):
+            return sum(1 for r in log.records() if first <= r[0] <= last)
+
+        print(
+            f"{days:2} days: query {measure(query) // 1000} ms, "
+            f"full scan {measure(scan) // 1000} ms"
+        )
+    remove_log()
+
+
+main()
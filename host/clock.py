@@ -0,0 +1,100 @@
+"""Virtual millisecond clock behind the host stand-ins.
+
+time.ticks_* and machine.Timer read and are driven by the clock, so tests can
+advance hours of firmware time instantly. run_realtime() keeps it in step
+with the wall clock instead, for running main.py interactively.
+"""
+
+import threading
+import time
+
+
+class VirtualClock:
+    def __init__(self):
+        self._now_us = 0
+        self._timers = []
+        self._lock = threading.RLock()
+
+    def ticks_us(self) -> int:
+        return self._now_us
+
+    def ticks_ms(self) -> int:
+        return self._now_us // 1000
+
+    def add_timer(self, timer):
+        with self._lock:
+            if timer not in self._timers:
+                self._timers.append(timer)
+
+    def remove_timer(self, timer):
+        with self._lock:
+            if timer in self._timers:
+                self._timers.remove(timer)
+
+    def advance(self, ms: float):
+        """Move time forward, firing every timer that comes due on the way."""
+        target = self._now_us + int(ms * 1000)
+        while True:
+            with self._lock:
+                due = [t for t in self._timers if t.deadline_us <= target]
+                if not due:
+                    self._now_us = target
+                    return
+                timer = min(due, key=lambda t: t.deadline_us)
+                self._now_us = max(self._now_us, timer.deadline_us)
+            timer.fire()
+
+    def sleep(self, seconds: float):
+        self.advance(seconds * 1000)
+
+    def run_realtime(self, step_ms: int = 10) -> threading.Thread:
+        """Advance the clock with the wall clock from a daemon thread."""
+
+        def drive():
+            last = time.monotonic()
+            while True:
+                time.sleep(step_ms / 1000)
+                now = time.monotonic()
+                self.advance((now - last) * 1000)
+                last = now
+
+        thread = threading.Thread(target=drive, name="virtual-clock", daemon=True)
+        thread.start()
+        return thread
+
+    def reset(self):
+        with self._lock:
+            self._now_us = 0
+            self._timers = []
+
+
+clock = VirtualClock()
+
+
+# MicroPython ticks wrap around, the host values never get big enough to matter
+def ticks_ms() -> int:
+    return clock.ticks_ms()
+
+
+def ticks_us() -> int:
+    return clock.ticks_us()
+
+
+def ticks_cpu() -> int:
+    return clock.ticks_us()
+
+
+def ticks_diff(end: int, start: int) -> int:
+    return end - start
+
+
+def ticks_add(ticks: int, delta: int) -> int:
+    return ticks + delta
+
+
+def sleep_ms(ms: int):
+    clock.advance(ms)
+
+
+def sleep_us(us: int):
+    clock.advance(us / 1000)
@@ -0,0 +1,49 @@
+"""Host stand-in for the dht module, fed from a scripted source.
+
+A source is any iterable of (temperature, humidity) pairs. An exception
+instance in it is raised from measure() instead, like a failed read.
+"""
+
+_source = None
+
+
+def feed(readings):
+    """Script the readings every DHT sensor without a source of its own returns."""
+    global _source
+    _source = iter(readings)
+
+
+class DHTBase:
+    def __init__(self, pin, source=None):
+        self.pin = pin
+        self.source = iter(source) if source is not None else None
+        self.measurements = 0
+        self._temperature = 0.0
+        self._humidity = 0.0
+
+    def measure(self):
+        self.measurements += 1
+        source = self.source if self.source is not None else _source
+        if source is None:
+            return
+        try:
+            reading = next(source)
+        except StopIteration:
+            return
+        if isinstance(reading, BaseException):
+            raise reading
+        self._temperature, self._humidity = reading
+
+    def temperature(self):
+        return self._temperature
+
+    def humidity(self):
+        return self._humidity
+
+
+class DHT11(DHTBase):
+    pass
+
+
+class DHT22(DHTBase):
+    pass
@@ -0,0 +1,206 @@
+"""Pure Python stand-in for MicroPython's framebuf module.
+
+Only RGB565 is implemented, stored little endian like on the RP2040. text()
+uses the petme128 8x8 font, the same one MicroPython has built in, taken from
+the firmware's own copy.
+"""
+
+MONO_VLSB = 0
+RGB565 = 1
+GS4_HMSB = 2
+MONO_HLSB = 3
+MONO_HMSB = 4
+GS2_HMSB = 5
+GS8 = 6
+
+_font = None
+
+
+def _text_font():
+    global _font
+    if _font is None:
+        from display.fonts.petme128_8x8 import font
+
+        _font = font
+    return _font
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        if format != RGB565:
+            raise ValueError("only RGB565 is supported on the host")
+        self._buffer = memoryview(buffer).cast("B")
+        self._width = width
+        self._height = height
+        self._stride = width if stride is None else stride
+        if len(self._buffer) < self._stride * height * 2:
+            raise ValueError("buffer too small")
+
+    def _index(self, x, y):
+        return (y * self._stride + x) * 2
+
+    def _set(self, x, y, c):
+        if 0 <= x < self._width and 0 <= y < self._height:
+            i = self._index(x, y)
+            self._buffer[i] = c & 0xFF
+            self._buffer[i + 1] = (c >> 8) & 0xFF
+
+    def _get(self, x, y):
+        i = self._index(x, y)
+        return self._buffer[i] | (self._buffer[i + 1] << 8)
+
+    def fill(self, c):
+        self.fill_rect(0, 0, self._width, self._height, c)
+
+    def pixel(self, x, y, c=None):
+        if c is None:
+            if 0 <= x < self._width and 0 <= y < self._height:
+                return self._get(x, y)
+            return None
+        self._set(x, y, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self._width)
+        y1 = min(y + h, self._height)
+        if x1 <= x0 or y1 <= y0:
+            return
+        row = bytes((c & 0xFF, (c >> 8) & 0xFF)) * (x1 - x0)
+        for yy in range(y0, y1):
+            i = self._index(x0, yy)
+            self._buffer[i : i + len(row)] = row
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x0, y0, x1, y1, c):
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        while True:
+            self._set(x0, y0, c)
+            if x0 == x1 and y0 == y1:
+                return
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+
+    def _ellipse_points(self, cx, cy, x, y, c, f, m):
+        if f:
+            if m & 0x1:
+                self.fill_rect(cx, cy - y, x + 1, 1, c)
+            if m & 0x2:
+                self.fill_rect(cx - x, cy - y, x + 1, 1, c)
+            if m & 0x4:
+                self.fill_rect(cx - x, cy + y, x + 1, 1, c)
+            if m & 0x8:
+                self.fill_rect(cx, cy + y, x + 1, 1, c)
+        else:
+            if m & 0x1:
+                self._set(cx + x, cy - y, c)
+            if m & 0x2:
+                self._set(cx - x, cy - y, c)
+            if m & 0x4:
+                self._set(cx - x, cy + y, c)
+            if m & 0x8:
+                self._set(cx + x, cy + y, c)
+
+    def ellipse(self, cx, cy, xr, yr, c, f=False, m=0xF):
+        # same midpoint algorithm as extmod/modframebuf.c
+        if xr == 0 and yr == 0:
+            if m & 0xF:
+                self._set(cx, cy, c)
+            return
+        two_asquare = 2 * xr * xr
+        two_bsquare = 2 * yr * yr
+        x = xr
+        y = 0
+        xchange = yr * yr * (1 - 2 * xr)
+        ychange = xr * xr
+        ellipse_error = 0
+        stoppingx = two_bsquare * xr
+        stoppingy = 0
+        while stoppingx >= stoppingy:
+            self._ellipse_points(cx, cy, x, y, c, f, m)
+            y += 1
+            stoppingy += two_asquare
+            ellipse_error += ychange
+            ychange += two_asquare
+            if (2 * ellipse_error + xchange) > 0:
+                x -= 1
+                stoppingx -= two_bsquare
+                ellipse_error += xchange
+                xchange += two_bsquare
+        x = 0
+        y = yr
+        xchange = yr * yr
+        ychange = xr * xr * (1 - 2 * yr)
+        ellipse_error = 0
+        stoppingx = 0
+        stoppingy = two_asquare * yr
+        while stoppingx <= stoppingy:
+            self._ellipse_points(cx, cy, x, y, c, f, m)
+            x += 1
+            stoppingx += two_bsquare
+            ellipse_error += xchange
+            xchange += two_bsquare
+            if (2 * ellipse_error + ychange) > 0:
+                y -= 1
+                stoppingy -= two_asquare
+                ellipse_error += ychange
+                ychange += two_asquare
+
+    def text(self, s, x, y, c=1):
+        font = _text_font()
+        for char in s:
+            for column in range(8):
+                bits = font.column(char, column)
+                for row in range(8):
+                    if bits & (1 << row):
+                        self._set(x + column, y + row, c)
+            x += 8
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if palette is not None:
+            raise ValueError("blits with a palette are not supported on the host")
+        for sy in range(fbuf._height):
+            ty = y + sy
+            if ty < 0 or ty >= self._height:
+                continue
+            for sx in range(fbuf._width):
+                tx = x + sx
+                if tx < 0 or tx >= self._width:
+                    continue
+                c = fbuf._get(sx, sy)
+                if c != key:
+                    self._set(tx, ty, c)
+
+    def scroll(self, xstep, ystep):
+        copy = FrameBuffer(
+            bytearray(self._buffer), self._width, self._height, RGB565, self._stride
+        )
+        for y in range(self._height):
+            for x in range(self._width):
+                sx = x - xstep
+                sy = y - ystep
+                if 0 <= sx < self._width and 0 <= sy < self._height:
+                    self._set(x, y, copy._get(sx, sy))
@@ -0,0 +1,46 @@
+"""Set up CPython to import and run the firmware unmodified.
+
+install() puts the stand-ins in this directory and src/ on sys.path, adds
+MicroPython's ticks functions to the time module, backed by the virtual clock,
+and asyncio.sleep_ms.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(HOST_DIR), "src")
+
+_installed = False
+
+
+def install(virtual_sleep: bool = True):
+    """Make the firmware importable. virtual_sleep turns time.sleep into clock.advance."""
+    global _installed
+    for path in (SRC_DIR, HOST_DIR):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    import clock
+
+    if not _installed:
+        for name in (
+            "ticks_ms",
+            "ticks_us",
+            "ticks_cpu",
+            "ticks_diff",
+            "ticks_add",
+        ):
+            setattr(time, name, getattr(clock, name))
+        if virtual_sleep:
+            time.sleep = clock.clock.sleep
+            time.sleep_ms = clock.sleep_ms
+            time.sleep_us = clock.sleep_us
+        else:
+            time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+            time.sleep_us = lambda us: time.sleep(us / 1_000_000)
+        if not hasattr(asyncio, "sleep_ms"):
+            asyncio.sleep_ms = lambda ms: asyncio.sleep(ms / 1000)
+        _installed = True
+    return clock.clock
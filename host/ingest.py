@@ -0,0 +1,263 @@
+"""Collect the Pico's telemetry into SQLite, and replay it into the firmware.
+
+    python host/ingest.py record /dev/ttyACM0 telemetry.db [--enable]
+    python host/ingest.py replay telemetry.db [--seconds N]
+
+record decodes the status frames (see src/telemetry.py) from the serial port,
+skipping the text replies between them, and inserts them in batches into a
+WAL mode database. It reopens the port after disconnects. With --enable it
+sends "telemetry on" after every connect.
+
+replay runs src/main.py like run.py, with the DHT22 returning the recorded
+readings, one per measurement.
+"""
+
+import argparse
+import os
+import select
+import sqlite3
+import struct
+import sys
+import time
+from binascii import crc32
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import hostenv
+
+hostenv.install(virtual_sleep=False)
+
+from telemetry import FRAME_SIZE, FRAME_STATUS, STATUS, STATUS_SIZE, SYNC
+
+COLUMNS = (
+    "received",
+    "sequence",
+    "ticks_ms",
+    "temperature",
+    "humidity",
+    "actuators",
+    "errors",
+    "counter",
+    "control_us",
+    "render_us",
+    "lag_ms",
+)
+ERROR_SENSOR = 1  # see src/datalog.py
+
+
+class FrameDecoder:
+    """Finds and checks frames in a byte stream that arrives in arbitrary pieces.
+
+    Bytes outside frames, frames with a wrong length or checksum are skipped
+    by searching for the next sync, so the decoder recovers from partial
+    frames and from text mixed into the stream.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.frames = 0
+        self.errors = 0
+        self.skipped = 0
+
+    def feed(self, data: bytes) -> list[tuple]:
+        """Add data, return the payloads of the complete frames as tuples."""
+        self._buffer += data
+        frames = []
+        while True:
+            start = self._buffer.find(SYNC)
+            if start < 0:
+                # keep a last byte that could be the start of a sync
+                keep = 1 if self._buffer[-1:] == SYNC[:1] else 0
+                self.skipped += len(self._buffer) - keep
+                del self._buffer[: len(self._buffer) - keep]
+                return frames
+            self.skipped += start
+            del self._buffer[:start]
+            if len(self._buffer) < 3:
+                return frames
+            if self._buffer[2] != STATUS_SIZE:
+                self._reject()
+                continue
+            if len(self._buffer) < FRAME_SIZE:
+                return frames
+            payload_end = 3 + STATUS_SIZE
+            (crc,) = struct.unpack_from("<I", self._buffer, payload_end)
+            if crc != crc32(self._buffer[2:payload_end]):
+                self._reject()
+                continue
+            status = struct.unpack_from(STATUS, self._buffer, 3)
+            del self._buffer[:FRAME_SIZE]
+            if status[0] == FRAME_STATUS:
+                self.frames += 1
+                frames.append(status)
+
+    def _reject(self):
+        self.errors += 1
+        self.skipped += 1
+        del self._buffer[:1]
+
+
+class Store:
+    """Status rows in SQLite, inserted in one transaction per batch.
+
+    A batch is written once it holds batch_size rows or its oldest row waited
+    max_delay_s, whichever comes first.
+    """
+
+    def __init__(self, path: str, batch_size: int = 100, max_delay_s: float = 10):
+        # replay reads from the firmware's sensor thread
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS status ({', '.join(COLUMNS)})"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS status_received ON status (received)"
+        )
+        self._batch_size = batch_size
+        self._max_delay_s = max_delay_s
+        self._pending = []
+        self._oldest = 0.0
+        self._insert = f"INSERT INTO status VALUES ({', '.join('?' * len(COLUMNS))})"
+
+    def add(self, status: tuple, received: float | None = None):
+        """Queue a decoded status frame."""
+        received = time.time() if received is None else received
+        if not self._pending:
+            self._oldest = time.monotonic()
+        _, sequence, ticks, temperature, humidity, *rest = status
+        self._pending.append(
+            (received, sequence, ticks, temperature / 10, humidity / 10, *rest)
+        )
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+    def tick(self):
+        """Write the batch if it waited long enough."""
+        if self._pending and time.monotonic() - self._oldest >= self._max_delay_s:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        with self._connection:
+            self._connection.executemany(self._insert, self._pending)
+        self._pending.clear()
+
+    def count(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM status").fetchone()[0]
+
+    def readings(self):
+        """Yield (temperature, humidity) per stored row in order of arrival, an
+        OSError for rows of failed measurements."""
+        for temperature, humidity, errors in self._connection.execute(
+            "SELECT temperature, humidity, errors FROM status ORDER BY received"
+        ):
+            if errors & ERROR_SENSOR:
+                yield OSError(110, "ETIMEDOUT")
+            else:
+                yield (temperature, humidity)
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+
+class Ingester:
+    """Reads a serial port, or a pty standing in for it, into a Store."""
+
+    def __init__(self, port: str, store: Store, enable: bool = False):
+        self._port = port
+        self._store = store
+        self._enable = enable
+        self._fd = None
+        self.decoder = FrameDecoder()
+
+    def connected(self) -> bool:
+        return self._fd is not None
+
+    def connect(self):
+        fd = os.open(self._port, os.O_RDWR | os.O_NOCTTY)
+        if os.isatty(fd):
+            import tty
+
+            tty.setraw(fd)
+        self._fd = fd
+        self.decoder = FrameDecoder()  # drop what was left of the last connection
+        if self._enable:
+            os.write(fd, b"telemetry on\n")
+
+    def disconnect(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._store.flush()
+
+    def poll(self, timeout: float = 1.0) -> int:
+        """Read what arrives within timeout, return the number of frames stored.
+        Disconnects when the port goes away."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        count = 0
+        if readable:
+            try:
+                data = os.read(self._fd, 4096)
+            except OSError:
+                data = b""
+            if not data:
+                print(f"{self._port} disconnected")
+                self.disconnect()
+                return 0
+            for status in self.decoder.feed(data):
+                self._store.add(status)
+                count += 1
+        self._store.tick()
+        return count
+
+    def run(self, reconnect_s: float = 2.0):
+        while True:
+            if not self.connected():
+                try:
+                    self.connect()
+                    print(f"reading {self._port}")
+                except OSError as e:
+                    print(f"cannot open {self._port}: {e}")
+                    time.sleep(reconnect_s)
+                    continue
+            self.poll()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="store telemetry from a serial port")
+    record.add_argument("port")
+    record.add_argument("database")
+    record.add_argument("--enable", action="store_true", help="send telemetry on")
+    replay = commands.add_parser("replay", help="run the firmware on stored readings")
+    replay.add_argument("database")
+    replay.add_argument("--seconds", type=float, help="stop after this many seconds")
+    args = parser.parse_args()
+
+    store = Store(args.database)
+    if args.command == "record":
+        ingester = Ingester(args.port, store, args.enable)
+        try:
+            ingester.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            ingester.disconnect()
+            store.close()
+            print(f"{ingester.decoder.frames} frames, {ingester.decoder.errors} errors")
+    else:
+        import dht
+        import run
+
+        dht.feed(store.readings())
+        run.run_firmware(args.seconds)
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Host stand-in for the parts of MicroPython's machine module the firmware uses."""
+
+from typing import ClassVar
+
+from clock import clock
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    # the most recently created Pin for every id, for tests to inspect, emptied
+    # before every test
+    pins: ClassVar[dict] = {}
+
+    def __init__(self, id, mode=-1, pull=-1, *, value=None):
+        self.id = id
+        self.mode = mode
+        self.pull = pull
+        self.history = []
+        self._value = 1 if pull == Pin.PULL_UP else 0
+        self._handler = None
+        self._trigger = Pin.IRQ_FALLING | Pin.IRQ_RISING
+        if value is not None:
+            self.value(value)
+        Pin.pins[id] = self
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+        self._value = 1 if value else 0
+        self.history.append(self._value)
+
+    def __call__(self, value=None):
+        return self.value(value)
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def toggle(self):
+        self.value(not self._value)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, **kwargs):
+        self._handler = handler
+        self._trigger = trigger
+
+    def drive(self, value):
+        """Set the level of an input from outside, firing the irq on a matching edge."""
+        value = 1 if value else 0
+        previous = self._value
+        self._value = value
+        if self._handler is None or previous == value:
+            return
+        edge = Pin.IRQ_RISING if value else Pin.IRQ_FALLING
+        if self._trigger & edge:
+            self._handler(self)
+
+    def __repr__(self):
+        return f"Pin({self.id}, value={self._value})"
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, **kwargs):
+        self.id = id
+        self.deadline_us = 0
+        self._period_us = 0
+        self._mode = Timer.PERIODIC
+        self._callback = None
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, *, mode=PERIODIC, freq=-1, period=-1, callback=None, tick_hz=1000):
+        if freq > 0:
+            self._period_us = int(1_000_000 / freq)
+        else:
+            self._period_us = int(period * 1_000_000 / tick_hz)
+        self._mode = mode
+        self._callback = callback
+        self.deadline_us = clock.ticks_us() + self._period_us
+        clock.add_timer(self)
+
+    def deinit(self):
+        clock.remove_timer(self)
+
+    def fire(self):
+        if self._mode == Timer.PERIODIC:
+            self.deadline_us += max(self._period_us, 1)
+        else:
+            clock.remove_timer(self)
+        if self._callback:
+            self._callback(self)
+
+
+class SPI:
+    """Records what is written, keeping at most max_log bytes of the tail."""
+
+    def __init__(self, id, baudrate=1_000_000, *, max_log=1 << 20, **kwargs):
+        self.id = id
+        self.baudrate = baudrate
+        self.log = bytearray()
+        self.max_log = max_log
+        self.bytes_written = 0
+        self.writes = 0
+
+    def init(self, baudrate=None, **kwargs):
+        if baudrate:
+            self.baudrate = baudrate
+
+    def write(self, buf):
+        self.bytes_written += len(buf)
+        self.writes += 1
+        if self.max_log:
+            self.log += buf
+            if len(self.log) > self.max_log:
+                del self.log[: len(self.log) - self.max_log]
+
+    def read(self, nbytes, write=0x00):
+        return bytes([write]) * nbytes
+
+    def readinto(self, buf, write=0x00):
+        for i in range(len(buf)):
+            buf[i] = write
+
+    def write_readinto(self, write_buf, read_buf):
+        self.write(write_buf)
+        self.readinto(read_buf)
+
+    def deinit(self):
+        pass
+
+
+def freq(hz=None):
+    return 125_000_000
+
+
+def reset():
+    raise SystemExit("machine.reset()")
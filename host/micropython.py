@@ -0,0 +1,25 @@
+"""Host stand-in for the micropython module."""
+
+
+def const(value):
+    return value
+
+
+def schedule(func, arg):
+    # nothing can preempt host code, running right away matches the semantics
+    func(arg)
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+def mem_info(verbose=False):
+    pass
+
+
+def native(func):
+    return func
+
+
+viper = native
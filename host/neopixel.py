@@ -0,0 +1,25 @@
+"""Host stand-in for the neopixel module."""
+
+
+class NeoPixel:
+    def __init__(self, pin, n, bpp=3, timing=1):
+        self.pin = pin
+        self.n = n
+        self.bpp = bpp
+        self.pixels = [(0,) * bpp] * n
+        self.writes = 0
+
+    def __setitem__(self, index, value):
+        self.pixels[index] = tuple(value)
+
+    def __getitem__(self, index):
+        return self.pixels[index]
+
+    def __len__(self):
+        return self.n
+
+    def fill(self, value):
+        self.pixels = [tuple(value)] * self.n
+
+    def write(self):
+        self.writes += 1
@@ -0,0 +1,86 @@
+"""Run src/main.py on the host with the stand-ins and a real time clock.
+
+python host/run.py [--seconds N] [--profile FILE] [--directory DIR]
+
+The firmware keeps config.json, its log and statistics in its working
+directory, host/state unless --directory says otherwise. A new directory starts
+from the repository's config.json, which is never written.
+"""
+
+import argparse
+import io
+import os
+import runpy
+import shutil
+import sys
+import threading
+import _thread
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import hostenv
+
+STATE_DIR = os.path.join(hostenv.HOST_DIR, "state")
+
+
+def run_firmware(
+    seconds: float | None = None,
+    profile: str | None = None,
+    directory: str = STATE_DIR,
+):
+    """Run src/main.py in directory until it ends, is interrupted or seconds
+    have passed."""
+    if profile:
+        profile = os.path.abspath(profile)
+    os.makedirs(directory, exist_ok=True)
+    config = os.path.join(directory, "config.json")
+    if not os.path.exists(config):
+        repository = os.path.dirname(hostenv.HOST_DIR)
+        shutil.copyfile(os.path.join(repository, "config.json"), config)
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        _run(seconds, profile)
+    finally:
+        os.chdir(cwd)
+
+
+def _run(seconds: float | None, profile: str | None):
+    # unbuffered like MicroPython's, so poll() keeps seeing every pending byte
+    sys.stdin = io.TextIOWrapper(io.FileIO(0, closefd=False))
+    clock = hostenv.install(virtual_sleep=False)
+    clock.run_realtime()
+    if seconds:
+        threading.Timer(seconds, _thread.interrupt_main).start()
+
+    main_path = os.path.join(hostenv.SRC_DIR, "main.py")
+    if profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(runpy.run_path, main_path, run_name="__main__")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            profiler.dump_stats(profile)
+    else:
+        try:
+            runpy.run_path(main_path, run_name="__main__")
+        except KeyboardInterrupt:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, help="stop after this many seconds")
+    parser.add_argument("--profile", help="write cProfile stats to this file")
+    parser.add_argument(
+        "--directory", default=STATE_DIR, help="working directory of the firmware"
+    )
+    args = parser.parse_args()
+    run_firmware(args.seconds, args.profile, args.directory)
+
+
+if __name__ == "__main__":
+    main()
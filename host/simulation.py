@@ -0,0 +1,291 @@
+"""Closed loop simulation of the curing chamber on a virtual clock.
+
+    python host/simulation.py [--days 7] [--ambient 20] [--seed 1]
+
+The firmware's own main module runs the loop: main.sensor measures a first
+order model of the chamber every SENSOR_INTERVAL_MS, main.control() switches
+the relays and main.scheduler.tick() cycles the fan, all on the virtual clock
+instead of waiting. A week takes a few seconds. The report shows how well
+temperature and humidity stay within the configured tolerances and how often
+every relay switched.
+"""
+
+import argparse
+import atexit
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import hostenv
+
+hostenv.install()
+
+from clock import clock
+
+
+class Chamber:
+    """First order model of a fridge converted into a curing chamber.
+
+    Temperature drifts towards the ambient temperature through the walls and
+    towards the evaporator temperature while the compressor runs. Humidity
+    drifts towards what the meat releases, rises while the atomizer runs,
+    falls while the evaporator condenses water and while the fan exchanges
+    air with the room. Time constants are in seconds.
+    """
+
+    def __init__(
+        self,
+        ambient_temperature: float = 20.0,
+        ambient_humidity: float = 50.0,
+        temperature: float = 12.0,
+        humidity: float = 70.0,
+        wall_tau: float = 4 * 3600,
+        evaporator_temperature: float = -10.0,
+        evaporator_tau: float = 3000,
+        heater_rate: float = 0.002,
+        meat_humidity: float = 85.0,
+        meat_tau: float = 3 * 3600,
+        atomizer_rate: float = 0.02,
+        condense_rate: float = 0.004,
+        fan_tau: float = 600,
+    ):
+        self.ambient_temperature = ambient_temperature
+        self.ambient_humidity = ambient_humidity
+        self.temperature = temperature
+        self.humidity = humidity
+        self._wall_tau = wall_tau
+        self._evaporator_temperature = evaporator_temperature
+        self._evaporator_tau = evaporator_tau
+        self._heater_rate = heater_rate
+        self._meat_humidity = meat_humidity
+        self._meat_tau = meat_tau
+        self._atomizer_rate = atomizer_rate
+        self._condense_rate = condense_rate
+        self._fan_tau = fan_tau
+
+    def step(self, dt: float, fridge: bool, heater: bool, atomizer: bool, fan: bool):
+        temperature = self.temperature
+        humidity = self.humidity
+        dtemperature = (self.ambient_temperature - temperature) / self._wall_tau
+        dhumidity = (self._meat_humidity - humidity) / self._meat_tau
+        if fridge:
+            dtemperature += (
+                self._evaporator_temperature - temperature
+            ) / self._evaporator_tau
+            dhumidity -= self._condense_rate
+        if heater:
+            dtemperature += self._heater_rate
+        if atomizer:
+            dhumidity += self._atomizer_rate
+        if fan:
+            dtemperature += (self.ambient_temperature - temperature) / self._fan_tau
+            dhumidity += (self.ambient_humidity - humidity) / self._fan_tau
+        self.temperature = temperature + dtemperature * dt
+        self.humidity = min(max(humidity + dhumidity * dt, 0.0), 100.0)
+
+
+class Band:
+    """Time in band and the worst excursions of one controlled value."""
+
+    def __init__(self, target: float, tolerance: float):
+        self.low = target - tolerance
+        self.high = target + tolerance
+        self.samples = 0
+        self.inside = 0
+        self.overshoot = 0.0
+        self.undershoot = 0.0
+
+    def add(self, value: float):
+        self.samples += 1
+        if value > self.high:
+            self.overshoot = max(self.overshoot, value - self.high)
+        elif value < self.low:
+            self.undershoot = max(self.undershoot, self.low - value)
+        else:
+            self.inside += 1
+
+    def time_in_band(self) -> float:
+        return self.inside / self.samples if self.samples else 0.0
+
+
+class Relay:
+    def __init__(self, name: str):
+        self.name = name
+        self.state = False
+        self.switches = 0
+        self.on_seconds = 0
+
+    def add(self, state: bool, dt: int):
+        if state != self.state:
+            self.switches += 1
+            self.state = state
+        if state:
+            self.on_seconds += dt
+
+
+# the directory main was first imported in, see load_firmware()
+_firmware_directory = None
+
+
+def load_firmware(directory: str | None = None):
+    """Import src/main.py with directory as working directory for its files.
+
+    The module is imported once per process and keeps its state and files in
+    the directory of that first import. Later calls return the same module,
+    asking for another directory is a ValueError. Without a directory the
+    firmware runs in a new temporary one.
+    """
+    global _firmware_directory
+    if _firmware_directory is not None:
+        if directory is not None and not os.path.samefile(
+            directory, _firmware_directory
+        ):
+            raise ValueError(f"firmware already runs in {_firmware_directory}")
+        return sys.modules["main"]
+    directory = directory or tempfile.mkdtemp()
+    cwd = os.getcwd()
+    stdin = sys.stdin
+    os.chdir(directory)
+    # main polls stdin for commands, give it one that never has any. main
+    # keeps polling it after the import, so it stays open until exit.
+    devnull = open(os.devnull)  # noqa: SIM115 - closed by atexit
+    atexit.register(devnull.close)
+    sys.stdin = devnull
+    try:
+        import main
+    finally:
+        os.chdir(cwd)
+        sys.stdin = stdin
+    _firmware_directory = directory
+    return main
+
+
+def firmware_directory() -> str | None:
+    """Working directory of the imported firmware, None before load_firmware()."""
+    return _firmware_directory
+
+
+class Simulation:
+    """Runs the firmware against a Chamber, one control interval per step.
+
+    warmup_s is left out of the statistics, so the pull down from the start
+    conditions does not count as an excursion. The firmware is imported once
+    per process, so every Simulation drives the same main module in the same
+    directory.
+    """
+
+    def __init__(
+        self,
+        chamber: Chamber,
+        noise: float = 0.1,
+        seed: int = 1,
+        warmup_s: int = 6 * 3600,
+        directory: str | None = None,
+    ):
+        self.chamber = chamber
+        # shared by every Simulation of the process, see load_firmware()
+        self.main = load_firmware(directory)
+        self._directory = firmware_directory()
+        self._random = random.Random(seed)
+        self._noise = noise
+        self._warmup_s = warmup_s
+        config = self.main.config
+        self.temperature = Band(
+            config.get_target_temperature(), config.get_temperature_tolerance()
+        )
+        self.humidity = Band(
+            config.get_target_humidity(), config.get_humidity_tolerance()
+        )
+        self.relays = [Relay(name) for name in ("fridge", "heater", "atomizer", "fan")]
+        self.seconds = 0
+        self.main.dht.source = self._readings()
+
+    def _readings(self):
+        # the DHT22 reports in tenths
+        while True:
+            yield (
+                round(self.chamber.temperature + self._random.gauss(0, self._noise), 1),
+                round(self.chamber.humidity + self._random.gauss(0, self._noise), 1),
+            )
+
+    def run(self, seconds: int):
+        # the firmware checkpoints its statistics into the working directory
+        cwd = os.getcwd()
+        os.chdir(self._directory)
+        try:
+            self._run(seconds)
+        finally:
+            os.chdir(cwd)
+
+    def _run(self, seconds: int):
+        main = self.main
+        control = main.environment_control
+        step_ms = main.CONTROL_INTERVAL_MS
+        dt = step_ms // 1000
+        sensor_due = 0
+        for _ in range(seconds // dt):
+            clock.advance(step_ms)
+            self.seconds += dt
+            if self.seconds >= sensor_due:
+                main.sensor.measure()
+                sensor_due += main.SENSOR_INTERVAL_MS / 1000
+            main.control()
+            main.scheduler.tick()
+            states = (
+                control.get_fridge_status(),
+                control.get_heater_status(),
+                control.get_atomizer_state(),
+                control.get_fan_state(),
+            )
+            self.chamber.step(dt, *states)
+            if self.seconds > self._warmup_s:
+                self.temperature.add(self.chamber.temperature)
+                self.humidity.add(self.chamber.humidity)
+                for relay, state in zip(self.relays, states):
+                    relay.add(state, dt)
+
+    def report(self) -> str:
+        hours = max(self.seconds - self._warmup_s, 1) / 3600
+        lines = []
+        for name, band, unit in (
+            ("temperature", self.temperature, "C"),
+            ("humidity", self.humidity, "%"),
+        ):
+            lines.append(
+                f"{name:12} in band {band.time_in_band():6.1%}  "
+                f"overshoot {band.overshoot:5.2f} {unit}  "
+                f"undershoot {band.undershoot:5.2f} {unit}"
+            )
+        for relay in self.relays:
+            lines.append(
+                f"{relay.name:12} {relay.switches:6} switches  "
+                f"{relay.switches / hours:6.1f}/h  "
+                f"duty {relay.on_seconds / 3600 / hours:6.1%}"
+            )
+        for name, guard in self.main.relay_guards.items():
+            lines.append(
+                f"{name:12} guard denied {guard.denied}, delayed {guard.delayed} "
+                f"by {guard.delay_ms // max(guard.delayed, 1) // 1000} s on average"
+            )
+        energy_kwh = self.main.accounting.energy_wh() / 1000
+        lines.append(f"{'energy':12} {energy_kwh:6.2f} kWh, estimated by the firmware")
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=float, default=7)
+    parser.add_argument("--ambient", type=float, default=20.0, help="room temperature")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    simulation = Simulation(Chamber(ambient_temperature=args.ambient), seed=args.seed)
+    simulation.run(int(args.days * 24 * 3600))
+    print(simulation.report())
+
+
+if __name__ == "__main__":
+    main()
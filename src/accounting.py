@@ -0,0 +1,173 @@
+import ujson
+import os
+from array import array
+from time import ticks_diff, ticks_ms
+from datalog import ATOMIZER, FAN, FRIDGE, HEATER
+from storage import checksum, write_atomic
+
+# name and bit in the actuator mask, see datalog.actuator_mask
+ACTUATORS = (
+    ("fridge", FRIDGE),
+    ("atomizer", ATOMIZER),
+    ("heater", HEATER),
+    ("fan", FAN),
+)
+_COUNT = len(ACTUATORS)
+_MINUTE_MS = 60 * 1000
+_HOUR_MS = 60 * _MINUTE_MS
+
+
+class Accounting:
+    """On time, switch count and duty cycle of every actuator.
+
+    update() takes the actuator mask once per control step. The time since
+    the previous call counts as on time for the actuators that were on, every
+    bit that changed counts as a switch. On seconds are kept per minute for
+    the last hour and per hour for the last day, for rolling duty cycles.
+
+    The totals are written to path every checkpoint_minutes and read back at
+    start, so a reboot loses at most that much. The rolling windows start
+    over after a reboot.
+    """
+
+    _mask: int = 0
+    _minute_ms: int = 0
+    _minute: int = 0
+    _minute_count: int = 0
+    _hour: int = 0
+    _hour_count: int = 0
+    _minutes_in_hour: int = 0
+    _checkpoint_count: int = 0
+
+    def __init__(self, path: str, config, checkpoint_minutes: int = 60):
+        self._path = path
+        self._checkpoint_minutes = checkpoint_minutes
+        self._since_checkpoint = 0
+        self._last = ticks_ms()
+        self._on_ms = array("L", [0]) * _COUNT  # in the running minute
+        self._minutes = bytearray(60 * _COUNT)  # on seconds per minute
+        self._hour_on = array("H", [0]) * _COUNT  # in the running hour
+        self._hours = array("H", [0]) * (24 * _COUNT)  # on seconds per hour
+        self._total_s = [0] * _COUNT
+        self._switches = [0] * _COUNT
+        self._watts = [config.get(name + "_watts") for name, _ in ACTUATORS]
+        config.add_listener(self._config_changed)
+        if path and path in os.listdir():
+            self._restore()
+
+    def _config_changed(self, config):
+        self._watts = [config.get(name + "_watts") for name, _ in ACTUATORS]
+
+    def update(self, mask: int):
+        """Account the time since the last call to the previous mask, then take mask."""
+        now = ticks_ms()
+        elapsed = ticks_diff(now, self._last)
+        self._last = now
+        on = self._mask
+        while elapsed > 0:
+            step = min(elapsed, _MINUTE_MS - self._minute_ms)
+            for i in range(_COUNT):
+                if on & ACTUATORS[i][1]:
+                    self._on_ms[i] += step
+            self._minute_ms += step
+            elapsed -= step
+            if self._minute_ms == _MINUTE_MS:
+                self._close_minute()
+        changed = mask ^ on
+        if changed:
+            for i in range(_COUNT):
+                if changed & ACTUATORS[i][1]:
+                    self._switches[i] += 1
+            self._mask = mask
+
+    def _close_minute(self):
+        base = self._minute * _COUNT
+        for i in range(_COUNT):
+            seconds = (self._on_ms[i] + 500) // 1000
+            self._on_ms[i] = 0
+            self._minutes[base + i] = seconds
+            self._hour_on[i] += seconds
+            self._total_s[i] += seconds
+        self._minute_ms = 0
+        self._minute = (self._minute + 1) % 60
+        self._minute_count = min(self._minute_count + 1, 60)
+        self._minutes_in_hour += 1
+        if self._minutes_in_hour == 60:
+            self._close_hour()
+        self._since_checkpoint += 1
+        if 0 < self._checkpoint_minutes <= self._since_checkpoint:
+            self.checkpoint()
+
+    def _close_hour(self):
+        base = self._hour * _COUNT
+        for i in range(_COUNT):
+            self._hours[base + i] = self._hour_on[i]
+            self._hour_on[i] = 0
+        self._minutes_in_hour = 0
+        self._hour = (self._hour + 1) % 24
+        self._hour_count = min(self._hour_count + 1, 24)
+
+    def on_seconds(self, index: int) -> int:
+        """Total on time of the actuator at index in ACTUATORS."""
+        return self._total_s[index] + self._on_ms[index] // 1000
+
+    def switches(self, index: int) -> int:
+        return self._switches[index]
+
+    def hour_duty(self, index: int) -> float:
+        """Share of the last hour the actuator was on, 0.0 to 1.0."""
+        on_ms = self._on_ms[index]
+        for minute in range(self._minute_count):
+            on_ms += self._minutes[minute * _COUNT + index] * 1000
+        return self._duty(on_ms, self._minute_count * _MINUTE_MS + self._minute_ms)
+
+    def day_duty(self, index: int) -> float:
+        """Share of the last day the actuator was on, 0.0 to 1.0."""
+        on_s = self._hour_on[index]
+        for hour in range(self._hour_count):
+            on_s += self._hours[hour * _COUNT + index]
+        span_ms = (
+            self._hour_count * _HOUR_MS
+            + self._minutes_in_hour * _MINUTE_MS
+            + self._minute_ms
+        )
+        return self._duty(on_s * 1000 + self._on_ms[index], span_ms)
+
+    @staticmethod
+    def _duty(on_ms: int, span_ms: int) -> float:
+        return min(on_ms / span_ms, 1.0) if span_ms else 0.0
+
+    def energy_wh(self, index: int = -1) -> float:
+        """Estimated energy from the on time and the configured wattage, of
+        the actuator at index or, by default, of all of them."""
+        if index >= 0:
+            return self.on_seconds(index) * self._watts[index] / 3600
+        return sum(self.energy_wh(i) for i in range(_COUNT))
+
+    def checkpoint_count(self) -> int:
+        """Number of times the totals were written since boot."""
+        return self._checkpoint_count
+
+    def checkpoint(self):
+        """Write the totals now, e.g. before a shutdown."""
+        self._since_checkpoint = 0
+        if not self._path:
+            return
+        values = [[self.on_seconds(i) for i in range(_COUNT)], self._switches]
+        stored = {"totals": values, "checksum": checksum(ujson.dumps(values))}
+        write_atomic(self._path, ujson.dumps(stored))
+        self._checkpoint_count += 1
+
+    def _restore(self):
+        try:
+            with open(self._path, "r") as file:
+                stored = ujson.loads(file.read())
+            values = stored["totals"]
+            if stored["checksum"] != checksum(ujson.dumps(values)):
+                raise ValueError("wrong checksum")
+            on_s, switches = values
+            for i in range(min(_COUNT, len(on_s), len(switches))):
+                self._total_s[i] = on_s[i]
+                self._switches[i] = switches[i]
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"ignored statistics file: {e}")
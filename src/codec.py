@@ -0,0 +1,137 @@
+"""Compact encoding of log records into fixed size blocks.
+
+A block starts with its used length as a little endian u16. Then come the
+records, each a tag byte followed by three zigzag varints: timestamp,
+temperature and humidity. The first record of a block is a keyframe holding
+the values themselves, every other one holds the differences to the record
+before it, so a block can be decoded without the ones before it. The rest of
+the block after the used length is padding.
+
+Tag bits 0-3 hold the actuator mask, bits 4-6 the error flags and bit 7 marks
+the keyframe. Slowly changing curing data takes about 4 bytes per record.
+"""
+
+HEADER_SIZE = 2
+MAX_RECORD_SIZE = 1 + 3 * 5  # tag plus three varints of up to 32 bits
+KEYFRAME = 0x80
+
+
+def zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def put_varint(buffer, offset: int, value: int) -> int:
+    """Write value as an unsigned LEB128 varint at offset, return the next offset."""
+    while value >= 0x80:
+        buffer[offset] = (value & 0x7F) | 0x80
+        value >>= 7
+        offset += 1
+    buffer[offset] = value
+    return offset + 1
+
+
+class BlockEncoder:
+    """Encodes records into one block buffer, reused after reset()."""
+
+    def __init__(self, block_size: int = 512):
+        self._block = bytearray(block_size)
+        self._view = memoryview(self._block)
+        self.reset()
+
+    def reset(self):
+        self._fill = HEADER_SIZE
+        self._count = 0
+        self._first = 0
+        self._timestamp = 0
+        self._temperature = 0
+        self._humidity = 0
+
+    def add(
+        self,
+        timestamp: int,
+        temperature: int,
+        humidity: int,
+        actuators: int,
+        errors: int,
+    ) -> bool:
+        """Encode a record, False if the block is too full to take it."""
+        if self._fill + MAX_RECORD_SIZE > len(self._block):
+            return False
+        block = self._block
+        tag = (actuators & 0x0F) | (errors & 0x07) << 4
+        if self._count == 0:
+            tag |= KEYFRAME
+            self._first = timestamp
+            dt = timestamp
+            dtemp = temperature
+            dhum = humidity
+        else:
+            dt = timestamp - self._timestamp
+            dtemp = temperature - self._temperature
+            dhum = humidity - self._humidity
+        block[self._fill] = tag
+        offset = put_varint(block, self._fill + 1, zigzag(dt))
+        offset = put_varint(block, offset, zigzag(dtemp))
+        self._fill = put_varint(block, offset, zigzag(dhum))
+        self._timestamp = timestamp
+        self._temperature = temperature
+        self._humidity = humidity
+        self._count += 1
+        return True
+
+    def __len__(self) -> int:
+        return self._count
+
+    def used(self) -> int:
+        return self._fill
+
+    def first_timestamp(self) -> int:
+        """Timestamp of the keyframe, the first record of the block."""
+        return self._first
+
+    def block(self) -> memoryview:
+        """The whole block, ready to be written."""
+        self._block[0] = self._fill & 0xFF
+        self._block[1] = self._fill >> 8
+        return self._view
+
+
+def decode_block(block):
+    """Yield the records of one block as (timestamp, temperature, humidity,
+    actuators, errors) tuples."""
+    end = block[0] | block[1] << 8
+    offset = HEADER_SIZE
+    timestamp = temperature = humidity = 0
+    while offset < end:
+        tag = block[offset]
+        offset += 1
+        values = [0, 0, 0]
+        for i in range(3):
+            value = 0
+            shift = 0
+            while True:
+                byte = block[offset]
+                offset += 1
+                value |= (byte & 0x7F) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            values[i] = unzigzag(value)
+        if tag & KEYFRAME:
+            timestamp, temperature, humidity = values
+        else:
+            timestamp += values[0]
+            temperature += values[1]
+            humidity += values[2]
+        yield (timestamp, temperature, humidity, tag & 0x0F, (tag >> 4) & 0x07)
+
+
+def decode_file(file, block_size: int = 512):
+    """Yield the records of a file of blocks, reading one block at a time."""
+    block = bytearray(block_size)
+    while file.readinto(block) == block_size:
+        yield from decode_block(block)
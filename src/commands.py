@@ -0,0 +1,194 @@
+from config import Config
+from datalog import RecordLog
+from history import NO_VALUE, History
+
+
+class CommandInterpreter:
+    """Line based command protocol, fed with whatever bytes are available.
+
+    Bytes collect in a fixed buffer until a newline, then the line is split
+    into words and the first one selects the handler. A handler gets the
+    remaining words and returns the reply text, or raises KeyError or
+    ValueError. Every line gets exactly one reply line: "OK <text>" or
+    "ERR <reason>". Lines longer than the buffer are answered with an error.
+    """
+
+    def __init__(self, write=print, size: int = 128):
+        self._write = write
+        self._buffer = bytearray(size)
+        self._fill = 0
+        self._overflow = False
+        self._handlers = {}
+
+    def register(self, name: str, handler):
+        self._handlers[name] = handler
+
+    def feed(self, data: bytes):
+        """Take the next bytes from the stream, run every line they complete."""
+        for byte in data:
+            if byte == 0x0A or byte == 0x0D:  # \n or \r
+                if self._overflow:
+                    self._write("ERR line too long")
+                    self._fill = 0
+                    self._overflow = False
+                elif self._fill:
+                    line = bytes(self._buffer[: self._fill])
+                    # reset first, so a failing line cannot break the next one
+                    self._fill = 0
+                    self.execute(line)
+            elif self._fill < len(self._buffer):
+                self._buffer[self._fill] = byte
+                self._fill += 1
+            else:
+                self._overflow = True
+
+    def execute(self, line: bytes):
+        try:
+            words = line.decode().split()
+        except UnicodeError:
+            self._write("ERR line is not UTF-8")
+            return
+        if not words:
+            return
+        handler = self._handlers.get(words[0])
+        if handler is None:
+            self._write(f"ERR unknown command {words[0]}")
+            return
+        try:
+            reply = handler(words[1:])
+        except KeyError as e:
+            self._write(f"ERR unknown field {e.args[0]}")
+        except (ValueError, IndexError) as e:
+            self._write(f"ERR {words[0]}: {e}")
+        else:
+            self._write(f"OK {reply}" if reply else "OK")
+
+
+def register_config(interpreter: CommandInterpreter, config: Config):
+    """Add the config commands:
+
+    get [field]                    one field, or all of them
+    set field value                one field
+    mset field=value field=value   several fields, validated first and saved
+                                   with a single write
+    """
+
+    def get(args: list) -> str:
+        names = args if args else config.fields()
+        return " ".join(f"{name}={config.get(name)}" for name in names)
+
+    def set_value(args: list) -> str:
+        if len(args) != 2:
+            raise ValueError("expected: set field value")
+        config.set(args[0], args[1])
+        return get(args[:1])
+
+    def set_many(args: list) -> str:
+        if not args:
+            raise ValueError("expected: mset field=value ...")
+        pairs = []
+        for arg in args:
+            name, separator, value = arg.partition("=")
+            if not separator:
+                raise ValueError(f"expected field=value, got {arg}")
+            config.get(name)  # unknown fields fail before anything is set
+            pairs.append((name, value))
+        backup = [(name, config.get(name)) for name, _ in pairs]
+        config.begin()
+        try:
+            for name, value in pairs:
+                config.set(name, value)
+        except ValueError:
+            for name, value in backup:
+                config.set(name, value)
+            config.abort()
+            raise
+        config.commit()
+        return get([name for name, _ in pairs])
+
+    interpreter.register("get", get)
+    interpreter.register("set", set_value)
+    interpreter.register("mset", set_many)
+
+
+def register_history(interpreter: CommandInterpreter, history: History):
+    """Add the history command:
+
+    history channel [raw|minutes|hours] [count]
+
+    channel is temperature or humidity, values are in tenths, newest first.
+    raw (the default) answers timestamp:value pairs, minutes and hours the
+    start of the newest period, the period in seconds and the averages, "-"
+    for periods without a sample.
+    """
+
+    def history_command(args: list) -> str:
+        if not args or len(args) > 3:
+            raise ValueError("expected: history channel [raw|minutes|hours] [count]")
+        if args[0] == "temperature":
+            channel = history.temperature
+        elif args[0] == "humidity":
+            channel = history.humidity
+        else:
+            raise ValueError(f"unknown channel {args[0]}")
+        resolution = args[1] if len(args) > 1 else "raw"
+        count = int(args[2]) if len(args) > 2 else -1
+        if resolution == "raw":
+            ring = channel.raw
+            count = len(ring) if count < 0 else min(count, len(ring))
+            return " ".join(
+                f"{history.timestamps.get(i)}:{ring.get(i)}" for i in range(count)
+            )
+        if resolution == "minutes":
+            rollup = channel.minutes
+            period = 60
+        elif resolution == "hours":
+            rollup = channel.hours
+            period = 3600
+        else:
+            raise ValueError(f"unknown resolution {resolution}")
+        ring = rollup.avg
+        if not len(ring):
+            return f"period={period}"
+        count = len(ring) if count < 0 else min(count, len(ring))
+        values = " ".join(
+            "-" if ring.get(i) == NO_VALUE else str(ring.get(i)) for i in range(count)
+        )
+        header = f"newest={rollup.newest_start()} period={period}"
+        return f"{header} {values}" if values else header
+
+    interpreter.register("history", history_command)
+
+
+def register_log(interpreter: CommandInterpreter, log: RecordLog, limit: int = 50):
+    """Add the log command:
+
+    log from to [count]
+
+    answers the logged records with from <= timestamp <= to, oldest first, as
+    timestamp,temperature,humidity,actuators,errors with temperature and
+    humidity in tenths. At most count (default limit) records are sent, when
+    there are more the reply ends with next=<timestamp> to continue from.
+    """
+
+    def log_command(args: list) -> str:
+        if len(args) not in (2, 3):
+            raise ValueError("expected: log from to [count]")
+        start = int(args[0])
+        end = int(args[1])
+        count = int(args[2]) if len(args) > 2 else limit
+        if count < 1:
+            raise ValueError("count must be positive")
+        found = []
+        records = log.query(start, end)
+        try:
+            for record in records:
+                if len(found) == count:
+                    found.append(f"next={record[0]}")
+                    break
+                found.append(",".join(str(field) for field in record))
+        finally:
+            records.close()  # closes the segment when stopped early
+        return " ".join(found)
+
+    interpreter.register("log", log_command)
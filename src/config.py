@@ -1,8 +1,70 @@
 import ujson
 import os
+from time import ticks_add, ticks_diff, ticks_ms
+from storage import checksum, write_atomic
+
+# smallest and largest value set() accepts, in the unit of the field
+_RANGES = {
+    "target_temperature": (-10.0, 40.0),
+    "target_humidity": (0.0, 100.0),
+    "humidity_tolerance": (0.1, 50.0),
+    "temperature_tolerance": (0.1, 10.0),
+    "fan_on_interval": (1, 24 * 60),
+    "fan_off_interval": (1, 24 * 60),
+    "fridge_watts": (0, 10000),
+    "atomizer_watts": (0, 10000),
+    "heater_watts": (0, 10000),
+    "fan_watts": (0, 10000),
+}
+
+
+class Thresholds:
+    """Switching points of the actuators, derived from the targets and tolerances."""
+
+    def __init__(self, config: "Config"):
+        temperature = config.get_target_temperature()
+        temperature_tolerance = config.get_temperature_tolerance()
+        humidity = config.get_target_humidity()
+        humidity_tolerance = config.get_humidity_tolerance()
+        self.fridge_on = temperature + temperature_tolerance
+        self.fridge_off = temperature
+        self.heater_on = temperature - temperature_tolerance
+        self.heater_off = temperature + temperature_tolerance / 2
+        self.atomizer_on = humidity - humidity_tolerance
+        self.atomizer_off = humidity
+        self.fan_on = humidity + humidity_tolerance
+        self.fan_off = humidity
 
 
 class Config:
+    """Settings, persisted to a JSON file.
+
+    Setters only mark the file as outdated. poll() writes it once no setter
+    was called for write_delay_ms, so a burst of edits costs one flash write.
+    Every change rebuilds the Thresholds and is announced to the listeners.
+    Changes between begin() and commit() are announced once, at commit().
+    """
+
+    _FIELDS = (
+        "target_temperature",
+        "target_humidity",
+        "humidity_tolerance",
+        "temperature_tolerance",
+        "fan_on_interval",
+        "fan_off_interval",
+        "fridge_watts",
+        "atomizer_watts",
+        "heater_watts",
+        "fan_watts",
+    )
+    _INTEGER_FIELDS = (
+        "fan_on_interval",
+        "fan_off_interval",
+        "fridge_watts",
+        "atomizer_watts",
+        "heater_watts",
+        "fan_watts",
+    )
     _target_temperature: float
     _temperature_tolerance: float
     _target_humidity: float
@@ -10,20 +72,87 @@ class Config:
     _config_file: str
     _fan_on_interval: int
     _fan_off_interval: int
+    _fridge_watts: int
+    _atomizer_watts: int
+    _heater_watts: int
+    _fan_watts: int
+    _pending: bool = False
+    _write_deadline: int = 0
+    _write_count: int = 0
+    _batch: int = 0
+    _batch_changed: bool = False
+    _thresholds: Thresholds
 
-    def __init__(self, config_file: str):
+    def __init__(self, config_file: str, write_delay_ms: int = 2000):
         self._config_file = config_file
+        self._write_delay_ms = write_delay_ms
+        self._listeners = []
         self._target_temperature = 6.0
         self._target_humidity = 70.0
         self._temperature_tolerance = 1.0
         self._humidity_tolerance = 2
         self._fan_on_interval = 2
         self._fan_off_interval = 60
+        # electrical power of the actuators, for the energy estimate
+        self._fridge_watts = 70
+        self._atomizer_watts = 25
+        self._heater_watts = 0
+        self._fan_watts = 5
         if config_file:
             if config_file in os.listdir():
                 self._read_config_file()
             else:
                 self._write_config_file()
+        self._thresholds = Thresholds(self)
+
+    def get_thresholds(self) -> Thresholds:
+        return self._thresholds
+
+    def add_listener(self, callback):
+        """Call callback(config) after every change of a value."""
+        self._listeners.append(callback)
+
+    def fields(self) -> tuple:
+        return self._FIELDS
+
+    def get(self, name: str):
+        """Value of the field name, KeyError for unknown fields."""
+        if name not in self._FIELDS:
+            raise KeyError(name)
+        return getattr(self, "_" + name)
+
+    def set(self, name: str, value):
+        """Set the field name through its setter, converting value to the field's
+        type. KeyError for unknown fields, ValueError for unusable values and
+        values outside of the field's range, which includes nan and inf."""
+        if name not in self._FIELDS:
+            raise KeyError(name)
+        if name in self._INTEGER_FIELDS:
+            value = int(value)
+        else:
+            value = float(value)
+        low, high = _RANGES[name]
+        # also false for nan
+        if not low <= value <= high:
+            raise ValueError(f"{name} must be from {low} to {high}")
+        getattr(self, "set_" + name)(value)
+
+    def begin(self):
+        """Start collecting changes until the matching commit()."""
+        self._batch += 1
+
+    def commit(self):
+        self._batch -= 1
+        if self._batch == 0 and self._batch_changed:
+            self._batch_changed = False
+            self._changed()
+
+    def abort(self):
+        """End a batch whose values the caller put back, without saving it or
+        calling the listeners."""
+        self._batch -= 1
+        if self._batch == 0:
+            self._batch_changed = False
 
     def get_target_temperature(self):
         return self._target_temperature
@@ -31,7 +160,7 @@ class Config:
     def set_target_temperature(self, value: float):
         if self._target_temperature != value:
             self._target_temperature = value
-            self._write_config_file()
+            self._changed()
 
     def get_target_humidity(self):
         return self._target_humidity
@@ -39,7 +168,7 @@ class Config:
     def set_target_humidity(self, value: float):
         if self._target_humidity != value:
             self._target_humidity = value
-            self._write_config_file()
+            self._changed()
 
     def get_temperature_tolerance(self):
         return self._temperature_tolerance
@@ -47,7 +176,7 @@ class Config:
     def set_temperature_tolerance(self, value: float):
         if self._temperature_tolerance != value:
             self._temperature_tolerance = value
-            self._write_config_file()
+            self._changed()
 
     def get_humidity_tolerance(self):
         return self._humidity_tolerance
@@ -55,7 +184,7 @@ class Config:
     def set_humidity_tolerance(self, value: float):
         if self._humidity_tolerance != value:
             self._humidity_tolerance = value
-            self._write_config_file()
+            self._changed()
 
     def get_fan_on_interval(self):
         return self._fan_on_interval
@@ -63,7 +192,7 @@ class Config:
     def set_fan_on_interval(self, value: int):
         if self._fan_on_interval != value:
             self._fan_on_interval = value
-            self._write_config_file()
+            self._changed()
 
     def get_fan_off_interval(self):
         return self._fan_off_interval
@@ -71,32 +200,105 @@ class Config:
     def set_fan_off_interval(self, value: int):
         if self._fan_off_interval != value:
             self._fan_off_interval = value
+            self._changed()
+
+    def get_fridge_watts(self):
+        return self._fridge_watts
+
+    def set_fridge_watts(self, value: int):
+        if self._fridge_watts != value:
+            self._fridge_watts = value
+            self._changed()
+
+    def get_atomizer_watts(self):
+        return self._atomizer_watts
+
+    def set_atomizer_watts(self, value: int):
+        if self._atomizer_watts != value:
+            self._atomizer_watts = value
+            self._changed()
+
+    def get_heater_watts(self):
+        return self._heater_watts
+
+    def set_heater_watts(self, value: int):
+        if self._heater_watts != value:
+            self._heater_watts = value
+            self._changed()
+
+    def get_fan_watts(self):
+        return self._fan_watts
+
+    def set_fan_watts(self, value: int):
+        if self._fan_watts != value:
+            self._fan_watts = value
+            self._changed()
+
+    def poll(self):
+        """Write pending changes once the write delay has passed."""
+        if self._pending and ticks_diff(ticks_ms(), self._write_deadline) >= 0:
+            self._write_config_file()
+
+    def flush(self):
+        """Write pending changes right away."""
+        if self._pending:
             self._write_config_file()
 
+    def write_count(self) -> int:
+        """Number of times the config file was written since boot."""
+        return self._write_count
+
+    def _changed(self):
+        if self._batch:
+            self._batch_changed = True
+            return
+        self._thresholds = Thresholds(self)
+        for listener in self._listeners:
+            listener(self)
+        self._pending = True
+        if self._write_delay_ms <= 0:
+            self._write_config_file()
+        else:
+            self._write_deadline = ticks_add(ticks_ms(), self._write_delay_ms)
+
+    def _values(self) -> list:
+        return [getattr(self, "_" + name) for name in self._FIELDS]
+
     def _read_config_file(self):
-        with open(self._config_file, "r") as config_file:
-            config = ujson.loads(config_file.read())
-        if config:
-            self._target_temperature = config.get("target_temperature")
-            self._target_humidity = config.get("target_humidity")
-            self._humidity_tolerance = config.get("humidity_tolerance")
-            self._temperature_tolerance = config.get("temperature_tolerance")
-            self._fan_on_interval = config.get("fan_on_interval")
-            self._fan_off_interval = config.get("fan_off_interval")
-            print("read config file")
+        try:
+            with open(self._config_file, "r") as config_file:
+                config = ujson.loads(config_file.read())
+        except ValueError as e:
+            print(f"ignored broken config file: {e}")
+            return
+        if not config:
+            return
+        # files written before a field was added lack it, the checksum
+        # covers the fields that are there
+        names = [name for name in self._FIELDS if name in config]
+        values = [config[name] for name in names]
+        stored_checksum = config.get("checksum")
+        if stored_checksum is not None and stored_checksum != checksum(
+            ujson.dumps(values)
+        ):
+            print("ignored config file with wrong checksum")
+            return
+        for name, value in zip(names, values):
+            low, high = _RANGES[name]
+            if not low <= value <= high:
+                print(f"ignored {name}={value} from the config file")
+                continue
+            setattr(self, "_" + name, value)
+        print("read config file")
 
     def _write_config_file(self):
+        self._pending = False
         if self._config_file:
-            json = ujson.dumps(
-                {
-                    "target_temperature": self._target_temperature,
-                    "target_humidity": self._target_humidity,
-                    "humidity_tolerance": self._humidity_tolerance,
-                    "temperature_tolerance": self._temperature_tolerance,
-                    "fan_on_interval": self._fan_on_interval,
-                    "fan_off_interval": self._fan_off_interval,
-                }
-            )
-            with open(self._config_file, "w") as config_file:
-                config_file.write(json)
-            print("created config file")
+            values = self._values()
+            config = {}
+            for name, value in zip(self._FIELDS, values):
+                config[name] = value
+            config["checksum"] = checksum(ujson.dumps(values))
+            write_atomic(self._config_file, ujson.dumps(config))
+            self._write_count += 1
+            print("wrote config file")
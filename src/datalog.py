@@ -0,0 +1,227 @@
+import os
+import struct
+
+from codec import BlockEncoder, decode_block, decode_file
+
+FRIDGE = 1
+ATOMIZER = 2
+HEATER = 4
+FAN = 8
+
+ERROR_SENSOR = 1  # the last measurement failed
+ERROR_NO_READING = 2  # no valid measurement yet
+ERROR_CONTROL = 4  # switching an actuator raised
+
+_SUFFIX = ".log"
+_INDEX_SUFFIX = ".idx"
+INDEX_ENTRY = "<II"  # first timestamp and file offset of a block
+INDEX_ENTRY_SIZE = struct.calcsize(INDEX_ENTRY)
+
+
+def actuator_mask(fridge: bool, atomizer: bool, heater: bool, fan: bool) -> int:
+    return (
+        (FRIDGE if fridge else 0)
+        | (ATOMIZER if atomizer else 0)
+        | (HEATER if heater else 0)
+        | (FAN if fan else 0)
+    )
+
+
+class RecordLog:
+    """Records appended to numbered segment files in directory.
+
+    Records are delta encoded into a block sized RAM buffer (see codec) and go
+    to flash one whole block at a time, so every segment is a sequence of
+    independently decodable blocks. A segment is closed once it reaches
+    segment_size bytes, the oldest segments are deleted to keep at most
+    max_segments. Records still in the buffer are lost on power loss, call
+    flush() before a controlled shutdown.
+
+    Next to every segment a .idx file holds one INDEX_ENTRY per block, so
+    query() finds the first block of a time range with a binary search over
+    a few small reads instead of decoding the log from the start.
+    Timestamps are expected not to go backwards.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        block_size: int = 512,
+        segment_size: int = 64 * 1024,
+        max_segments: int = 8,
+    ):
+        self._directory = directory
+        self._block_size = block_size
+        self._encoder = BlockEncoder(block_size)
+        self._segment_size = segment_size
+        self._max_segments = max_segments
+        self._flushes = 0
+        self._entry = bytearray(INDEX_ENTRY_SIZE)
+        try:
+            os.mkdir(directory)
+        except OSError:
+            pass  # exists
+        self._segments = sorted(
+            int(name[: -len(_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(_SUFFIX)
+        )
+        if self._segments:
+            self._segment_bytes = _size(self._path(self._segments[-1]))
+        else:
+            self._segments.append(1)
+            self._segment_bytes = 0
+        self._starts = [self._check_index(segment) for segment in self._segments]
+
+    def _path(self, segment: int, suffix: str = _SUFFIX) -> str:
+        return f"{self._directory}/{segment:08d}{suffix}"
+
+    def _check_index(self, segment: int) -> int | None:
+        """Rebuild the index of segment if it does not cover every block, as after
+        a power loss between the two writes. Return the first timestamp."""
+        path = self._path(segment)
+        index_path = self._path(segment, _INDEX_SUFFIX)
+        blocks = _size(path) // self._block_size
+        if _size(index_path) != blocks * INDEX_ENTRY_SIZE:
+            with open(path, "rb") as file, open(index_path, "wb") as index:
+                block = bytearray(self._block_size)
+                for i in range(blocks):
+                    file.readinto(block)
+                    first = next(decode_block(block))[0]
+                    struct.pack_into(
+                        INDEX_ENTRY, self._entry, 0, first, i * self._block_size
+                    )
+                    index.write(self._entry)
+        if blocks == 0:
+            return None
+        with open(index_path, "rb") as index:
+            return self._read_entry(index, 0)[0]
+
+    def _read_entry(self, index, i: int) -> tuple[int, int]:
+        index.seek(i * INDEX_ENTRY_SIZE)
+        index.readinto(self._entry)
+        return struct.unpack(INDEX_ENTRY, self._entry)
+
+    def append(
+        self,
+        timestamp: int,
+        temperature: int,
+        humidity: int,
+        actuators: int,
+        errors: int,
+    ):
+        """Add a record, temperature and humidity in tenths."""
+        encoder = self._encoder
+        if not encoder.add(timestamp, temperature, humidity, actuators, errors):
+            self.flush()
+            encoder.add(timestamp, temperature, humidity, actuators, errors)
+
+    def flush(self):
+        """Write the buffered records to the current segment as one block."""
+        if len(self._encoder) == 0:
+            return
+        if self._segment_bytes + self._block_size > self._segment_size:
+            self._rotate()
+        segment = self._segments[-1]
+        with open(self._path(segment), "ab") as file:
+            file.write(self._encoder.block())
+        first = self._encoder.first_timestamp()
+        struct.pack_into(INDEX_ENTRY, self._entry, 0, first, self._segment_bytes)
+        with open(self._path(segment, _INDEX_SUFFIX), "ab") as index:
+            index.write(self._entry)
+        if self._starts[-1] is None:
+            self._starts[-1] = first
+        self._segment_bytes += self._block_size
+        self._encoder.reset()
+        self._flushes += 1
+
+    def _rotate(self):
+        self._segments.append(self._segments[-1] + 1)
+        self._starts.append(None)
+        self._segment_bytes = 0
+        while len(self._segments) > self._max_segments:
+            segment = self._segments.pop(0)
+            self._starts.pop(0)
+            for suffix in (_SUFFIX, _INDEX_SUFFIX):
+                try:
+                    os.remove(self._path(segment, suffix))
+                except OSError:
+                    pass  # never flushed
+
+    def flush_count(self) -> int:
+        """Number of block writes to flash since construction."""
+        return self._flushes
+
+    def segments(self) -> list[str]:
+        """Paths of the segment files, oldest first."""
+        return [self._path(segment) for segment in self._segments]
+
+    def records(self):
+        """Yield every record as a tuple, oldest first, including buffered ones.
+
+        Files are read one block at a time, so memory use does not depend on
+        their size.
+        """
+        for path in self.segments():
+            # opened apart from the with block so that only a failing open is
+            # skipped, errors while decoding still propagate
+            try:
+                file = open(path, "rb")  # noqa: SIM115 - closed by the with below
+            except OSError:
+                continue
+            with file:
+                yield from decode_file(file, self._block_size)
+        if len(self._encoder):
+            yield from decode_block(self._encoder.block())
+
+    def query(self, start: int, end: int):
+        """Yield the records with start <= timestamp <= end, oldest first.
+
+        Only the blocks from the one holding start on are read, so the cost
+        depends on the length of the range and not on the size of the log.
+        """
+        first = 0
+        for i, segment_start in enumerate(self._starts):
+            if segment_start is not None and segment_start <= start:
+                first = i
+        for i in range(first, len(self._segments)):
+            segment_start = self._starts[i]
+            if segment_start is None:
+                continue
+            if segment_start > end:
+                return
+            offset = self._find_block(self._segments[i], start)
+            with open(self._path(self._segments[i]), "rb") as file:
+                file.seek(offset)
+                for record in decode_file(file, self._block_size):
+                    if record[0] > end:
+                        return
+                    if record[0] >= start:
+                        yield record
+        if len(self._encoder):
+            for record in decode_block(self._encoder.block()):
+                if record[0] > end:
+                    return
+                if record[0] >= start:
+                    yield record
+
+    def _find_block(self, segment: int, timestamp: int) -> int:
+        """Offset of the last block starting at or before timestamp, else 0."""
+        index_path = self._path(segment, _INDEX_SUFFIX)
+        low = 0
+        high = _size(index_path) // INDEX_ENTRY_SIZE - 1
+        with open(index_path, "rb") as index:
+            while low < high:
+                middle = (low + high + 1) // 2
+                if self._read_entry(index, middle)[0] <= timestamp:
+                    low = middle
+                else:
+                    high = middle - 1
+            return self._read_entry(index, low)[1]
+
+
+def _size(path: str) -> int:
+    try:
+        return os.stat(path)[6]
+    except OSError:
+        return 0
@@ -0,0 +1,185 @@
+from array import array
+from framebuf import FrameBuffer, RGB565
+from display.dirty import DirtyRegion
+
+# operations, see BandedFrameBuffer._add
+_FILL_RECT = 0
+_RECT = 1
+_TEXT = 2
+_BLIT = 3
+_ELLIPSE = 4
+_LINE = 5
+_PIXEL = 6
+
+# code, x, y, two more arguments, flags, top and bottom row touched
+_FIELDS = 8
+_FILLED = 0x10  # flag of a filled ellipse, the low four bits are its quadrants
+_KEYED = 0x20  # flag of a blit with a transparent color
+
+
+class BandedFrameBuffer:
+    """Stands in for a framebuffer of the whole screen without holding one.
+
+    The draw calls are recorded instead, into preallocated arrays. The display
+    driver replays them with render_band() into a strip of rows at a time and
+    sends each strip's share of the changed areas before drawing the next,
+    then reset() drops them. A full screen framebuffer takes 77 KB, the strip
+    and the recorded operations about 12 KB.
+
+    Nothing is kept of what was sent, so a changed area is sent with exactly
+    what the recorded operations draw into it on background. That is what the
+    pages do anyway: widgets erase their old area before they paint. The
+    changed areas are kept exact for the same reason, and once the operations
+    or the areas run out of room the attached display is updated early.
+    Reading pixels back, mark() and scroll() are not supported.
+    """
+
+    _count: int = 0
+    _display = None
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        rows: int = 16,
+        max_ops: int = 256,
+        max_rects: int = 32,
+        background: int = 0,
+    ):
+        self.width = width
+        self.height = height
+        self.rows = rows
+        self.buffer = bytearray(width * rows * 2)  # the strip, RGB565
+        self._strip = FrameBuffer(self.buffer, width, rows, RGB565)
+        self._background = background
+        self._ops = array("h", [0]) * (_FIELDS * max_ops)
+        self._colors = array("H", [0]) * max_ops
+        self._objects = [None] * max_ops  # text of _TEXT, framebuffer of _BLIT
+        self.dirty = DirtyRegion(width, height, max_rects, exact=True)
+        # whatever is on the panel does not match yet
+        self.fill(background)
+
+    def attach(self, display):
+        """Give the display to update when the recorded operations fill up."""
+        self._display = display
+
+    def reset(self):
+        """Forget the recorded operations, once they were sent."""
+        self._count = 0
+        self.dirty.clear()
+
+    def operations(self) -> int:
+        """Number of operations recorded since the last reset()."""
+        return self._count
+
+    def fill(self, c):
+        self.fill_rect(0, 0, self.width, self.height, c)
+
+    def pixel(self, x, y, c):
+        self._add(_PIXEL, x, y, 0, 0, c, 0, None, x, y, 1, 1)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def line(self, x0, y0, x1, y1, c):
+        left = min(x0, x1)
+        top = min(y0, y1)
+        width = abs(x1 - x0) + 1
+        height = abs(y1 - y0) + 1
+        self._add(_LINE, x0, y0, x1, y1, c, 0, None, left, top, width, height)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+        else:
+            self._add(_RECT, x, y, w, h, c, 0, None, x, y, w, h)
+
+    def fill_rect(self, x, y, w, h, c):
+        if x <= 0 and y <= 0 and x + w >= self.width and y + h >= self.height:
+            self.reset()  # covers everything recorded so far
+        self._add(_FILL_RECT, x, y, w, h, c, 0, None, x, y, w, h)
+
+    def ellipse(self, x, y, xr, yr, c, f=False, m=0xF):
+        flags = (_FILLED if f else 0) | m
+        left = x - xr
+        top = y - yr
+        width = 2 * xr + 1
+        height = 2 * yr + 1
+        self._add(_ELLIPSE, x, y, xr, yr, c, flags, None, left, top, width, height)
+
+    def text(self, s, x, y, c=1):
+        self._add(_TEXT, x, y, 0, 0, c, 0, s, x, y, len(s) * 8, 8)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if palette is not None:
+            raise ValueError("blits with a palette are not supported")
+        flags = 0 if key < 0 else _KEYED
+        width = fbuf.width
+        height = fbuf.height
+        self._add(_BLIT, x, y, 0, 0, key & 0xFFFF, flags, fbuf, x, y, width, height)
+
+    def _add(self, op, x, y, a, b, c, flags, obj, left, top, width, height):
+        # the area touched is left, top, width, height
+        bottom = min(top + height, self.height) - 1
+        right = min(left + width, self.width) - 1
+        if bottom < max(top, 0) or right < max(left, 0):
+            return
+        if self._count == len(self._objects) or self.dirty.full():
+            if self._display is None:
+                self.reset()  # nothing to show it on
+            else:
+                self._display.update()
+        self.dirty.add(left, top, width, height)
+        i = self._count
+        j = _FIELDS * i
+        ops = self._ops
+        ops[j] = op
+        ops[j + 1] = x
+        ops[j + 2] = y
+        ops[j + 3] = a
+        ops[j + 4] = b
+        ops[j + 5] = flags
+        ops[j + 6] = max(top, 0)
+        ops[j + 7] = bottom
+        self._colors[i] = c
+        self._objects[i] = obj
+        self._count = i + 1
+
+    def render_band(self, top: int) -> FrameBuffer:
+        """Draw what the recorded operations put into the rows from top into
+        the strip and return it, row top is its first row."""
+        strip = self._strip
+        strip.fill(self._background)
+        bottom = top + self.rows - 1
+        ops = self._ops
+        colors = self._colors
+        objects = self._objects
+        for i in range(self._count):
+            j = _FIELDS * i
+            if ops[j + 6] > bottom or ops[j + 7] < top:
+                continue
+            op = ops[j]
+            x = ops[j + 1]
+            y = ops[j + 2] - top
+            a = ops[j + 3]
+            b = ops[j + 4]
+            c = colors[i]
+            if op == _FILL_RECT:
+                strip.fill_rect(x, y, a, b, c)
+            elif op == _TEXT:
+                strip.text(objects[i], x, y, c)
+            elif op == _BLIT:
+                strip.blit(objects[i], x, y, c if ops[j + 5] & _KEYED else -1)
+            elif op == _RECT:
+                strip.rect(x, y, a, b, c)
+            elif op == _ELLIPSE:
+                flags = ops[j + 5]
+                strip.ellipse(x, y, a, b, c, flags & _FILLED, flags & 0xF)
+            elif op == _LINE:
+                strip.line(x, y, a, b - top, c)
+            else:
+                strip.pixel(x, y, c)
+        return strip
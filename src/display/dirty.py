@@ -0,0 +1,229 @@
+from array import array
+from framebuf import FrameBuffer
+
+
+class DirtyRegion:
+    """Collects the screen areas touched since the last flush.
+
+    Areas are kept as a handful of inclusive (x0, y0, x1, y1) rectangles.
+    Overlapping or adjacent areas are merged right away, and once there are
+    more than max_rects the pair whose union wastes the fewest pixels is merged.
+    The rectangles live in a preallocated array, so marking areas does not
+    allocate.
+
+    exact only merges areas whose union covers no pixel outside of them: one
+    inside the other, or two sharing their columns or rows and touching. That
+    is for displays that send an area without having all of it in memory, see
+    BandedFrameBuffer. They have to flush before full() is exceeded.
+    """
+
+    _count: int = 0
+
+    def __init__(
+        self, width: int, height: int, max_rects: int = 4, exact: bool = False
+    ):
+        self._width = width
+        self._height = height
+        self._max_rects = max_rects
+        self._exact = exact
+        # one spare slot for the rectangle that triggers a merge
+        self._rects = array("h", [0]) * (4 * (max_rects + 1))
+
+    def add(self, x: int, y: int, width: int, height: int):
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + width, self._width) - 1
+        y1 = min(y + height, self._height) - 1
+        if x1 < x0 or y1 < y0:
+            return
+        rects = self._rects
+        i = 0
+        while i < self._count:
+            j = 4 * i
+            if self._mergeable(j, x0, y0, x1, y1):
+                x0 = min(x0, rects[j])
+                y0 = min(y0, rects[j + 1])
+                x1 = max(x1, rects[j + 2])
+                y1 = max(y1, rects[j + 3])
+                self._remove(i)
+                i = 0  # the grown rectangle may touch one checked before
+            else:
+                i += 1
+        self._set(self._count, x0, y0, x1, y1)
+        self._count += 1
+        while self._count > self._max_rects:
+            self._merge_cheapest()
+
+    def _mergeable(self, j: int, x0: int, y0: int, x1: int, y1: int) -> bool:
+        rects = self._rects
+        touching = (
+            x0 <= rects[j + 2] + 1
+            and rects[j] <= x1 + 1
+            and y0 <= rects[j + 3] + 1
+            and rects[j + 1] <= y1 + 1
+        )
+        if not touching or not self._exact:
+            return touching
+        if x0 == rects[j] and x1 == rects[j + 2]:
+            return True  # stacked, or one inside the other
+        if y0 == rects[j + 1] and y1 == rects[j + 3]:
+            return True  # side by side
+        # one inside the other
+        if x0 <= rects[j] and rects[j + 2] <= x1:
+            return y0 <= rects[j + 1] and rects[j + 3] <= y1
+        return (
+            rects[j] <= x0
+            and x1 <= rects[j + 2]
+            and rects[j + 1] <= y0
+            and y1 <= rects[j + 3]
+        )
+
+    def add_all(self):
+        self._count = 1
+        self._set(0, 0, 0, self._width - 1, self._height - 1)
+
+    def is_empty(self) -> bool:
+        return not self._count
+
+    def count(self) -> int:
+        return self._count
+
+    def full(self) -> bool:
+        """Whether the next area may have to be merged with another one."""
+        return self._count >= self._max_rects
+
+    def rects(self):
+        """The rectangles as x0, y0, x1, y1 in an array, count() of them are valid."""
+        return self._rects
+
+    def clear(self):
+        """Start a new frame, after the rectangles were flushed."""
+        self._count = 0
+
+    def take(self) -> list[list[int]]:
+        """Return the collected rectangles as lists and start a new frame."""
+        rects = self._rects
+        taken = [list(rects[4 * i : 4 * i + 4]) for i in range(self._count)]
+        self._count = 0
+        return taken
+
+    def _set(self, i: int, x0: int, y0: int, x1: int, y1: int):
+        j = 4 * i
+        rects = self._rects
+        rects[j] = x0
+        rects[j + 1] = y0
+        rects[j + 2] = x1
+        rects[j + 3] = y1
+
+    def _remove(self, i: int):
+        self._count -= 1
+        last = 4 * self._count
+        rects = self._rects
+        j = 4 * i
+        rects[j] = rects[last]
+        rects[j + 1] = rects[last + 1]
+        rects[j + 2] = rects[last + 2]
+        rects[j + 3] = rects[last + 3]
+
+    def _merge_cheapest(self):
+        rects = self._rects
+        best_i = -1
+        best_j = -1
+        best_waste = 0
+        for i in range(self._count):
+            a = 4 * i
+            for j in range(i + 1, self._count):
+                b = 4 * j
+                width = max(rects[a + 2], rects[b + 2]) - min(rects[a], rects[b]) + 1
+                top = min(rects[a + 1], rects[b + 1])
+                height = max(rects[a + 3], rects[b + 3]) - top + 1
+                waste = width * height - self._area(rects, a) - self._area(rects, b)
+                if best_i < 0 or waste < best_waste:
+                    best_i = i
+                    best_j = j
+                    best_waste = waste
+        a = 4 * best_i
+        b = 4 * best_j
+        self._set(
+            best_i,
+            min(rects[a], rects[b]),
+            min(rects[a + 1], rects[b + 1]),
+            max(rects[a + 2], rects[b + 2]),
+            max(rects[a + 3], rects[b + 3]),
+        )
+        self._remove(best_j)
+
+    @staticmethod
+    def _area(rects, j: int) -> int:
+        return (rects[j + 2] - rects[j] + 1) * (rects[j + 3] - rects[j + 1] + 1)
+
+
+class TrackedFrameBuffer(FrameBuffer):
+    """FrameBuffer that records the area touched by every draw call.
+
+    The display driver reads `dirty` on update and only sends those areas.
+    """
+
+    dirty: DirtyRegion
+
+    def __init__(self, buffer, width: int, height: int, format: int):
+        super().__init__(buffer, width, height, format)
+        self.width = width
+        self.height = height
+        self.dirty = DirtyRegion(width, height)
+        # whatever is on the panel does not match the buffer yet
+        self.dirty.add_all()
+
+    def mark(self, x: int, y: int, width: int, height: int):
+        """Flag an area as changed for drawing done behind the framebuffer's back."""
+        self.dirty.add(x, y, width, height)
+
+    def fill(self, c):
+        super().fill(c)
+        self.dirty.add_all()
+
+    def pixel(self, x, y, c=None):
+        if c is None:
+            return super().pixel(x, y)
+        super().pixel(x, y, c)
+        self.dirty.add(x, y, 1, 1)
+
+    def hline(self, x, y, w, c):
+        super().hline(x, y, w, c)
+        self.dirty.add(x, y, w, 1)
+
+    def vline(self, x, y, h, c):
+        super().vline(x, y, h, c)
+        self.dirty.add(x, y, 1, h)
+
+    def line(self, x0, y0, x1, y1, c):
+        super().line(x0, y0, x1, y1, c)
+        self.dirty.add(min(x0, x1), min(y0, y1), abs(x1 - x0) + 1, abs(y1 - y0) + 1)
+
+    def rect(self, x, y, w, h, c, f=False):
+        super().rect(x, y, w, h, c, f)
+        self.dirty.add(x, y, w, h)
+
+    def fill_rect(self, x, y, w, h, c):
+        super().fill_rect(x, y, w, h, c)
+        self.dirty.add(x, y, w, h)
+
+    def ellipse(self, x, y, xr, yr, c, f=False, m=0xF):
+        super().ellipse(x, y, xr, yr, c, f, m)
+        self.dirty.add(x - xr, y - yr, 2 * xr + 1, 2 * yr + 1)
+
+    def text(self, s, x, y, c=1):
+        super().text(s, x, y, c)
+        self.dirty.add(x, y, len(s) * 8, 8)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        super().blit(fbuf, x, y, key, palette)
+        width = getattr(fbuf, "width", None)
+        if width is None:
+            self.dirty.add_all()
+        else:
+            self.dirty.add(x, y, width, fbuf.height)
+
+    def scroll(self, xstep, ystep):
+        super().scroll(xstep, ystep)
+        self.dirty.add_all()
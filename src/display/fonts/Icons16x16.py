@@ -1,100 +1,106 @@
-import array
+from display.fonts.bitmap import BitmapFont
 
-Icons16x16 = array.array('B',[16,16,32,96,
-    0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char
-    0x03, 0x00, 0x00, 0x3E, 0x0C, 0xFE, 0x0D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char !
-    0x07, 0x00, 0x00, 0x1E, 0x00, 0x1E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1E, 0x00, 0x1E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char "
-    0x09, 0x10, 0x01, 0x10, 0x0F, 0xF0, 0x01, 0x1E, 0x01, 0x10, 0x01, 0x10, 0x0F, 0xF0, 0x01, 0x1E, 0x01, 0x10, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char #
-    0x08, 0x00, 0x00, 0x1C, 0x06, 0x3E, 0x0C, 0x62, 0x08, 0xFF, 0x1F, 0xC2, 0x09, 0x86, 0x0F, 0x0C, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char $
-    0x0F, 0x00, 0x00, 0x7C, 0x00, 0xFE, 0x00, 0x82, 0x00, 0xFE, 0x08, 0x7C, 0x04, 0x00, 0x03, 0xC0, 0x00, 0x20, 0x00, 0x18, 0x00, 0xC4, 0x07, 0xE2, 0x0F, 0x20, 0x08, 0xE0, 0x0F, 0xC0, 0x07, 0x00, 0x00,  ## Code for char %
-    0x0E, 0x00, 0x00, 0x00, 0x07, 0x80, 0x0F, 0x40, 0x0C, 0x3C, 0x08, 0xFE, 0x08, 0xE2, 0x09, 0xA2, 0x0B, 0x1E, 0x06, 0x0C, 0x0F, 0xA0, 0x0C, 0x60, 0x0C, 0x20, 0x04, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00,  ## Code for char &
-    0x03, 0x00, 0x00, 0x1E, 0x00, 0x1E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char '
-    0x06, 0x00, 0x00, 0xE0, 0x07, 0xF8, 0x1F, 0x0C, 0x38, 0x04, 0x20, 0x02, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char (
-    0x05, 0x02, 0x40, 0x04, 0x20, 0x1C, 0x38, 0xF8, 0x1F, 0xE0, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char )
-    0x07, 0x00, 0x00, 0x00, 0x00, 0x2C, 0x00, 0x38, 0x00, 0x1E, 0x00, 0x38, 0x00, 0x2C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char *
-    0x09, 0x40, 0x00, 0x40, 0x00, 0x40, 0x00, 0x40, 0x00, 0xFC, 0x07, 0x40, 0x00, 0x40, 0x00, 0x40, 0x00, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char +
-    0x03, 0x00, 0x00, 0x00, 0x4C, 0x00, 0x3C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char ,
-    0x05, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char -
-    0x03, 0x00, 0x00, 0x00, 0x0C, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char .
-    0x05, 0x00, 0x08, 0x00, 0x07, 0xE0, 0x00, 0x1C, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char /
-    0x10, 0xC0, 0x01, 0xF0, 0x03, 0xF8, 0x07, 0xF0, 0x27, 0xC0, 0x73, 0x8C, 0x73, 0xBE, 0x79, 0xFF, 0xFF, 0xFF, 0xFF, 0x9F, 0x7D, 0xCE, 0x31, 0xCE, 0x03, 0xE4, 0x0F, 0xE0, 0x1F, 0xC0, 0x0F, 0x80, 0x03,  ## Code for char 0 (Fan)
-    0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0F, 0x80, 0x1F, 0xC0, 0x38, 0xE0, 0x37, 0xF8, 0x7F, 0xFE, 0x7F, 0xE0, 0x3F, 0xC0, 0x3F, 0x80, 0x1F, 0x00, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char 1 (Water droplet)
-    0x0F, 0x00, 0x00, 0x00, 0x00, 0x14, 0x28, 0x08, 0x10, 0x54, 0x2A, 0x20, 0x04, 0x42, 0x42, 0x94, 0x29, 0xFF, 0xFF, 0x94, 0x29, 0x42, 0x42, 0x20, 0x04, 0x54, 0x2A, 0x08, 0x10, 0x14, 0x28, 0x00, 0x00,  ## Code for char 2 (Snow flake)
-    0x0D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x00, 0x3E, 0x00, 0x7F, 0x00, 0x7F, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0x7F, 0x00, 0x7F, 0x00, 0x3E, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char 3 (Themometer)
-    0x08, 0x80, 0x01, 0xC0, 0x01, 0xA0, 0x01, 0x90, 0x01, 0x88, 0x01, 0xFC, 0x0F, 0xFE, 0x0F, 0x80, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char 4
-    0x08, 0x20, 0x04, 0x3C, 0x0C, 0x36, 0x0C, 0x36, 0x08, 0x76, 0x08, 0x66, 0x08, 0xE6, 0x04, 0xC2, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char 5
-    0x08, 0xE0, 0x03, 0xF0, 0x07, 0x78, 0x0C, 0x3C, 0x08, 0x24, 0x08, 0x66, 0x0C, 0xC2, 0x07, 0x82, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char 6
-    0x08, 0x00, 0x00, 0x0C, 0x00, 0x06, 0x00, 0x06, 0x00, 0x06, 0x0E, 0x86, 0x01, 0x76, 0x00, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char 7
-    0x08, 0x1C, 0x07, 0xBC, 0x0F, 0x72, 0x0C, 0x62, 0x08, 0xE2, 0x08, 0xE6, 0x08, 0xBE, 0x07, 0x1C, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char 8
-    0x08, 0x38, 0x08, 0x7C, 0x08, 0xC6, 0x0C, 0x82, 0x04, 0x82, 0x06, 0x86, 0x03, 0xFC, 0x01, 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char 9
-    0x03, 0x00, 0x00, 0x30, 0x0C, 0x30, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char :
-    0x03, 0x00, 0x00, 0x30, 0x4C, 0x30, 0x3C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char ;
-    0x09, 0x20, 0x00, 0x50, 0x00, 0x50, 0x00, 0x88, 0x00, 0x88, 0x00, 0x88, 0x00, 0x04, 0x01, 0x04, 0x01, 0x02, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char <
-    0x09, 0x20, 0x01, 0x20, 0x01, 0x20, 0x01, 0x20, 0x01, 0x20, 0x01, 0x20, 0x01, 0x20, 0x01, 0x20, 0x01, 0x20, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char =
-    0x09, 0x02, 0x02, 0x04, 0x01, 0x04, 0x01, 0x88, 0x00, 0x88, 0x00, 0x88, 0x00, 0x50, 0x00, 0x50, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char >
-    0x08, 0x00, 0x00, 0x0C, 0x00, 0x0E, 0x00, 0x02, 0x0C, 0x82, 0x0D, 0x46, 0x00, 0x3E, 0x00, 0x1C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char ?
-    0x10, 0x00, 0x00, 0xE0, 0x0F, 0x10, 0x10, 0x08, 0x20, 0xC4, 0x47, 0xE2, 0x8F, 0x32, 0x88, 0x12, 0x84, 0x12, 0x87, 0xE2, 0x8F, 0xF2, 0x88, 0x12, 0x88, 0x04, 0x44, 0x08, 0x22, 0xF0, 0x11, 0x00, 0x08,  ## Code for char @
-    0x0B, 0x00, 0x08, 0x00, 0x0C, 0x80, 0x0B, 0x70, 0x09, 0x0C, 0x01, 0x3E, 0x01, 0xF8, 0x09, 0xE0, 0x0B, 0x00, 0x0F, 0x00, 0x0C, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char A
-    0x0B, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x42, 0x08, 0x42, 0x08, 0x42, 0x08, 0x42, 0x08, 0xE6, 0x0C, 0xBC, 0x07, 0x18, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char B
-    0x0B, 0x00, 0x00, 0xF0, 0x01, 0xF8, 0x03, 0x0C, 0x06, 0x06, 0x0C, 0x02, 0x08, 0x02, 0x08, 0x02, 0x08, 0x04, 0x08, 0x0C, 0x04, 0x1E, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char C
-    0x0B, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x02, 0x08, 0x02, 0x08, 0x02, 0x08, 0x06, 0x0C, 0x0C, 0x06, 0xF8, 0x03, 0xF0, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char D
-    0x0A, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x42, 0x08, 0x42, 0x08, 0xF2, 0x09, 0x02, 0x08, 0x06, 0x0C, 0x0E, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char E
-    0x0A, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x42, 0x08, 0x42, 0x08, 0xF2, 0x01, 0x02, 0x00, 0x06, 0x00, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char F
-    0x0E, 0x00, 0x00, 0xF0, 0x01, 0xF8, 0x03, 0x0C, 0x06, 0x06, 0x0C, 0x02, 0x08, 0x02, 0x08, 0x02, 0x08, 0x82, 0x08, 0x84, 0x08, 0x8C, 0x07, 0x9E, 0x07, 0x80, 0x00, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char G
-    0x0D, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x42, 0x08, 0x42, 0x08, 0x40, 0x00, 0x42, 0x08, 0x42, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x02, 0x08, 0x02, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char H
-    0x06, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x02, 0x08, 0x02, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char I
-    0x09, 0x00, 0x07, 0x00, 0x0F, 0x00, 0x08, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x07, 0x02, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char J
-    0x0C, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x42, 0x08, 0xE2, 0x08, 0x90, 0x01, 0x10, 0x0B, 0x0A, 0x0E, 0x06, 0x0C, 0x02, 0x08, 0x02, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char K
-    0x0A, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x02, 0x08, 0x02, 0x08, 0x00, 0x08, 0x00, 0x08, 0x00, 0x0C, 0x00, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char L
-    0x10, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0x06, 0x08, 0x3E, 0x08, 0xF8, 0x01, 0xC0, 0x07, 0x00, 0x0E, 0x00, 0x03, 0xE0, 0x00, 0x18, 0x08, 0x06, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x02, 0x08, 0x02, 0x08,  ## Code for char M
-    0x0C, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0x06, 0x08, 0x0E, 0x08, 0x38, 0x00, 0x70, 0x00, 0xC2, 0x01, 0x82, 0x03, 0xFE, 0x0F, 0x02, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char N
-    0x0C, 0x00, 0x00, 0xF0, 0x01, 0xF8, 0x03, 0x0C, 0x06, 0x06, 0x0C, 0x02, 0x08, 0x02, 0x08, 0x02, 0x08, 0x06, 0x0C, 0x0C, 0x06, 0xF8, 0x03, 0xF0, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char O
-    0x0A, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x42, 0x08, 0x42, 0x08, 0x42, 0x00, 0x66, 0x00, 0x3C, 0x00, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char P
-    0x0C, 0x00, 0x00, 0xF0, 0x01, 0xF8, 0x03, 0x0C, 0x06, 0x06, 0x0C, 0x02, 0x08, 0x02, 0x18, 0x02, 0x78, 0x06, 0x6C, 0x0C, 0x46, 0xF8, 0x43, 0xF0, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char Q
-    0x0C, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x42, 0x08, 0x42, 0x08, 0xC2, 0x00, 0xC2, 0x03, 0x26, 0x0F, 0x3C, 0x0C, 0x18, 0x08, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char R
-    0x08, 0x00, 0x00, 0x1C, 0x0F, 0x3E, 0x04, 0x72, 0x08, 0x62, 0x08, 0xC2, 0x08, 0xC4, 0x0F, 0x9E, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char S
-    0x0A, 0x0E, 0x00, 0x02, 0x00, 0x02, 0x08, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x02, 0x08, 0x02, 0x08, 0x02, 0x00, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char T
-    0x0C, 0x02, 0x00, 0x02, 0x00, 0xFE, 0x03, 0xFE, 0x07, 0x02, 0x0C, 0x02, 0x08, 0x00, 0x08, 0x02, 0x08, 0x02, 0x04, 0xFE, 0x03, 0x02, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char U
-    0x0C, 0x02, 0x00, 0x02, 0x00, 0x0E, 0x00, 0x7E, 0x00, 0xF2, 0x01, 0x80, 0x0F, 0x00, 0x0E, 0xC0, 0x01, 0x32, 0x00, 0x0E, 0x00, 0x02, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char V
-    0x10, 0x02, 0x00, 0x0E, 0x00, 0x7E, 0x00, 0xF2, 0x01, 0x80, 0x0F, 0x02, 0x0F, 0xF2, 0x00, 0x0E, 0x00, 0x3E, 0x00, 0xFA, 0x01, 0xC0, 0x0F, 0x00, 0x0E, 0xC0, 0x01, 0x32, 0x00, 0x0E, 0x00, 0x02, 0x00,  ## Code for char W
-    0x0C, 0x02, 0x08, 0x06, 0x08, 0x0E, 0x0C, 0x1E, 0x0A, 0x7A, 0x01, 0xE0, 0x01, 0xE0, 0x0B, 0x10, 0x0F, 0x0A, 0x0E, 0x06, 0x08, 0x02, 0x08, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char X
-    0x0B, 0x02, 0x00, 0x06, 0x00, 0x0E, 0x00, 0x3E, 0x08, 0x7A, 0x08, 0xE0, 0x0F, 0xC0, 0x0F, 0x22, 0x08, 0x1A, 0x08, 0x06, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char Y
-    0x0A, 0x00, 0x08, 0x1E, 0x0C, 0x06, 0x0F, 0x82, 0x0B, 0xC2, 0x09, 0x72, 0x08, 0x3A, 0x08, 0x1E, 0x08, 0x06, 0x0C, 0x02, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char Z
-    0x06, 0x00, 0x00, 0x00, 0x00, 0xFE, 0x7F, 0xFE, 0x7F, 0x02, 0x40, 0x02, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char [
-    0x05, 0x02, 0x00, 0x1C, 0x00, 0xE0, 0x00, 0x00, 0x07, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char BackSlash
-    0x04, 0x02, 0x40, 0x02, 0x40, 0xFE, 0x7F, 0xFE, 0x7F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char ]
-    0x08, 0x00, 0x00, 0x40, 0x00, 0x30, 0x00, 0x0C, 0x00, 0x02, 0x00, 0x0C, 0x00, 0x30, 0x00, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char ^
-    0x09, 0x00, 0x80, 0x00, 0x80, 0x00, 0x80, 0x00, 0x80, 0x00, 0x80, 0x00, 0x80, 0x00, 0x80, 0x00, 0x80, 0x00, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char _
-    0x03, 0x00, 0x00, 0x02, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char `
-    0x08, 0x00, 0x00, 0x60, 0x06, 0x70, 0x0F, 0x10, 0x09, 0x90, 0x08, 0xF0, 0x0F, 0xE0, 0x0F, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char a
-    0x08, 0x02, 0x00, 0xFE, 0x0F, 0xFE, 0x07, 0x20, 0x08, 0x10, 0x08, 0x30, 0x0C, 0xE0, 0x07, 0xC0, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char b
-    0x07, 0x00, 0x00, 0xC0, 0x03, 0xE0, 0x07, 0x10, 0x0C, 0x10, 0x08, 0x30, 0x08, 0x20, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char c
-    0x09, 0x00, 0x00, 0xC0, 0x03, 0xE0, 0x07, 0x30, 0x0C, 0x10, 0x08, 0x22, 0x04, 0xFE, 0x0F, 0xFE, 0x0F, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char d
-    0x07, 0x00, 0x00, 0xE0, 0x07, 0xF0, 0x0F, 0x90, 0x08, 0x90, 0x08, 0xF0, 0x08, 0xE0, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char e
-    0x06, 0x10, 0x08, 0xFC, 0x0F, 0xFE, 0x0F, 0x12, 0x08, 0x06, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char f
-    0x09, 0x00, 0x00, 0xC0, 0x79, 0xE0, 0x9F, 0x10, 0x9A, 0x10, 0x9A, 0x10, 0x9A, 0xF0, 0x99, 0xF0, 0x98, 0x10, 0x70, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char g
-    0x09, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x20, 0x08, 0x10, 0x00, 0x10, 0x08, 0xF0, 0x0F, 0xE0, 0x0F, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char h
-    0x05, 0x00, 0x00, 0x10, 0x08, 0xF6, 0x0F, 0xF6, 0x0F, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char i
-    0x04, 0x10, 0xC0, 0x10, 0x80, 0xF6, 0xFF, 0xF6, 0x7F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char j
-    0x09, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x80, 0x08, 0xC0, 0x01, 0x30, 0x0B, 0x10, 0x0E, 0x10, 0x0C, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char k
-    0x05, 0x00, 0x00, 0x02, 0x08, 0xFE, 0x0F, 0xFE, 0x0F, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char l
-    0x0E, 0x10, 0x08, 0xF0, 0x0F, 0xF0, 0x0F, 0x20, 0x08, 0x10, 0x00, 0x10, 0x00, 0xF0, 0x0F, 0xE0, 0x0F, 0x20, 0x08, 0x10, 0x00, 0x10, 0x00, 0xF0, 0x0F, 0xE0, 0x0F, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00,  ## Code for char m
-    0x09, 0x10, 0x08, 0xF0, 0x0F, 0xF0, 0x0F, 0x20, 0x08, 0x10, 0x00, 0x10, 0x08, 0xF0, 0x0F, 0xE0, 0x0F, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char n
-    0x08, 0x00, 0x00, 0xE0, 0x07, 0xF0, 0x0F, 0x10, 0x08, 0x10, 0x08, 0x10, 0x08, 0xF0, 0x0F, 0xE0, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char o
-    0x08, 0x10, 0x80, 0xF0, 0xFF, 0xF0, 0xFF, 0x20, 0x84, 0x10, 0x08, 0x30, 0x0C, 0xE0, 0x07, 0xC0, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char p
-    0x09, 0x00, 0x00, 0xC0, 0x03, 0xE0, 0x07, 0x30, 0x0C, 0x10, 0x08, 0x10, 0x84, 0xE0, 0xFF, 0xF0, 0xFF, 0x00, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char q
-    0x07, 0x00, 0x00, 0x10, 0x08, 0xF0, 0x0F, 0xF0, 0x0F, 0x20, 0x08, 0x10, 0x00, 0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char r
-    0x06, 0x00, 0x00, 0xE0, 0x0C, 0xF0, 0x09, 0x90, 0x09, 0x90, 0x0F, 0x30, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char s
-    0x06, 0x10, 0x00, 0xF8, 0x07, 0xFC, 0x0F, 0x10, 0x08, 0x10, 0x08, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char t
-    0x09, 0x10, 0x00, 0xF0, 0x07, 0xF0, 0x0F, 0x00, 0x08, 0x00, 0x08, 0x10, 0x04, 0xF0, 0x0F, 0xF0, 0x0F, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char u
-    0x08, 0x10, 0x00, 0x70, 0x00, 0xF0, 0x03, 0xD0, 0x0F, 0x00, 0x0E, 0x90, 0x01, 0x70, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char v
-    0x0D, 0x10, 0x00, 0x30, 0x00, 0xF0, 0x01, 0xD0, 0x0F, 0x00, 0x0E, 0xD0, 0x01, 0x30, 0x00, 0xF0, 0x01, 0xD0, 0x0F, 0x00, 0x0E, 0xD0, 0x01, 0x30, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char w
-    0x08, 0x10, 0x08, 0x30, 0x0C, 0xF0, 0x0A, 0xD0, 0x01, 0x80, 0x0B, 0x50, 0x0F, 0x30, 0x0C, 0x10, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char x
-    0x08, 0x10, 0xC0, 0x70, 0xC0, 0xF0, 0x81, 0x90, 0x77, 0x00, 0x0E, 0xD0, 0x01, 0x30, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char y
-    0x06, 0x30, 0x08, 0x10, 0x0E, 0x90, 0x0F, 0xF0, 0x09, 0x70, 0x0C, 0x10, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char z
-    0x06, 0x00, 0x00, 0x80, 0x00, 0x4C, 0x19, 0x7E, 0x3F, 0x32, 0x66, 0x02, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char {
-    0x02, 0x00, 0x00, 0xFE, 0xFF, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char |
-    0x06, 0x00, 0x00, 0x02, 0x40, 0x32, 0x66, 0x7E, 0x3F, 0x4C, 0x19, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char }
+# fmt: off
+_DATA = (
+    b"\x10\x10\x20\x60"  # width, height, first char, char count
+    b"\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char
+    b"\x03\x00\x00\x3e\x0c\xfe\x0d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char !
+    b"\x07\x00\x00\x1e\x00\x1e\x00\x00\x00\x00\x00\x1e\x00\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char "
+    b"\x09\x10\x01\x10\x0f\xf0\x01\x1e\x01\x10\x01\x10\x0f\xf0\x01\x1e\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char #
+    b"\x08\x00\x00\x1c\x06\x3e\x0c\x62\x08\xff\x1f\xc2\x09\x86\x0f\x0c\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char $
+    b"\x0f\x00\x00\x7c\x00\xfe\x00\x82\x00\xfe\x08\x7c\x04\x00\x03\xc0\x00\x20\x00\x18\x00\xc4\x07\xe2\x0f\x20\x08\xe0\x0f\xc0\x07\x00\x00"  # Code for char %
+    b"\x0e\x00\x00\x00\x07\x80\x0f\x40\x0c\x3c\x08\xfe\x08\xe2\x09\xa2\x0b\x1e\x06\x0c\x0f\xa0\x0c\x60\x0c\x20\x04\x00\x02\x00\x00\x00\x00"  # Code for char &
+    b"\x03\x00\x00\x1e\x00\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char '
+    b"\x06\x00\x00\xe0\x07\xf8\x1f\x0c\x38\x04\x20\x02\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char (
+    b"\x05\x02\x40\x04\x20\x1c\x38\xf8\x1f\xe0\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char )
+    b"\x07\x00\x00\x00\x00\x2c\x00\x38\x00\x1e\x00\x38\x00\x2c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char *
+    b"\x09\x40\x00\x40\x00\x40\x00\x40\x00\xfc\x07\x40\x00\x40\x00\x40\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char +
+    b"\x03\x00\x00\x00\x4c\x00\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char ,
+    b"\x05\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char -
+    b"\x03\x00\x00\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char .
+    b"\x05\x00\x08\x00\x07\xe0\x00\x1c\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char /
+    b"\x10\xc0\x01\xf0\x03\xf8\x07\xf0\x27\xc0\x73\x8c\x73\xbe\x79\xff\xff\xff\xff\x9f\x7d\xce\x31\xce\x03\xe4\x0f\xe0\x1f\xc0\x0f\x80\x03"  # Code for char 0 (Fan)
+    b"\x0f\x00\x00\x00\x00\x00\x00\x00\x0f\x80\x1f\xc0\x38\xe0\x37\xf8\x7f\xfe\x7f\xe0\x3f\xc0\x3f\x80\x1f\x00\x0f\x00\x00\x00\x00\x00\x00"  # Code for char 1 (Water droplet)
+    b"\x0f\x00\x00\x00\x00\x14\x28\x08\x10\x54\x2a\x20\x04\x42\x42\x94\x29\xff\xff\x94\x29\x42\x42\x20\x04\x54\x2a\x08\x10\x14\x28\x00\x00"  # Code for char 2 (Snow flake)
+    b"\x0d\x00\x00\x00\x00\x00\x00\x00\x08\x00\x3e\x00\x7f\x00\x7f\xff\xff\xff\xff\x00\x7f\x00\x7f\x00\x3e\x00\x08\x00\x00\x00\x00\x00\x00"  # Code for char 3 (Themometer)
+    b"\x08\x80\x01\xc0\x01\xa0\x01\x90\x01\x88\x01\xfc\x0f\xfe\x0f\x80\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char 4
+    b"\x08\x20\x04\x3c\x0c\x36\x0c\x36\x08\x76\x08\x66\x08\xe6\x04\xc2\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char 5
+    b"\x08\xe0\x03\xf0\x07\x78\x0c\x3c\x08\x24\x08\x66\x0c\xc2\x07\x82\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char 6
+    b"\x08\x00\x00\x0c\x00\x06\x00\x06\x00\x06\x0e\x86\x01\x76\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char 7
+    b"\x08\x1c\x07\xbc\x0f\x72\x0c\x62\x08\xe2\x08\xe6\x08\xbe\x07\x1c\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char 8
+    b"\x08\x38\x08\x7c\x08\xc6\x0c\x82\x04\x82\x06\x86\x03\xfc\x01\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char 9
+    b"\x03\x00\x00\x30\x0c\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char :
+    b"\x03\x00\x00\x30\x4c\x30\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char ;
+    b"\x09\x20\x00\x50\x00\x50\x00\x88\x00\x88\x00\x88\x00\x04\x01\x04\x01\x02\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char <
+    b"\x09\x20\x01\x20\x01\x20\x01\x20\x01\x20\x01\x20\x01\x20\x01\x20\x01\x20\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char =
+    b"\x09\x02\x02\x04\x01\x04\x01\x88\x00\x88\x00\x88\x00\x50\x00\x50\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char >
+    b"\x08\x00\x00\x0c\x00\x0e\x00\x02\x0c\x82\x0d\x46\x00\x3e\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char ?
+    b"\x10\x00\x00\xe0\x0f\x10\x10\x08\x20\xc4\x47\xe2\x8f\x32\x88\x12\x84\x12\x87\xe2\x8f\xf2\x88\x12\x88\x04\x44\x08\x22\xf0\x11\x00\x08"  # Code for char @
+    b"\x0b\x00\x08\x00\x0c\x80\x0b\x70\x09\x0c\x01\x3e\x01\xf8\x09\xe0\x0b\x00\x0f\x00\x0c\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char A
+    b"\x0b\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x42\x08\x42\x08\x42\x08\x42\x08\xe6\x0c\xbc\x07\x18\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char B
+    b"\x0b\x00\x00\xf0\x01\xf8\x03\x0c\x06\x06\x0c\x02\x08\x02\x08\x02\x08\x04\x08\x0c\x04\x1e\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char C
+    b"\x0b\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x02\x08\x02\x08\x02\x08\x06\x0c\x0c\x06\xf8\x03\xf0\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char D
+    b"\x0a\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x42\x08\x42\x08\xf2\x09\x02\x08\x06\x0c\x0e\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char E
+    b"\x0a\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x42\x08\x42\x08\xf2\x01\x02\x00\x06\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char F
+    b"\x0e\x00\x00\xf0\x01\xf8\x03\x0c\x06\x06\x0c\x02\x08\x02\x08\x02\x08\x82\x08\x84\x08\x8c\x07\x9e\x07\x80\x00\x80\x00\x00\x00\x00\x00"  # Code for char G
+    b"\x0d\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x42\x08\x42\x08\x40\x00\x42\x08\x42\x08\xfe\x0f\xfe\x0f\x02\x08\x02\x08\x00\x00\x00\x00\x00\x00"  # Code for char H
+    b"\x06\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x02\x08\x02\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char I
+    b"\x09\x00\x07\x00\x0f\x00\x08\x02\x08\x02\x08\xfe\x0f\xfe\x07\x02\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char J
+    b"\x0c\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x42\x08\xe2\x08\x90\x01\x10\x0b\x0a\x0e\x06\x0c\x02\x08\x02\x08\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char K
+    b"\x0a\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x02\x08\x02\x08\x00\x08\x00\x08\x00\x0c\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char L
+    b"\x10\x02\x08\x02\x08\xfe\x0f\x06\x08\x3e\x08\xf8\x01\xc0\x07\x00\x0e\x00\x03\xe0\x00\x18\x08\x06\x08\xfe\x0f\xfe\x0f\x02\x08\x02\x08"  # Code for char M
+    b"\x0c\x02\x08\x02\x08\xfe\x0f\x06\x08\x0e\x08\x38\x00\x70\x00\xc2\x01\x82\x03\xfe\x0f\x02\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char N
+    b"\x0c\x00\x00\xf0\x01\xf8\x03\x0c\x06\x06\x0c\x02\x08\x02\x08\x02\x08\x06\x0c\x0c\x06\xf8\x03\xf0\x01\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char O
+    b"\x0a\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x42\x08\x42\x08\x42\x00\x66\x00\x3c\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char P
+    b"\x0c\x00\x00\xf0\x01\xf8\x03\x0c\x06\x06\x0c\x02\x08\x02\x18\x02\x78\x06\x6c\x0c\x46\xf8\x43\xf0\x01\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char Q
+    b"\x0c\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x42\x08\x42\x08\xc2\x00\xc2\x03\x26\x0f\x3c\x0c\x18\x08\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char R
+    b"\x08\x00\x00\x1c\x0f\x3e\x04\x72\x08\x62\x08\xc2\x08\xc4\x0f\x9e\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char S
+    b"\x0a\x0e\x00\x02\x00\x02\x08\x02\x08\xfe\x0f\xfe\x0f\x02\x08\x02\x08\x02\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char T
+    b"\x0c\x02\x00\x02\x00\xfe\x03\xfe\x07\x02\x0c\x02\x08\x00\x08\x02\x08\x02\x04\xfe\x03\x02\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char U
+    b"\x0c\x02\x00\x02\x00\x0e\x00\x7e\x00\xf2\x01\x80\x0f\x00\x0e\xc0\x01\x32\x00\x0e\x00\x02\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char V
+    b"\x10\x02\x00\x0e\x00\x7e\x00\xf2\x01\x80\x0f\x02\x0f\xf2\x00\x0e\x00\x3e\x00\xfa\x01\xc0\x0f\x00\x0e\xc0\x01\x32\x00\x0e\x00\x02\x00"  # Code for char W
+    b"\x0c\x02\x08\x06\x08\x0e\x0c\x1e\x0a\x7a\x01\xe0\x01\xe0\x0b\x10\x0f\x0a\x0e\x06\x08\x02\x08\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char X
+    b"\x0b\x02\x00\x06\x00\x0e\x00\x3e\x08\x7a\x08\xe0\x0f\xc0\x0f\x22\x08\x1a\x08\x06\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char Y
+    b"\x0a\x00\x08\x1e\x0c\x06\x0f\x82\x0b\xc2\x09\x72\x08\x3a\x08\x1e\x08\x06\x0c\x02\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char Z
+    b"\x06\x00\x00\x00\x00\xfe\x7f\xfe\x7f\x02\x40\x02\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char [
+    b"\x05\x02\x00\x1c\x00\xe0\x00\x00\x07\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char BackSlash
+    b"\x04\x02\x40\x02\x40\xfe\x7f\xfe\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char ]
+    b"\x08\x00\x00\x40\x00\x30\x00\x0c\x00\x02\x00\x0c\x00\x30\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char ^
+    b"\x09\x00\x80\x00\x80\x00\x80\x00\x80\x00\x80\x00\x80\x00\x80\x00\x80\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char _
+    b"\x03\x00\x00\x02\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char `
+    b"\x08\x00\x00\x60\x06\x70\x0f\x10\x09\x90\x08\xf0\x0f\xe0\x0f\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char a
+    b"\x08\x02\x00\xfe\x0f\xfe\x07\x20\x08\x10\x08\x30\x0c\xe0\x07\xc0\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char b
+    b"\x07\x00\x00\xc0\x03\xe0\x07\x10\x0c\x10\x08\x30\x08\x20\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char c
+    b"\x09\x00\x00\xc0\x03\xe0\x07\x30\x0c\x10\x08\x22\x04\xfe\x0f\xfe\x0f\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char d
+    b"\x07\x00\x00\xe0\x07\xf0\x0f\x90\x08\x90\x08\xf0\x08\xe0\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char e
+    b"\x06\x10\x08\xfc\x0f\xfe\x0f\x12\x08\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char f
+    b"\x09\x00\x00\xc0\x79\xe0\x9f\x10\x9a\x10\x9a\x10\x9a\xf0\x99\xf0\x98\x10\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char g
+    b"\x09\x02\x08\xfe\x0f\xfe\x0f\x20\x08\x10\x00\x10\x08\xf0\x0f\xe0\x0f\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char h
+    b"\x05\x00\x00\x10\x08\xf6\x0f\xf6\x0f\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char i
+    b"\x04\x10\xc0\x10\x80\xf6\xff\xf6\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char j
+    b"\x09\x02\x08\xfe\x0f\xfe\x0f\x80\x08\xc0\x01\x30\x0b\x10\x0e\x10\x0c\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char k
+    b"\x05\x00\x00\x02\x08\xfe\x0f\xfe\x0f\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char l
+    b"\x0e\x10\x08\xf0\x0f\xf0\x0f\x20\x08\x10\x00\x10\x00\xf0\x0f\xe0\x0f\x20\x08\x10\x00\x10\x00\xf0\x0f\xe0\x0f\x00\x08\x00\x00\x00\x00"  # Code for char m
+    b"\x09\x10\x08\xf0\x0f\xf0\x0f\x20\x08\x10\x00\x10\x08\xf0\x0f\xe0\x0f\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char n
+    b"\x08\x00\x00\xe0\x07\xf0\x0f\x10\x08\x10\x08\x10\x08\xf0\x0f\xe0\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char o
+    b"\x08\x10\x80\xf0\xff\xf0\xff\x20\x84\x10\x08\x30\x0c\xe0\x07\xc0\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char p
+    b"\x09\x00\x00\xc0\x03\xe0\x07\x30\x0c\x10\x08\x10\x84\xe0\xff\xf0\xff\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char q
+    b"\x07\x00\x00\x10\x08\xf0\x0f\xf0\x0f\x20\x08\x10\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char r
+    b"\x06\x00\x00\xe0\x0c\xf0\x09\x90\x09\x90\x0f\x30\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char s
+    b"\x06\x10\x00\xf8\x07\xfc\x0f\x10\x08\x10\x08\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char t
+    b"\x09\x10\x00\xf0\x07\xf0\x0f\x00\x08\x00\x08\x10\x04\xf0\x0f\xf0\x0f\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char u
+    b"\x08\x10\x00\x70\x00\xf0\x03\xd0\x0f\x00\x0e\x90\x01\x70\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char v
+    b"\x0d\x10\x00\x30\x00\xf0\x01\xd0\x0f\x00\x0e\xd0\x01\x30\x00\xf0\x01\xd0\x0f\x00\x0e\xd0\x01\x30\x00\x10\x00\x00\x00\x00\x00\x00\x00"  # Code for char w
+    b"\x08\x10\x08\x30\x0c\xf0\x0a\xd0\x01\x80\x0b\x50\x0f\x30\x0c\x10\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char x
+    b"\x08\x10\xc0\x70\xc0\xf0\x81\x90\x77\x00\x0e\xd0\x01\x30\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char y
+    b"\x06\x30\x08\x10\x0e\x90\x0f\xf0\x09\x70\x0c\x10\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char z
+    b"\x06\x00\x00\x80\x00\x4c\x19\x7e\x3f\x32\x66\x02\x40\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char {
+    b"\x02\x00\x00\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char |
+    b"\x06\x00\x00\x02\x40\x32\x66\x7e\x3f\x4c\x19\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char }
     # 0x08, 0x00, 0x01, 0x80, 0x00, 0x80, 0x00, 0x80, 0x00, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char ~
-    0x08, 0x00, 0x00, 0x18, 0x00, 0x24, 0x00, 0x42, 0x00, 0x42, 0x00, 0x24, 0x00, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  ## Code for char °
-    0x04, 0xFC, 0x07, 0xFC, 0x07, 0xFC, 0x07, 0xFC, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])   ## Code for char 
+    b"\x08\x00\x00\x18\x00\x24\x00\x42\x00\x42\x00\x24\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char °
+    b"\x04\xfc\x07\xfc\x07\xfc\x07\xfc\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # Code for char 
+)
+# fmt: on
+
+Icons16x16 = BitmapFont(_DATA, 16, 16, header=4, glyph_header=1)
@@ -0,0 +1,55 @@
+class BitmapFont:
+    """Read-only access to a column major bitmap font kept in a bytes object.
+
+    Every glyph stores width columns of (height + 7) // 8 little endian bytes,
+    bit 0 being the top row. header skips bytes in front of the first glyph,
+    glyph_header bytes in front of each glyph (used for the proportional width
+    byte of GLCD fonts). Characters outside the font fall back to the first one.
+    """
+
+    def __init__(
+        self,
+        data: bytes,
+        width: int,
+        height: int,
+        first: int = 32,
+        header: int = 0,
+        glyph_header: int = 0,
+    ):
+        self._data = memoryview(data)
+        self.width = width
+        self.height = height
+        self._first = first
+        self._header = header
+        self._glyph_header = glyph_header
+        self._column_bytes = (height + 7) // 8
+        self._glyph_bytes = glyph_header + width * self._column_bytes
+        self._count = (len(data) - header) // self._glyph_bytes
+
+    def _offset(self, char: str) -> int:
+        index = ord(char) - self._first
+        if index < 0 or index >= self._count:
+            index = 0
+        return self._header + index * self._glyph_bytes
+
+    def glyph(self, char: str) -> memoryview:
+        """The column bytes of char, without the glyph header."""
+        start = self._offset(char) + self._glyph_header
+        return self._data[start : start + self.width * self._column_bytes]
+
+    def column(self, char: str, index: int) -> int:
+        """Bits of column index of char, bit 0 being the top row."""
+        start = self._offset(char) + self._glyph_header + index * self._column_bytes
+        value = 0
+        for byte in range(self._column_bytes):
+            value |= self._data[start + byte] << (8 * byte)
+        return value
+
+    def char_width(self, char: str) -> int:
+        """Columns used by char, less than width for proportional fonts."""
+        if self._glyph_header:
+            return self._data[self._offset(char)]
+        return self.width
+
+    def __len__(self) -> int:
+        return self._count
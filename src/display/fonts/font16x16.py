@@ -1,101 +1,105 @@
+from display.fonts.bitmap import BitmapFont
+
 # fmt: off
-font = [
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,  # 32=
-    0x0000, 0x0000, 0x0000, 0x0F00, 0x0F00, 0x0F00, 0x0F00, 0x0F00, 0x0F00, 0x0F00, 0x0F00, 0x0000, 0x0000, 0x0F00, 0x0F00, 0x0000,  # 33=!
-    0x0000, 0x3C00, 0x3C00, 0x3C00, 0x3C00, 0x1800, 0x1800, 0x0000, 0x0000, 0x3C00, 0x3C00, 0x3C00, 0x3C00, 0x1800, 0x1800, 0x0000,  # 34="
-    0x0000, 0x0C30, 0x0C30, 0x3FFC, 0x3FFC, 0x0C30, 0x0C30, 0x0C30, 0x3FFC, 0x3FFC, 0x0C30, 0x0C30, 0x0000, 0x0000, 0x0000, 0x0000,  # 35=#
-    0x0000, 0x0600, 0x0F00, 0x1F80, 0x1980, 0xFFFE, 0xFFFE, 0x1980, 0x1980, 0xF180, 0xFF00, 0x7E00, 0x0600, 0x0600, 0x0000, 0x0000,  # 36=$
-    0x0000, 0x0000, 0x0000, 0x3078, 0x38CC, 0x18CC, 0x1D98, 0x0F30, 0x0660, 0x0CC0, 0x19E0, 0x31F0, 0x30D8, 0x6078, 0x0000, 0x0000,  # 37=%
-    0x0000, 0x1F00, 0x3F80, 0x31C0, 0x3180, 0x3B80, 0x1F00, 0x1E00, 0x3F8E, 0x73CE, 0x61FC, 0x60F8, 0x70F0, 0x3FF0, 0x1FE0, 0x0000,  # 38=&
-    0x0000, 0x0000, 0x0000, 0x000C, 0x000C, 0x0018, 0x0018, 0x0030, 0x0030, 0x0060, 0x00C0, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,  # 39='
-    0x0000, 0x00F0, 0x01F8, 0x03DC, 0x038C, 0x0718, 0x0700, 0x0600, 0x0600, 0x0700, 0x0718, 0x038C, 0x03DC, 0x01F8, 0x00F0, 0x0000,  # 40=(
-    0x0000, 0xF000, 0xF800, 0xDC00, 0x8E00, 0x8700, 0x0300, 0x0300, 0x0300, 0x0700, 0x8E00, 0xDC00, 0xF800, 0xF000, 0x0000, 0x0000,  # 41=)
-    0x0000, 0x0000, 0x0000, 0x0000, 0x00C0, 0x06C0, 0x0FC0, 0x3FF0, 0x3FF0, 0x0FC0, 0x06C0, 0x00C0, 0x0000, 0x0000, 0x0000, 0x0000,  # 42=*
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0300, 0x0300, 0x3FFC, 0x3FFC, 0x0300, 0x0300, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,  # 43=+
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0F00, 0x0F00, 0x0700, 0x0700, 0x0600, 0x0600, 0x0C00, 0x0000,  # 44=,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x3FFC, 0x3FFC, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,  # 45=-
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0F00, 0x0F00, 0x0F00, 0x0F00, 0x0000, 0x0000, 0x0000, 0x0000,  # 46=.
-    0x0000, 0x0000, 0x0000, 0x0000, 0x1800, 0x1C00, 0x0E00, 0x0600, 0x0300, 0x0380, 0x01C0, 0x00E0, 0x0070, 0x0038, 0x0018, 0x0000,  # 47=/
+_DATA = (
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 32=
+    b"\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x00\x00\x00\x00\x0f\x00\x0f\x00\x00"  # 33=!
+    b"\x00\x00\x00\x3c\x00\x3c\x00\x3c\x00\x3c\x00\x18\x00\x18\x00\x00\x00\x00\x00\x3c\x00\x3c\x00\x3c\x00\x3c\x00\x18\x00\x18\x00\x00"  # 34="
+    b"\x00\x00\x30\x0c\x30\x0c\xfc\x3f\xfc\x3f\x30\x0c\x30\x0c\x30\x0c\xfc\x3f\xfc\x3f\x30\x0c\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00"  # 35=#
+    b"\x00\x00\x00\x06\x00\x0f\x80\x1f\x80\x19\xfe\xff\xfe\xff\x80\x19\x80\x19\x80\xf1\x00\xff\x00\x7e\x00\x06\x00\x06\x00\x00\x00\x00"  # 36=$
+    b"\x00\x00\x00\x00\x00\x00\x78\x30\xcc\x38\xcc\x18\x98\x1d\x30\x0f\x60\x06\xc0\x0c\xe0\x19\xf0\x31\xd8\x30\x78\x60\x00\x00\x00\x00"  # 37=%
+    b"\x00\x00\x00\x1f\x80\x3f\xc0\x31\x80\x31\x80\x3b\x00\x1f\x00\x1e\x8e\x3f\xce\x73\xfc\x61\xf8\x60\xf0\x70\xf0\x3f\xe0\x1f\x00\x00"  # 38=&
+    b"\x00\x00\x00\x00\x00\x00\x0c\x00\x0c\x00\x18\x00\x18\x00\x30\x00\x30\x00\x60\x00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 39='
+    b"\x00\x00\xf0\x00\xf8\x01\xdc\x03\x8c\x03\x18\x07\x00\x07\x00\x06\x00\x06\x00\x07\x18\x07\x8c\x03\xdc\x03\xf8\x01\xf0\x00\x00\x00"  # 40=(
+    b"\x00\x00\x00\xf0\x00\xf8\x00\xdc\x00\x8e\x00\x87\x00\x03\x00\x03\x00\x03\x00\x07\x00\x8e\x00\xdc\x00\xf8\x00\xf0\x00\x00\x00\x00"  # 41=)
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc0\x06\xc0\x0f\xf0\x3f\xf0\x3f\xc0\x0f\xc0\x06\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 42=*
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x00\x03\xfc\x3f\xfc\x3f\x00\x03\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 43=+
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x0f\x00\x07\x00\x07\x00\x06\x00\x06\x00\x0c\x00\x00"  # 44=,
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\x3f\xfc\x3f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 45=-
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00"  # 46=.
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x1c\x00\x0e\x00\x06\x00\x03\x80\x03\xc0\x01\xe0\x00\x70\x00\x38\x00\x18\x00\x00\x00"  # 47=/
     # 0x0000, 0x0000, 0x8000, 0xC000, 0x6000, 0x3000, 0x1800, 0x0C00, 0x0600, 0x0300, 0x0180, 0x00C0, 0x0060, 0x0030, 0x0018, 0x0000, # 47=/
-    0x03F0, 0x0FFC, 0x1FFE, 0x3C0F, 0x3807, 0x7003, 0x7003, 0x7003, 0x7003, 0x7003, 0x3807, 0x3C0F, 0x1FFE, 0x0FFC, 0x03F0, 0x0000,  # 48=0
-    0x0080, 0x0180, 0x0380, 0x0780, 0x0F80, 0x1F80, 0x3F80, 0x7F80, 0x0780, 0x0780, 0x0780, 0x0780, 0x3FFC, 0x3FFC, 0x0000, 0x0000,  # 49=1
-    0x07E0, 0x1FF8, 0x3FFC, 0x381E, 0x300E, 0x001E, 0x003C, 0x0078, 0x00F0, 0x01E0, 0x03C0, 0x0780, 0x3FFF, 0x3FFF, 0x0000, 0x0000,  # 50=2
-    0x0FF0, 0x3FFC, 0x3FFC, 0x001E, 0x003C, 0x07F8, 0x07F0, 0x001E, 0x000F, 0x0007, 0x3007, 0x3C0F, 0x3FFE, 0x1FFC, 0x07F0, 0x0000,  # 51=3
-    0x0078, 0x00F8, 0x01F8, 0x03B8, 0x0738, 0x0E38, 0x1C38, 0x3838, 0x7FFF, 0x7FFF, 0x0038, 0x0038, 0x0038, 0x0038, 0x0000, 0x0000,  # 52=4
-    0x3FFC, 0x3FFC, 0x3000, 0x3000, 0x3FF0, 0x3FF8, 0x001C, 0x000E, 0x0007, 0x0007, 0x3007, 0x3C0F, 0x3FFE, 0x1FFC, 0x07F0, 0x0000,  # 53=5
-    0x03F0, 0x0FFC, 0x1FFE, 0x3C0F, 0x3807, 0x7000, 0x7FF0, 0x7FF8, 0x700C, 0x380E, 0x3C0F, 0x1FFE, 0x0FFC, 0x03F0, 0x0000, 0x0000,  # 54=6
-    0x3FFF, 0x3FFF, 0x0007, 0x000E, 0x001E, 0x003C, 0x0078, 0x00F0, 0x01E0, 0x03C0, 0x0780, 0x0F00, 0x1E00, 0x1E00, 0x0000, 0x0000,  # 55=7
-    0x07F0, 0x1FFC, 0x3FFE, 0x380F, 0x3007, 0x380F, 0x1FFE, 0x0FFC, 0x1FFE, 0x380F, 0x3007, 0x3C0F, 0x3FFE, 0x1FFC, 0x07F0, 0x0000,  # 56=8
-    0x07E0, 0x1FF8, 0x3FFC, 0x3C0E, 0x7006, 0x7007, 0x3FFF, 0x1FFF, 0x0007, 0x0007, 0x3807, 0x3C0F, 0x1FFE, 0x0FFC, 0x03F0, 0x0000,  # 57=9
-    0x0000, 0x0000, 0x0600, 0x0F00, 0x0F00, 0x0600, 0x0000, 0x0000, 0x0000, 0x0600, 0x0F00, 0x0F00, 0x0600, 0x0000, 0x0000, 0x0000,  # 58=:
-    0x0000, 0x0000, 0x0600, 0x0F00, 0x0F00, 0x0600, 0x0000, 0x0000, 0x0000, 0x0600, 0x0F00, 0x0F00, 0x0700, 0x0100, 0x0000, 0x0000,  # 59=;
-    0x000E, 0x001E, 0x003E, 0x007C, 0x00F8, 0x01F0, 0x03E0, 0x07C0, 0x07C0, 0x03E0, 0x01F0, 0x00F8, 0x007C, 0x003E, 0x001E, 0x000E,  # 60=<
-    0x0000, 0x0000, 0x0000, 0x0000, 0x7FFC, 0x7FFC, 0x0000, 0x0000, 0x0000, 0x0000, 0x7FFC, 0x7FFC, 0x0000, 0x0000, 0x0000, 0x0000,  # 61 =
-    0x7000, 0x7800, 0x3C00, 0x1E00, 0x0F00, 0x0780, 0x03C0, 0x01E0, 0x01E0, 0x03C0, 0x0780, 0x0F00, 0x1E00, 0x3C00, 0x7800, 0x7000,  # 62 >
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0180, 0x03C0, 0x07E0, 0x0FF0, 0x1FF8, 0x3FFC, 0x7FFE, 0x7FFE, 0x0000, 0x0000, 0x0000, 0x0000,  # 63 ?
-    0x0FF0, 0x1FF8, 0x387C, 0x30CC, 0x33CC, 0x37EC, 0x37EC, 0x37EC, 0x37EC, 0x37EC, 0x37EC, 0x30C0, 0x387C, 0x1FF8, 0x0FF0, 0x0000,  # 64 @
-    0x0E00, 0x1F00, 0x3F80, 0x3F80, 0x33C0, 0x33C0, 0x71E0, 0x71E0, 0x7FF0, 0x7FF0, 0x7FF0, 0x60F0, 0xE078, 0xE078, 0xE078, 0x0000,  # 65 A
-    0x7FE0, 0x7FF0, 0x71F8, 0x70F8, 0x71F0, 0x7FE0, 0x7FF0, 0x71F8, 0x70F8, 0x70F8, 0x71F8, 0x7FF0, 0x7FE0, 0x0000, 0x0000, 0x0000,  # 66 B
-    0x0FF0, 0x1FF8, 0x3C3C, 0x783C, 0x700C, 0x7000, 0x7000, 0x7000, 0x7000, 0x700C, 0x783C, 0x3C3C, 0x1FF8, 0x0FF0, 0x0000, 0x0000,  # 67 C
-    0x7FC0, 0x7FE0, 0x71F0, 0x70F8, 0x70F8, 0x70F8, 0x70F8, 0x70F8, 0x70F8, 0x71F0, 0x7FE0, 0x7FC0, 0x0000, 0x0000, 0x0000, 0x0000,  # 68 D
-    0x7FFC, 0x7FFC, 0x7000, 0x7000, 0x7000, 0x7FF0, 0x7FF0, 0x7000, 0x7000, 0x7000, 0x7FFC, 0x7FFC, 0x0000, 0x0000, 0x0000, 0x0000,  # 69 E
-    0x7FFC, 0x7FFC, 0x7000, 0x7000, 0x7000, 0x7FF0, 0x7FF0, 0x7000, 0x7000, 0x7000, 0x7000, 0x7000, 0x0000, 0x0000, 0x0000, 0x0000,  # 70 F
-    0x0FF0, 0x1FF8, 0x3C3C, 0x783C, 0x700C, 0x7000, 0x707E, 0x707E, 0x700C, 0x783C, 0x3C3C, 0x1FF8, 0x0FF0, 0x0000, 0x0000, 0x0000,  # 71 G
-    0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x7FF0, 0x7FF0, 0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x0000, 0x0000, 0x0000, 0x0000,  # 72 H
-    0x1FF8, 0x1FF8, 0x0380, 0x0380, 0x0380, 0x0380, 0x0380, 0x0380, 0x0380, 0x0380, 0x1FF8, 0x1FF8, 0x0000, 0x0000, 0x0000, 0x0000,  # 73 I
-    0x007E, 0x007E, 0x000E, 0x000E, 0x000E, 0x000E, 0x000E, 0x000E, 0x700E, 0x780E, 0x3C3C, 0x1FF8, 0x0FF0, 0x0000, 0x0000, 0x0000,  # 74 J
-    0x7078, 0x70F0, 0x71E0, 0x73C0, 0x7780, 0x7F00, 0x7F00, 0x7780, 0x73C0, 0x71E0, 0x70F0, 0x7078, 0x0000, 0x0000, 0x0000, 0x0000,  # 75 K
-    0x7000, 0x7000, 0x7000, 0x7000, 0x7000, 0x7000, 0x7000, 0x7000, 0x7000, 0x7000, 0x7FFC, 0x7FFC, 0x0000, 0x0000, 0x0000, 0x0000,  # 76 L
-    0xE038, 0xF87C, 0xFC7C, 0xFC7C, 0xFEFC, 0xF6EC, 0xF6EC, 0xF6EC, 0xF6EC, 0xE038, 0xE038, 0xE038, 0x0000, 0x0000, 0x0000, 0x0000,  # 77 M
-    0x7070, 0x7870, 0x7C70, 0x7E70, 0x7F70, 0x77F0, 0x73F0, 0x71F0, 0x70F8, 0x70F8, 0x7078, 0x7070, 0x0000, 0x0000, 0x0000, 0x0000,  # 78 N
-    0x0FF0, 0x1FF8, 0x3C3C, 0x783C, 0x700C, 0x700C, 0x700C, 0x700C, 0x700C, 0x783C, 0x3C3C, 0x1FF8, 0x0FF0, 0x0000, 0x0000, 0x0000,  # 79 O
-    0x7FE0, 0x7FF0, 0x71F8, 0x70F8, 0x71F8, 0x7FF0, 0x7FE0, 0x7000, 0x7000, 0x7000, 0x7000, 0x7000, 0x0000, 0x0000, 0x0000, 0x0000,  # 80 P
-    0x0FF0, 0x1FF8, 0x3C3C, 0x783C, 0x700C, 0x700C, 0x700C, 0x70FC, 0x70FC, 0x783C, 0x3C3C, 0x1FF8, 0x0FF8, 0x001C, 0x000E, 0x0006,  # 81 Q
-    0x7FE0, 0x7FF0, 0x71F8, 0x70F8, 0x71F8, 0x7FF0, 0x7FE0, 0x73C0, 0x71E0, 0x70F0, 0x70F8, 0x707C, 0x0000, 0x0000, 0x0000, 0x0000,  # 82 R
-    0x0FF0, 0x1FF8, 0x3C3C, 0x783C, 0x7000, 0x7F00, 0x7FE0, 0x1FF0, 0x01F8, 0x003C, 0x703C, 0x3C3C, 0x1FF8, 0x0FF0, 0x0000, 0x0000,  # 83 S
-    0x7FFC, 0x7FFC, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x0000, 0x0000, 0x0000, 0x0000,  # 84 T
-    0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x38E0, 0x1FC0, 0x0F80, 0x0000, 0x0000, 0x0000,  # 85 U
-    0x7070, 0x7070, 0x38E0, 0x38E0, 0x38E0, 0x1DC0, 0x1DC0, 0x1DC0, 0x0F80, 0x0F80, 0x0F80, 0x0700, 0x0000, 0x0000, 0x0000, 0x0000,  # 86 V
-    0xE038, 0xE038, 0xE038, 0xF6EC, 0xF6EC, 0xF6EC, 0x7FFC, 0x7FFC, 0x7FFC, 0x3C78, 0x3C78, 0x3C78, 0x0000, 0x0000, 0x0000, 0x0000,  # 87 W
-    0x7070, 0x38E0, 0x1DC0, 0x0F80, 0x0700, 0x0700, 0x0F80, 0x1DC0, 0x38E0, 0x7070, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,  # 88 X
-    0x7070, 0x38E0, 0x1DC0, 0x0F80, 0x0700, 0x0700, 0x0700, 0x0700, 0x0700, 0x0700, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,  # 89 Y
-    0x7FFC, 0x7FFC, 0x0038, 0x0070, 0x00E0, 0x01C0, 0x0380, 0x0700, 0x0E00, 0x1C00, 0x7FFC, 0x7FFC, 0x0000, 0x0000, 0x0000, 0x0000,  # 90 Z
-    0x1FF8, 0x1FF8, 0x1C00, 0x1C00, 0x1C00, 0x1C00, 0x1C00, 0x1C00, 0x1C00, 0x1C00, 0x1FF8, 0x1FF8, 0x0000, 0x0000, 0x0000, 0x0000,  # 91 [
-    0x7000, 0x3800, 0x1C00, 0x0E00, 0x0700, 0x0380, 0x01C0, 0x00E0, 0x0070, 0x0038, 0x001C, 0x000E, 0x0000, 0x0000, 0x0000, 0x0000,  # 92 \
-    0x1FF8, 0x1FF8, 0x0038, 0x0038, 0x0038, 0x0038, 0x0038, 0x0038, 0x0038, 0x0038, 0x1FF8, 0x1FF8, 0x0000, 0x0000, 0x0000, 0x0000,  # 93 ]
-    0x00E0, 0x01F0, 0x03F8, 0x073C, 0x0E1C, 0x1C0E, 0x3807, 0x7003, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,  # 94 ^
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7FFC, 0x7FFC, 0x0000, 0x0000, 0x0000, 0x0000,  # 95 _
-    0x1C00, 0x1E00, 0x0F00, 0x0700, 0x0380, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,  # 96 `
-    0x0000, 0x0000, 0x0000, 0x0FF0, 0x1FF8, 0x3878, 0x7078, 0x7FF8, 0x7FF8, 0x7078, 0x7878, 0x3FFF, 0x1F3F, 0x0000, 0x0000, 0x0000,  # 97 a
-    0x7000, 0x7000, 0x7000, 0x7FE0, 0x7FF0, 0x71F8, 0x70F8, 0x70F8, 0x70F8, 0x71F8, 0x7FF0, 0x7FE0, 0x0000, 0x0000, 0x0000, 0x0000,  # 98 b
-    0x0000, 0x0000, 0x0000, 0x0FF0, 0x1FF8, 0x3C3C, 0x781C, 0x7000, 0x7000, 0x781C, 0x3C3C, 0x1FF8, 0x0FF0, 0x0000, 0x0000, 0x0000,  # 99 c
-    0x0038, 0x0038, 0x0038, 0x0FF8, 0x1FF8, 0x3C38, 0x7818, 0x7018, 0x7018, 0x7818, 0x3C38, 0x1FF8, 0x0FF8, 0x0000, 0x0000, 0x0000,  # 100 d
-    0x0000, 0x0000, 0x0000, 0x0FF0, 0x1FF8, 0x3C3C, 0x783C, 0x7FFC, 0x7FFC, 0x7000, 0x781C, 0x3C3C, 0x1FF8, 0x0FF0, 0x0000, 0x0000,  # 101 e
-    0x00F8, 0x01FC, 0x03C0, 0x03C0, 0x3FFC, 0x3FFC, 0x03C0, 0x03C0, 0x03C0, 0x03C0, 0x03C0, 0x03C0, 0x0000, 0x0000, 0x0000, 0x0000,  # 102 f
-    0x0000, 0x0000, 0x0FF8, 0x1FF8, 0x3C3C, 0x781C, 0x701C, 0x7FFC, 0x3FFC, 0x003C, 0x3C3C, 0x1FF8, 0x0FF0, 0x0000, 0x0000, 0x0000,  # 103 g
-    0x7000, 0x7000, 0x7000, 0x7FE0, 0x7FF0, 0x71F8, 0x70F8, 0x70F8, 0x70F8, 0x70F8, 0x70F8, 0x70F8, 0x0000, 0x0000, 0x0000, 0x0000,  # 104 h
-    0x00E0, 0x00E0, 0x0000, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x0000, 0x0000, 0x0000, 0x0000,  # 105 i
-    0x0038, 0x0038, 0x0000, 0x0038, 0x0038, 0x0038, 0x0038, 0x0038, 0x0038, 0x0038, 0x0038, 0x3FF8, 0x1FF0, 0x0000, 0x0000, 0x0000,  # 106 j
-    0x7000, 0x7000, 0x7000, 0x7078, 0x70F0, 0x71E0, 0x73C0, 0x7F80, 0x7F80, 0x71E0, 0x70F0, 0x7078, 0x0000, 0x0000, 0x0000, 0x0000,  # 107 k
-    0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x0000, 0x0000, 0x0000, 0x0000,  # 108 l
-    0x0000, 0x0000, 0x0000, 0x7CFC, 0x7FFE, 0x7E76, 0x7676, 0x7676, 0x7676, 0x7676, 0x7676, 0x7676, 0x0000, 0x0000, 0x0000, 0x0000,  # 109 m
-    0x0000, 0x0000, 0x0000, 0x7FE0, 0x7FF0, 0x71F8, 0x70F8, 0x70F8, 0x70F8, 0x70F8, 0x70F8, 0x70F8, 0x0000, 0x0000, 0x0000, 0x0000,  # 110 n
-    0x0000, 0x0000, 0x0000, 0x0FF0, 0x1FF8, 0x3C3C, 0x781C, 0x701C, 0x701C, 0x781C, 0x3C3C, 0x1FF8, 0x0FF0, 0x0000, 0x0000, 0x0000,  # 111 o
-    0x0000, 0x0000, 0x0000, 0x7FE0, 0x7FF0, 0x71F8, 0x70F8, 0x70F8, 0x71F8, 0x7FF0, 0x7FE0, 0x7000, 0x7000, 0x0000, 0x0000, 0x0000,  # 112 p
-    0x0000, 0x0000, 0x0000, 0x0FF8, 0x1FF8, 0x3C38, 0x7818, 0x7018, 0x7018, 0x7818, 0x3C38, 0x1FF8, 0x0FF8, 0x0038, 0x0038, 0x0038,  # 113 q
-    0x0000, 0x0000, 0x0000, 0x7FE0, 0x7FF0, 0x71F8, 0x70F8, 0x7000, 0x7000, 0x7000, 0x7000, 0x7000, 0x0000, 0x0000, 0x0000, 0x0000,  # 114 r
-    0x0000, 0x0000, 0x0000, 0x0FF0, 0x1FF8, 0x3C3C, 0x7000, 0x3FF0, 0x1FF8, 0x001C, 0x3C3C, 0x1FF8, 0x0FF0, 0x0000, 0x0000, 0x0000,  # 115 s
-    0x00E0, 0x00E0, 0x00E0, 0x3FFC, 0x3FFC, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x01F8, 0x00F8, 0x0000, 0x0000, 0x0000, 0x0000,  # 116 t
-    0x0000, 0x0000, 0x0000, 0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x7870, 0x3FFF, 0x1F3F, 0x0000, 0x0000, 0x0000, 0x0000,  # 117 u
-    0x0000, 0x0000, 0x0000, 0x7070, 0x7070, 0x7870, 0x3CF0, 0x3CF0, 0x1DE0, 0x1DE0, 0x0FC0, 0x0FC0, 0x0000, 0x0000, 0x0000, 0x0000,  # 118 v
-    0x0000, 0x0000, 0x0000, 0x7038, 0x7038, 0x7738, 0x7778, 0x3F78, 0x3F78, 0x3F78, 0x1E70, 0x1E70, 0x0000, 0x0000, 0x0000, 0x0000,  # 119 w
-    0x0000, 0x0000, 0x0000, 0x7070, 0x78F0, 0x3DE0, 0x1FC0, 0x0F80, 0x0F80, 0x1FC0, 0x3DE0, 0x78F0, 0x7070, 0x0000, 0x0000, 0x0000,  # 120 x
-    0x0000, 0x0000, 0x0000, 0x7070, 0x7070, 0x7070, 0x7870, 0x3FF0, 0x1FF0, 0x0070, 0x00F0, 0x1FE0, 0x0FC0, 0x0000, 0x0000, 0x0000,  # 121 y
-    0x0000, 0x0000, 0x0000, 0x3FFC, 0x3FFC, 0x0038, 0x0070, 0x00E0, 0x01C0, 0x0380, 0x0700, 0x3FFC, 0x3FFC, 0x0000, 0x0000, 0x0000,  # 122 z
-    0x00F8, 0x01F0, 0x01C0, 0x0380, 0x0380, 0x0700, 0x0E00, 0x1C00, 0x0E00, 0x0700, 0x0380, 0x0380, 0x01C0, 0x01F0, 0x00F8, 0x0000,  # 123 {
-    0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x00E0, 0x0000,  # 124 |
-    0x1F00, 0x0F80, 0x0380, 0x01C0, 0x01C0, 0x00E0, 0x0070, 0x0038, 0x0070, 0x00E0, 0x01C0, 0x01C0, 0x0380, 0x0F80, 0x1F00, 0x0000,  # 125 }
-    0x0000, 0x0000, 0x0000, 0x1C70, 0x3EF8, 0x3FFC, 0x1FFC, 0x0E38, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,  # 126 ~
-    0x0000, 0x0000, 0x0000, 0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x7070, 0x7870, 0x3FFF, 0x1F3F, 0x0000, 0x0000, 0x0000, 0x0000,  # 127 DEL
-]
-# fmt on
+    b"\xf0\x03\xfc\x0f\xfe\x1f\x0f\x3c\x07\x38\x03\x70\x03\x70\x03\x70\x03\x70\x03\x70\x07\x38\x0f\x3c\xfe\x1f\xfc\x0f\xf0\x03\x00\x00"  # 48=0
+    b"\x80\x00\x80\x01\x80\x03\x80\x07\x80\x0f\x80\x1f\x80\x3f\x80\x7f\x80\x07\x80\x07\x80\x07\x80\x07\xfc\x3f\xfc\x3f\x00\x00\x00\x00"  # 49=1
+    b"\xe0\x07\xf8\x1f\xfc\x3f\x1e\x38\x0e\x30\x1e\x00\x3c\x00\x78\x00\xf0\x00\xe0\x01\xc0\x03\x80\x07\xff\x3f\xff\x3f\x00\x00\x00\x00"  # 50=2
+    b"\xf0\x0f\xfc\x3f\xfc\x3f\x1e\x00\x3c\x00\xf8\x07\xf0\x07\x1e\x00\x0f\x00\x07\x00\x07\x30\x0f\x3c\xfe\x3f\xfc\x1f\xf0\x07\x00\x00"  # 51=3
+    b"\x78\x00\xf8\x00\xf8\x01\xb8\x03\x38\x07\x38\x0e\x38\x1c\x38\x38\xff\x7f\xff\x7f\x38\x00\x38\x00\x38\x00\x38\x00\x00\x00\x00\x00"  # 52=4
+    b"\xfc\x3f\xfc\x3f\x00\x30\x00\x30\xf0\x3f\xf8\x3f\x1c\x00\x0e\x00\x07\x00\x07\x00\x07\x30\x0f\x3c\xfe\x3f\xfc\x1f\xf0\x07\x00\x00"  # 53=5
+    b"\xf0\x03\xfc\x0f\xfe\x1f\x0f\x3c\x07\x38\x00\x70\xf0\x7f\xf8\x7f\x0c\x70\x0e\x38\x0f\x3c\xfe\x1f\xfc\x0f\xf0\x03\x00\x00\x00\x00"  # 54=6
+    b"\xff\x3f\xff\x3f\x07\x00\x0e\x00\x1e\x00\x3c\x00\x78\x00\xf0\x00\xe0\x01\xc0\x03\x80\x07\x00\x0f\x00\x1e\x00\x1e\x00\x00\x00\x00"  # 55=7
+    b"\xf0\x07\xfc\x1f\xfe\x3f\x0f\x38\x07\x30\x0f\x38\xfe\x1f\xfc\x0f\xfe\x1f\x0f\x38\x07\x30\x0f\x3c\xfe\x3f\xfc\x1f\xf0\x07\x00\x00"  # 56=8
+    b"\xe0\x07\xf8\x1f\xfc\x3f\x0e\x3c\x06\x70\x07\x70\xff\x3f\xff\x1f\x07\x00\x07\x00\x07\x38\x0f\x3c\xfe\x1f\xfc\x0f\xf0\x03\x00\x00"  # 57=9
+    b"\x00\x00\x00\x00\x00\x06\x00\x0f\x00\x0f\x00\x06\x00\x00\x00\x00\x00\x00\x00\x06\x00\x0f\x00\x0f\x00\x06\x00\x00\x00\x00\x00\x00"  # 58=:
+    b"\x00\x00\x00\x00\x00\x06\x00\x0f\x00\x0f\x00\x06\x00\x00\x00\x00\x00\x00\x00\x06\x00\x0f\x00\x0f\x00\x07\x00\x01\x00\x00\x00\x00"  # 59=;
+    b"\x0e\x00\x1e\x00\x3e\x00\x7c\x00\xf8\x00\xf0\x01\xe0\x03\xc0\x07\xc0\x07\xe0\x03\xf0\x01\xf8\x00\x7c\x00\x3e\x00\x1e\x00\x0e\x00"  # 60=<
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\xfc\x7f\xfc\x7f\x00\x00\x00\x00\x00\x00\x00\x00\xfc\x7f\xfc\x7f\x00\x00\x00\x00\x00\x00\x00\x00"  # 61 =
+    b"\x00\x70\x00\x78\x00\x3c\x00\x1e\x00\x0f\x80\x07\xc0\x03\xe0\x01\xe0\x01\xc0\x03\x80\x07\x00\x0f\x00\x1e\x00\x3c\x00\x78\x00\x70"  # 62 >
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x80\x01\xc0\x03\xe0\x07\xf0\x0f\xf8\x1f\xfc\x3f\xfe\x7f\xfe\x7f\x00\x00\x00\x00\x00\x00\x00\x00"  # 63 ?
+    b"\xf0\x0f\xf8\x1f\x7c\x38\xcc\x30\xcc\x33\xec\x37\xec\x37\xec\x37\xec\x37\xec\x37\xec\x37\xc0\x30\x7c\x38\xf8\x1f\xf0\x0f\x00\x00"  # 64 @
+    b"\x00\x0e\x00\x1f\x80\x3f\x80\x3f\xc0\x33\xc0\x33\xe0\x71\xe0\x71\xf0\x7f\xf0\x7f\xf0\x7f\xf0\x60\x78\xe0\x78\xe0\x78\xe0\x00\x00"  # 65 A
+    b"\xe0\x7f\xf0\x7f\xf8\x71\xf8\x70\xf0\x71\xe0\x7f\xf0\x7f\xf8\x71\xf8\x70\xf8\x70\xf8\x71\xf0\x7f\xe0\x7f\x00\x00\x00\x00\x00\x00"  # 66 B
+    b"\xf0\x0f\xf8\x1f\x3c\x3c\x3c\x78\x0c\x70\x00\x70\x00\x70\x00\x70\x00\x70\x0c\x70\x3c\x78\x3c\x3c\xf8\x1f\xf0\x0f\x00\x00\x00\x00"  # 67 C
+    b"\xc0\x7f\xe0\x7f\xf0\x71\xf8\x70\xf8\x70\xf8\x70\xf8\x70\xf8\x70\xf8\x70\xf0\x71\xe0\x7f\xc0\x7f\x00\x00\x00\x00\x00\x00\x00\x00"  # 68 D
+    b"\xfc\x7f\xfc\x7f\x00\x70\x00\x70\x00\x70\xf0\x7f\xf0\x7f\x00\x70\x00\x70\x00\x70\xfc\x7f\xfc\x7f\x00\x00\x00\x00\x00\x00\x00\x00"  # 69 E
+    b"\xfc\x7f\xfc\x7f\x00\x70\x00\x70\x00\x70\xf0\x7f\xf0\x7f\x00\x70\x00\x70\x00\x70\x00\x70\x00\x70\x00\x00\x00\x00\x00\x00\x00\x00"  # 70 F
+    b"\xf0\x0f\xf8\x1f\x3c\x3c\x3c\x78\x0c\x70\x00\x70\x7e\x70\x7e\x70\x0c\x70\x3c\x78\x3c\x3c\xf8\x1f\xf0\x0f\x00\x00\x00\x00\x00\x00"  # 71 G
+    b"\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\xf0\x7f\xf0\x7f\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x00\x00\x00\x00\x00\x00\x00\x00"  # 72 H
+    b"\xf8\x1f\xf8\x1f\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\xf8\x1f\xf8\x1f\x00\x00\x00\x00\x00\x00\x00\x00"  # 73 I
+    b"\x7e\x00\x7e\x00\x0e\x00\x0e\x00\x0e\x00\x0e\x00\x0e\x00\x0e\x00\x0e\x70\x0e\x78\x3c\x3c\xf8\x1f\xf0\x0f\x00\x00\x00\x00\x00\x00"  # 74 J
+    b"\x78\x70\xf0\x70\xe0\x71\xc0\x73\x80\x77\x00\x7f\x00\x7f\x80\x77\xc0\x73\xe0\x71\xf0\x70\x78\x70\x00\x00\x00\x00\x00\x00\x00\x00"  # 75 K
+    b"\x00\x70\x00\x70\x00\x70\x00\x70\x00\x70\x00\x70\x00\x70\x00\x70\x00\x70\x00\x70\xfc\x7f\xfc\x7f\x00\x00\x00\x00\x00\x00\x00\x00"  # 76 L
+    b"\x38\xe0\x7c\xf8\x7c\xfc\x7c\xfc\xfc\xfe\xec\xf6\xec\xf6\xec\xf6\xec\xf6\x38\xe0\x38\xe0\x38\xe0\x00\x00\x00\x00\x00\x00\x00\x00"  # 77 M
+    b"\x70\x70\x70\x78\x70\x7c\x70\x7e\x70\x7f\xf0\x77\xf0\x73\xf0\x71\xf8\x70\xf8\x70\x78\x70\x70\x70\x00\x00\x00\x00\x00\x00\x00\x00"  # 78 N
+    b"\xf0\x0f\xf8\x1f\x3c\x3c\x3c\x78\x0c\x70\x0c\x70\x0c\x70\x0c\x70\x0c\x70\x3c\x78\x3c\x3c\xf8\x1f\xf0\x0f\x00\x00\x00\x00\x00\x00"  # 79 O
+    b"\xe0\x7f\xf0\x7f\xf8\x71\xf8\x70\xf8\x71\xf0\x7f\xe0\x7f\x00\x70\x00\x70\x00\x70\x00\x70\x00\x70\x00\x00\x00\x00\x00\x00\x00\x00"  # 80 P
+    b"\xf0\x0f\xf8\x1f\x3c\x3c\x3c\x78\x0c\x70\x0c\x70\x0c\x70\xfc\x70\xfc\x70\x3c\x78\x3c\x3c\xf8\x1f\xf8\x0f\x1c\x00\x0e\x00\x06\x00"  # 81 Q
+    b"\xe0\x7f\xf0\x7f\xf8\x71\xf8\x70\xf8\x71\xf0\x7f\xe0\x7f\xc0\x73\xe0\x71\xf0\x70\xf8\x70\x7c\x70\x00\x00\x00\x00\x00\x00\x00\x00"  # 82 R
+    b"\xf0\x0f\xf8\x1f\x3c\x3c\x3c\x78\x00\x70\x00\x7f\xe0\x7f\xf0\x1f\xf8\x01\x3c\x00\x3c\x70\x3c\x3c\xf8\x1f\xf0\x0f\x00\x00\x00\x00"  # 83 S
+    b"\xfc\x7f\xfc\x7f\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 84 T
+    b"\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\xe0\x38\xc0\x1f\x80\x0f\x00\x00\x00\x00\x00\x00"  # 85 U
+    b"\x70\x70\x70\x70\xe0\x38\xe0\x38\xe0\x38\xc0\x1d\xc0\x1d\xc0\x1d\x80\x0f\x80\x0f\x80\x0f\x00\x07\x00\x00\x00\x00\x00\x00\x00\x00"  # 86 V
+    b"\x38\xe0\x38\xe0\x38\xe0\xec\xf6\xec\xf6\xec\xf6\xfc\x7f\xfc\x7f\xfc\x7f\x78\x3c\x78\x3c\x78\x3c\x00\x00\x00\x00\x00\x00\x00\x00"  # 87 W
+    b"\x70\x70\xe0\x38\xc0\x1d\x80\x0f\x00\x07\x00\x07\x80\x0f\xc0\x1d\xe0\x38\x70\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 88 X
+    b"\x70\x70\xe0\x38\xc0\x1d\x80\x0f\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 89 Y
+    b"\xfc\x7f\xfc\x7f\x38\x00\x70\x00\xe0\x00\xc0\x01\x80\x03\x00\x07\x00\x0e\x00\x1c\xfc\x7f\xfc\x7f\x00\x00\x00\x00\x00\x00\x00\x00"  # 90 Z
+    b"\xf8\x1f\xf8\x1f\x00\x1c\x00\x1c\x00\x1c\x00\x1c\x00\x1c\x00\x1c\x00\x1c\x00\x1c\xf8\x1f\xf8\x1f\x00\x00\x00\x00\x00\x00\x00\x00"  # 91 [
+    b"\x00\x70\x00\x38\x00\x1c\x00\x0e\x00\x07\x80\x03\xc0\x01\xe0\x00\x70\x00\x38\x00\x1c\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 92 \
+    b"\xf8\x1f\xf8\x1f\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\xf8\x1f\xf8\x1f\x00\x00\x00\x00\x00\x00\x00\x00"  # 93 ]
+    b"\xe0\x00\xf0\x01\xf8\x03\x3c\x07\x1c\x0e\x0e\x1c\x07\x38\x03\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 94 ^
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\x7f\xfc\x7f\x00\x00\x00\x00\x00\x00\x00\x00"  # 95 _
+    b"\x00\x1c\x00\x1e\x00\x0f\x00\x07\x80\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 96 `
+    b"\x00\x00\x00\x00\x00\x00\xf0\x0f\xf8\x1f\x78\x38\x78\x70\xf8\x7f\xf8\x7f\x78\x70\x78\x78\xff\x3f\x3f\x1f\x00\x00\x00\x00\x00\x00"  # 97 a
+    b"\x00\x70\x00\x70\x00\x70\xe0\x7f\xf0\x7f\xf8\x71\xf8\x70\xf8\x70\xf8\x70\xf8\x71\xf0\x7f\xe0\x7f\x00\x00\x00\x00\x00\x00\x00\x00"  # 98 b
+    b"\x00\x00\x00\x00\x00\x00\xf0\x0f\xf8\x1f\x3c\x3c\x1c\x78\x00\x70\x00\x70\x1c\x78\x3c\x3c\xf8\x1f\xf0\x0f\x00\x00\x00\x00\x00\x00"  # 99 c
+    b"\x38\x00\x38\x00\x38\x00\xf8\x0f\xf8\x1f\x38\x3c\x18\x78\x18\x70\x18\x70\x18\x78\x38\x3c\xf8\x1f\xf8\x0f\x00\x00\x00\x00\x00\x00"  # 100 d
+    b"\x00\x00\x00\x00\x00\x00\xf0\x0f\xf8\x1f\x3c\x3c\x3c\x78\xfc\x7f\xfc\x7f\x00\x70\x1c\x78\x3c\x3c\xf8\x1f\xf0\x0f\x00\x00\x00\x00"  # 101 e
+    b"\xf8\x00\xfc\x01\xc0\x03\xc0\x03\xfc\x3f\xfc\x3f\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\x00\x00\x00\x00\x00\x00\x00\x00"  # 102 f
+    b"\x00\x00\x00\x00\xf8\x0f\xf8\x1f\x3c\x3c\x1c\x78\x1c\x70\xfc\x7f\xfc\x3f\x3c\x00\x3c\x3c\xf8\x1f\xf0\x0f\x00\x00\x00\x00\x00\x00"  # 103 g
+    b"\x00\x70\x00\x70\x00\x70\xe0\x7f\xf0\x7f\xf8\x71\xf8\x70\xf8\x70\xf8\x70\xf8\x70\xf8\x70\xf8\x70\x00\x00\x00\x00\x00\x00\x00\x00"  # 104 h
+    b"\xe0\x00\xe0\x00\x00\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 105 i
+    b"\x38\x00\x38\x00\x00\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\xf8\x3f\xf0\x1f\x00\x00\x00\x00\x00\x00"  # 106 j
+    b"\x00\x70\x00\x70\x00\x70\x78\x70\xf0\x70\xe0\x71\xc0\x73\x80\x7f\x80\x7f\xe0\x71\xf0\x70\x78\x70\x00\x00\x00\x00\x00\x00\x00\x00"  # 107 k
+    b"\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 108 l
+    b"\x00\x00\x00\x00\x00\x00\xfc\x7c\xfe\x7f\x76\x7e\x76\x76\x76\x76\x76\x76\x76\x76\x76\x76\x76\x76\x00\x00\x00\x00\x00\x00\x00\x00"  # 109 m
+    b"\x00\x00\x00\x00\x00\x00\xe0\x7f\xf0\x7f\xf8\x71\xf8\x70\xf8\x70\xf8\x70\xf8\x70\xf8\x70\xf8\x70\x00\x00\x00\x00\x00\x00\x00\x00"  # 110 n
+    b"\x00\x00\x00\x00\x00\x00\xf0\x0f\xf8\x1f\x3c\x3c\x1c\x78\x1c\x70\x1c\x70\x1c\x78\x3c\x3c\xf8\x1f\xf0\x0f\x00\x00\x00\x00\x00\x00"  # 111 o
+    b"\x00\x00\x00\x00\x00\x00\xe0\x7f\xf0\x7f\xf8\x71\xf8\x70\xf8\x70\xf8\x71\xf0\x7f\xe0\x7f\x00\x70\x00\x70\x00\x00\x00\x00\x00\x00"  # 112 p
+    b"\x00\x00\x00\x00\x00\x00\xf8\x0f\xf8\x1f\x38\x3c\x18\x78\x18\x70\x18\x70\x18\x78\x38\x3c\xf8\x1f\xf8\x0f\x38\x00\x38\x00\x38\x00"  # 113 q
+    b"\x00\x00\x00\x00\x00\x00\xe0\x7f\xf0\x7f\xf8\x71\xf8\x70\x00\x70\x00\x70\x00\x70\x00\x70\x00\x70\x00\x00\x00\x00\x00\x00\x00\x00"  # 114 r
+    b"\x00\x00\x00\x00\x00\x00\xf0\x0f\xf8\x1f\x3c\x3c\x00\x70\xf0\x3f\xf8\x1f\x1c\x00\x3c\x3c\xf8\x1f\xf0\x0f\x00\x00\x00\x00\x00\x00"  # 115 s
+    b"\xe0\x00\xe0\x00\xe0\x00\xfc\x3f\xfc\x3f\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xf8\x01\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 116 t
+    b"\x00\x00\x00\x00\x00\x00\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x78\xff\x3f\x3f\x1f\x00\x00\x00\x00\x00\x00\x00\x00"  # 117 u
+    b"\x00\x00\x00\x00\x00\x00\x70\x70\x70\x70\x70\x78\xf0\x3c\xf0\x3c\xe0\x1d\xe0\x1d\xc0\x0f\xc0\x0f\x00\x00\x00\x00\x00\x00\x00\x00"  # 118 v
+    b"\x00\x00\x00\x00\x00\x00\x38\x70\x38\x70\x38\x77\x78\x77\x78\x3f\x78\x3f\x78\x3f\x70\x1e\x70\x1e\x00\x00\x00\x00\x00\x00\x00\x00"  # 119 w
+    b"\x00\x00\x00\x00\x00\x00\x70\x70\xf0\x78\xe0\x3d\xc0\x1f\x80\x0f\x80\x0f\xc0\x1f\xe0\x3d\xf0\x78\x70\x70\x00\x00\x00\x00\x00\x00"  # 120 x
+    b"\x00\x00\x00\x00\x00\x00\x70\x70\x70\x70\x70\x70\x70\x78\xf0\x3f\xf0\x1f\x70\x00\xf0\x00\xe0\x1f\xc0\x0f\x00\x00\x00\x00\x00\x00"  # 121 y
+    b"\x00\x00\x00\x00\x00\x00\xfc\x3f\xfc\x3f\x38\x00\x70\x00\xe0\x00\xc0\x01\x80\x03\x00\x07\xfc\x3f\xfc\x3f\x00\x00\x00\x00\x00\x00"  # 122 z
+    b"\xf8\x00\xf0\x01\xc0\x01\x80\x03\x80\x03\x00\x07\x00\x0e\x00\x1c\x00\x0e\x00\x07\x80\x03\x80\x03\xc0\x01\xf0\x01\xf8\x00\x00\x00"  # 123 {
+    b"\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\x00\x00"  # 124 |
+    b"\x00\x1f\x80\x0f\x80\x03\xc0\x01\xc0\x01\xe0\x00\x70\x00\x38\x00\x70\x00\xe0\x00\xc0\x01\xc0\x01\x80\x03\x80\x0f\x00\x1f\x00\x00"  # 125 }
+    b"\x00\x00\x00\x00\x00\x00\x70\x1c\xf8\x3e\xfc\x3f\xfc\x1f\x38\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"  # 126 ~
+    b"\x00\x00\x00\x00\x00\x00\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x78\xff\x3f\x3f\x1f\x00\x00\x00\x00\x00\x00\x00\x00"  # 127 DEL
+)
+# fmt: on
+
+font = BitmapFont(_DATA, 16, 16)
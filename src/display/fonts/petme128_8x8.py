@@ -1,100 +1,104 @@
+from display.fonts.bitmap import BitmapFont
+
 # fmt: off
-font = [
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, # 32=
-    0x00, 0x00, 0x00, 0x4f, 0x4f, 0x00, 0x00, 0x00, # 33=!
-    0x00, 0x07, 0x07, 0x00, 0x00, 0x07, 0x07, 0x00, # 34="
-    0x14, 0x7f, 0x7f, 0x14, 0x14, 0x7f, 0x7f, 0x14, # 35=#
-    0x00, 0x24, 0x2e, 0x6b, 0x6b, 0x3a, 0x12, 0x00, # 36=$
-    0x00, 0x63, 0x33, 0x18, 0x0c, 0x66, 0x63, 0x00, # 37=%
-    0x00, 0x32, 0x7f, 0x4d, 0x4d, 0x77, 0x72, 0x50, # 38=&
-    0x00, 0x00, 0x00, 0x04, 0x06, 0x03, 0x01, 0x00, # 39='
-    0x00, 0x00, 0x1c, 0x3e, 0x63, 0x41, 0x00, 0x00, # 40=(
-    0x00, 0x00, 0x41, 0x63, 0x3e, 0x1c, 0x00, 0x00, # 41=)
-    0x08, 0x2a, 0x3e, 0x1c, 0x1c, 0x3e, 0x2a, 0x08, # 42=*
-    0x00, 0x08, 0x08, 0x3e, 0x3e, 0x08, 0x08, 0x00, # 43=+
-    0x00, 0x00, 0x80, 0xe0, 0x60, 0x00, 0x00, 0x00, # 44=,
-    0x00, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x00, # 45=-
-    0x00, 0x00, 0x00, 0x60, 0x60, 0x00, 0x00, 0x00, # 46=.
-    0x00, 0x40, 0x60, 0x30, 0x18, 0x0c, 0x06, 0x02, # 47=/
-    0x00, 0x3e, 0x7f, 0x49, 0x45, 0x7f, 0x3e, 0x00, # 48=0
-    0x00, 0x40, 0x44, 0x7f, 0x7f, 0x40, 0x40, 0x00, # 49=1
-    0x00, 0x62, 0x73, 0x51, 0x49, 0x4f, 0x46, 0x00, # 50=2
-    0x00, 0x22, 0x63, 0x49, 0x49, 0x7f, 0x36, 0x00, # 51=3
-    0x00, 0x18, 0x18, 0x14, 0x16, 0x7f, 0x7f, 0x10, # 52=4
-    0x00, 0x27, 0x67, 0x45, 0x45, 0x7d, 0x39, 0x00, # 53=5
-    0x00, 0x3e, 0x7f, 0x49, 0x49, 0x7b, 0x32, 0x00, # 54=6
-    0x00, 0x03, 0x03, 0x79, 0x7d, 0x07, 0x03, 0x00, # 55=7
-    0x00, 0x36, 0x7f, 0x49, 0x49, 0x7f, 0x36, 0x00, # 56=8
-    0x00, 0x26, 0x6f, 0x49, 0x49, 0x7f, 0x3e, 0x00, # 57=9
-    0x00, 0x00, 0x00, 0x24, 0x24, 0x00, 0x00, 0x00, # 58=:
-    0x00, 0x00, 0x80, 0xe4, 0x64, 0x00, 0x00, 0x00, # 59=;
-    0x00, 0x08, 0x1c, 0x36, 0x63, 0x41, 0x41, 0x00, # 60=<
-    0x00, 0x14, 0x14, 0x14, 0x14, 0x14, 0x14, 0x00, # 61==
-    0x00, 0x41, 0x41, 0x63, 0x36, 0x1c, 0x08, 0x00, # 62=>
-    0x00, 0x02, 0x03, 0x51, 0x59, 0x0f, 0x06, 0x00, # 63=?
-    0x00, 0x3e, 0x7f, 0x41, 0x4d, 0x4f, 0x2e, 0x00, # 64=@
-    0x00, 0x7c, 0x7e, 0x0b, 0x0b, 0x7e, 0x7c, 0x00, # 65=A
-    0x00, 0x7f, 0x7f, 0x49, 0x49, 0x7f, 0x36, 0x00, # 66=B
-    0x00, 0x3e, 0x7f, 0x41, 0x41, 0x63, 0x22, 0x00, # 67=C
-    0x00, 0x7f, 0x7f, 0x41, 0x63, 0x3e, 0x1c, 0x00, # 68=D
-    0x00, 0x7f, 0x7f, 0x49, 0x49, 0x41, 0x41, 0x00, # 69=E
-    0x00, 0x7f, 0x7f, 0x09, 0x09, 0x01, 0x01, 0x00, # 70=F
-    0x00, 0x3e, 0x7f, 0x41, 0x49, 0x7b, 0x3a, 0x00, # 71=G
-    0x00, 0x7f, 0x7f, 0x08, 0x08, 0x7f, 0x7f, 0x00, # 72=H
-    0x00, 0x00, 0x41, 0x7f, 0x7f, 0x41, 0x00, 0x00, # 73=I
-    0x00, 0x20, 0x60, 0x41, 0x7f, 0x3f, 0x01, 0x00, # 74=J
-    0x00, 0x7f, 0x7f, 0x1c, 0x36, 0x63, 0x41, 0x00, # 75=K
-    0x00, 0x7f, 0x7f, 0x40, 0x40, 0x40, 0x40, 0x00, # 76=L
-    0x00, 0x7f, 0x7f, 0x06, 0x0c, 0x06, 0x7f, 0x7f, # 77=M
-    0x00, 0x7f, 0x7f, 0x0e, 0x1c, 0x7f, 0x7f, 0x00, # 78=N
-    0x00, 0x3e, 0x7f, 0x41, 0x41, 0x7f, 0x3e, 0x00, # 79=O
-    0x00, 0x7f, 0x7f, 0x09, 0x09, 0x0f, 0x06, 0x00, # 80=P
-    0x00, 0x1e, 0x3f, 0x21, 0x61, 0x7f, 0x5e, 0x00, # 81=Q
-    0x00, 0x7f, 0x7f, 0x19, 0x39, 0x6f, 0x46, 0x00, # 82=R
-    0x00, 0x26, 0x6f, 0x49, 0x49, 0x7b, 0x32, 0x00, # 83=S
-    0x00, 0x01, 0x01, 0x7f, 0x7f, 0x01, 0x01, 0x00, # 84=T
-    0x00, 0x3f, 0x7f, 0x40, 0x40, 0x7f, 0x3f, 0x00, # 85=U
-    0x00, 0x1f, 0x3f, 0x60, 0x60, 0x3f, 0x1f, 0x00, # 86=V
-    0x00, 0x7f, 0x7f, 0x30, 0x18, 0x30, 0x7f, 0x7f, # 87=W
-    0x00, 0x63, 0x77, 0x1c, 0x1c, 0x77, 0x63, 0x00, # 88=X
-    0x00, 0x07, 0x0f, 0x78, 0x78, 0x0f, 0x07, 0x00, # 89=Y
-    0x00, 0x61, 0x71, 0x59, 0x4d, 0x47, 0x43, 0x00, # 90=Z
-    0x00, 0x00, 0x7f, 0x7f, 0x41, 0x41, 0x00, 0x00, # 91=[
-    0x00, 0x02, 0x06, 0x0c, 0x18, 0x30, 0x60, 0x40, # 92='\'
-    0x00, 0x00, 0x41, 0x41, 0x7f, 0x7f, 0x00, 0x00, # 93=]
-    0x00, 0x08, 0x0c, 0x06, 0x06, 0x0c, 0x08, 0x00, # 94=^
-    0xc0, 0xc0, 0xc0, 0xc0, 0xc0, 0xc0, 0xc0, 0xc0, # 95=_
-    0x00, 0x00, 0x01, 0x03, 0x06, 0x04, 0x00, 0x00, # 96=`
-    0x00, 0x20, 0x74, 0x54, 0x54, 0x7c, 0x78, 0x00, # 97=a
-    0x00, 0x7f, 0x7f, 0x44, 0x44, 0x7c, 0x38, 0x00, # 98=b
-    0x00, 0x38, 0x7c, 0x44, 0x44, 0x6c, 0x28, 0x00, # 99=c
-    0x00, 0x38, 0x7c, 0x44, 0x44, 0x7f, 0x7f, 0x00, # 100=d
-    0x00, 0x38, 0x7c, 0x54, 0x54, 0x5c, 0x58, 0x00, # 101=e
-    0x00, 0x08, 0x7e, 0x7f, 0x09, 0x03, 0x02, 0x00, # 102=f
-    0x00, 0x98, 0xbc, 0xa4, 0xa4, 0xfc, 0x7c, 0x00, # 103=g
-    0x00, 0x7f, 0x7f, 0x04, 0x04, 0x7c, 0x78, 0x00, # 104=h
-    0x00, 0x00, 0x00, 0x7d, 0x7d, 0x00, 0x00, 0x00, # 105=i
-    0x00, 0x40, 0xc0, 0x80, 0x80, 0xfd, 0x7d, 0x00, # 106=j
-    0x00, 0x7f, 0x7f, 0x30, 0x38, 0x6c, 0x44, 0x00, # 107=k
-    0x00, 0x00, 0x41, 0x7f, 0x7f, 0x40, 0x00, 0x00, # 108=l
-    0x00, 0x7c, 0x7c, 0x18, 0x30, 0x18, 0x7c, 0x7c, # 109=m
-    0x00, 0x7c, 0x7c, 0x04, 0x04, 0x7c, 0x78, 0x00, # 110=n
-    0x00, 0x38, 0x7c, 0x44, 0x44, 0x7c, 0x38, 0x00, # 111=o
-    0x00, 0xfc, 0xfc, 0x24, 0x24, 0x3c, 0x18, 0x00, # 112=p
-    0x00, 0x18, 0x3c, 0x24, 0x24, 0xfc, 0xfc, 0x00, # 113=q
-    0x00, 0x7c, 0x7c, 0x04, 0x04, 0x0c, 0x08, 0x00, # 114=r
-    0x00, 0x48, 0x5c, 0x54, 0x54, 0x74, 0x20, 0x00, # 115=s
-    0x04, 0x04, 0x3f, 0x7f, 0x44, 0x64, 0x20, 0x00, # 116=t
-    0x00, 0x3c, 0x7c, 0x40, 0x40, 0x7c, 0x3c, 0x00, # 117=u
-    0x00, 0x1c, 0x3c, 0x60, 0x60, 0x3c, 0x1c, 0x00, # 118=v
-    0x00, 0x1c, 0x7c, 0x30, 0x18, 0x30, 0x7c, 0x1c, # 119=w
-    0x00, 0x44, 0x6c, 0x38, 0x38, 0x6c, 0x44, 0x00, # 120=x
-    0x00, 0x9c, 0xbc, 0xa0, 0xa0, 0xfc, 0x7c, 0x00, # 121=y
-    0x00, 0x44, 0x64, 0x74, 0x5c, 0x4c, 0x44, 0x00, # 122=z
-    0x00, 0x08, 0x08, 0x3e, 0x77, 0x41, 0x41, 0x00, # 123={
-    0x00, 0x00, 0x00, 0xff, 0xff, 0x00, 0x00, 0x00, # 124=|
-    0x00, 0x41, 0x41, 0x77, 0x3e, 0x08, 0x08, 0x00, # 125=}
-    0x00, 0x02, 0x03, 0x01, 0x03, 0x02, 0x03, 0x01, # 126=~
-    0xaa, 0x55, 0xaa, 0x55, 0xaa, 0x55, 0xaa, 0x55, # 127
-]
+_DATA = (
+    b"\x00\x00\x00\x00\x00\x00\x00\x00"  # 32=
+    b"\x00\x00\x00\x4f\x4f\x00\x00\x00"  # 33=!
+    b"\x00\x07\x07\x00\x00\x07\x07\x00"  # 34="
+    b"\x14\x7f\x7f\x14\x14\x7f\x7f\x14"  # 35=#
+    b"\x00\x24\x2e\x6b\x6b\x3a\x12\x00"  # 36=$
+    b"\x00\x63\x33\x18\x0c\x66\x63\x00"  # 37=%
+    b"\x00\x32\x7f\x4d\x4d\x77\x72\x50"  # 38=&
+    b"\x00\x00\x00\x04\x06\x03\x01\x00"  # 39='
+    b"\x00\x00\x1c\x3e\x63\x41\x00\x00"  # 40=(
+    b"\x00\x00\x41\x63\x3e\x1c\x00\x00"  # 41=)
+    b"\x08\x2a\x3e\x1c\x1c\x3e\x2a\x08"  # 42=*
+    b"\x00\x08\x08\x3e\x3e\x08\x08\x00"  # 43=+
+    b"\x00\x00\x80\xe0\x60\x00\x00\x00"  # 44=,
+    b"\x00\x08\x08\x08\x08\x08\x08\x00"  # 45=-
+    b"\x00\x00\x00\x60\x60\x00\x00\x00"  # 46=.
+    b"\x00\x40\x60\x30\x18\x0c\x06\x02"  # 47=/
+    b"\x00\x3e\x7f\x49\x45\x7f\x3e\x00"  # 48=0
+    b"\x00\x40\x44\x7f\x7f\x40\x40\x00"  # 49=1
+    b"\x00\x62\x73\x51\x49\x4f\x46\x00"  # 50=2
+    b"\x00\x22\x63\x49\x49\x7f\x36\x00"  # 51=3
+    b"\x00\x18\x18\x14\x16\x7f\x7f\x10"  # 52=4
+    b"\x00\x27\x67\x45\x45\x7d\x39\x00"  # 53=5
+    b"\x00\x3e\x7f\x49\x49\x7b\x32\x00"  # 54=6
+    b"\x00\x03\x03\x79\x7d\x07\x03\x00"  # 55=7
+    b"\x00\x36\x7f\x49\x49\x7f\x36\x00"  # 56=8
+    b"\x00\x26\x6f\x49\x49\x7f\x3e\x00"  # 57=9
+    b"\x00\x00\x00\x24\x24\x00\x00\x00"  # 58=:
+    b"\x00\x00\x80\xe4\x64\x00\x00\x00"  # 59=;
+    b"\x00\x08\x1c\x36\x63\x41\x41\x00"  # 60=<
+    b"\x00\x14\x14\x14\x14\x14\x14\x00"  # 61==
+    b"\x00\x41\x41\x63\x36\x1c\x08\x00"  # 62=>
+    b"\x00\x02\x03\x51\x59\x0f\x06\x00"  # 63=?
+    b"\x00\x3e\x7f\x41\x4d\x4f\x2e\x00"  # 64=@
+    b"\x00\x7c\x7e\x0b\x0b\x7e\x7c\x00"  # 65=A
+    b"\x00\x7f\x7f\x49\x49\x7f\x36\x00"  # 66=B
+    b"\x00\x3e\x7f\x41\x41\x63\x22\x00"  # 67=C
+    b"\x00\x7f\x7f\x41\x63\x3e\x1c\x00"  # 68=D
+    b"\x00\x7f\x7f\x49\x49\x41\x41\x00"  # 69=E
+    b"\x00\x7f\x7f\x09\x09\x01\x01\x00"  # 70=F
+    b"\x00\x3e\x7f\x41\x49\x7b\x3a\x00"  # 71=G
+    b"\x00\x7f\x7f\x08\x08\x7f\x7f\x00"  # 72=H
+    b"\x00\x00\x41\x7f\x7f\x41\x00\x00"  # 73=I
+    b"\x00\x20\x60\x41\x7f\x3f\x01\x00"  # 74=J
+    b"\x00\x7f\x7f\x1c\x36\x63\x41\x00"  # 75=K
+    b"\x00\x7f\x7f\x40\x40\x40\x40\x00"  # 76=L
+    b"\x00\x7f\x7f\x06\x0c\x06\x7f\x7f"  # 77=M
+    b"\x00\x7f\x7f\x0e\x1c\x7f\x7f\x00"  # 78=N
+    b"\x00\x3e\x7f\x41\x41\x7f\x3e\x00"  # 79=O
+    b"\x00\x7f\x7f\x09\x09\x0f\x06\x00"  # 80=P
+    b"\x00\x1e\x3f\x21\x61\x7f\x5e\x00"  # 81=Q
+    b"\x00\x7f\x7f\x19\x39\x6f\x46\x00"  # 82=R
+    b"\x00\x26\x6f\x49\x49\x7b\x32\x00"  # 83=S
+    b"\x00\x01\x01\x7f\x7f\x01\x01\x00"  # 84=T
+    b"\x00\x3f\x7f\x40\x40\x7f\x3f\x00"  # 85=U
+    b"\x00\x1f\x3f\x60\x60\x3f\x1f\x00"  # 86=V
+    b"\x00\x7f\x7f\x30\x18\x30\x7f\x7f"  # 87=W
+    b"\x00\x63\x77\x1c\x1c\x77\x63\x00"  # 88=X
+    b"\x00\x07\x0f\x78\x78\x0f\x07\x00"  # 89=Y
+    b"\x00\x61\x71\x59\x4d\x47\x43\x00"  # 90=Z
+    b"\x00\x00\x7f\x7f\x41\x41\x00\x00"  # 91=[
+    b"\x00\x02\x06\x0c\x18\x30\x60\x40"  # 92='\'
+    b"\x00\x00\x41\x41\x7f\x7f\x00\x00"  # 93=]
+    b"\x00\x08\x0c\x06\x06\x0c\x08\x00"  # 94=^
+    b"\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0"  # 95=_
+    b"\x00\x00\x01\x03\x06\x04\x00\x00"  # 96=`
+    b"\x00\x20\x74\x54\x54\x7c\x78\x00"  # 97=a
+    b"\x00\x7f\x7f\x44\x44\x7c\x38\x00"  # 98=b
+    b"\x00\x38\x7c\x44\x44\x6c\x28\x00"  # 99=c
+    b"\x00\x38\x7c\x44\x44\x7f\x7f\x00"  # 100=d
+    b"\x00\x38\x7c\x54\x54\x5c\x58\x00"  # 101=e
+    b"\x00\x08\x7e\x7f\x09\x03\x02\x00"  # 102=f
+    b"\x00\x98\xbc\xa4\xa4\xfc\x7c\x00"  # 103=g
+    b"\x00\x7f\x7f\x04\x04\x7c\x78\x00"  # 104=h
+    b"\x00\x00\x00\x7d\x7d\x00\x00\x00"  # 105=i
+    b"\x00\x40\xc0\x80\x80\xfd\x7d\x00"  # 106=j
+    b"\x00\x7f\x7f\x30\x38\x6c\x44\x00"  # 107=k
+    b"\x00\x00\x41\x7f\x7f\x40\x00\x00"  # 108=l
+    b"\x00\x7c\x7c\x18\x30\x18\x7c\x7c"  # 109=m
+    b"\x00\x7c\x7c\x04\x04\x7c\x78\x00"  # 110=n
+    b"\x00\x38\x7c\x44\x44\x7c\x38\x00"  # 111=o
+    b"\x00\xfc\xfc\x24\x24\x3c\x18\x00"  # 112=p
+    b"\x00\x18\x3c\x24\x24\xfc\xfc\x00"  # 113=q
+    b"\x00\x7c\x7c\x04\x04\x0c\x08\x00"  # 114=r
+    b"\x00\x48\x5c\x54\x54\x74\x20\x00"  # 115=s
+    b"\x04\x04\x3f\x7f\x44\x64\x20\x00"  # 116=t
+    b"\x00\x3c\x7c\x40\x40\x7c\x3c\x00"  # 117=u
+    b"\x00\x1c\x3c\x60\x60\x3c\x1c\x00"  # 118=v
+    b"\x00\x1c\x7c\x30\x18\x30\x7c\x1c"  # 119=w
+    b"\x00\x44\x6c\x38\x38\x6c\x44\x00"  # 120=x
+    b"\x00\x9c\xbc\xa0\xa0\xfc\x7c\x00"  # 121=y
+    b"\x00\x44\x64\x74\x5c\x4c\x44\x00"  # 122=z
+    b"\x00\x08\x08\x3e\x77\x41\x41\x00"  # 123={
+    b"\x00\x00\x00\xff\xff\x00\x00\x00"  # 124=|
+    b"\x00\x41\x41\x77\x3e\x08\x08\x00"  # 125=}
+    b"\x00\x02\x03\x01\x03\x02\x03\x01"  # 126=~
+    b"\xaa\x55\xaa\x55\xaa\x55\xaa\x55"  # 127
+)
 # fmt: on
+
+font = BitmapFont(_DATA, 8, 8)
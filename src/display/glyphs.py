@@ -0,0 +1,100 @@
+from framebuf import FrameBuffer, RGB565
+from display.fonts.bitmap import BitmapFont
+from display.fonts.petme128_8x8 import font as petme
+
+
+class Glyph(FrameBuffer):
+    """A rasterized character, blitted with the inverse of its color as transparent key."""
+
+    def __init__(self, width: int, height: int, color: int):
+        self.buffer = bytearray(width * height * 2)
+        super().__init__(self.buffer, width, height, RGB565)
+        self.width = width
+        self.height = height
+        self.key = ~color & 0xFFFF
+        self.used = 0  # GlyphCache's use count at the last lookup
+
+
+class GlyphCache:
+    """Scaled glyphs of a bitmap font, rasterized once per (char, scale, color).
+
+    Least recently used glyphs are dropped once the cached pixel data would
+    exceed max_bytes. The default holds 32 glyphs at scale 2, enough for the
+    numbers of the overview page in both of its colors and the error page.
+    A hit only stamps the glyph, the least recently used one is searched for
+    on a miss that needs the room.
+    """
+
+    _glyphs: dict[int, Glyph]
+
+    def __init__(self, font: BitmapFont = petme, max_bytes: int = 16384):
+        self._font = font
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._glyphs = {}
+        self._uses = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, char: str, scale: int, color: int) -> Glyph:
+        key = (color << 12) | (scale << 8) | (ord(char) & 0xFF)
+        self._uses += 1
+        glyph = self._glyphs.get(key)
+        if glyph is not None:
+            self.hits += 1
+            glyph.used = self._uses
+            return glyph
+        self.misses += 1
+        glyph = self._rasterize(char, scale, color)
+        glyph.used = self._uses
+        size = len(glyph.buffer)
+        while self._glyphs and self._bytes + size > self._max_bytes:
+            self._evict()
+        self._glyphs[key] = glyph
+        self._bytes += size
+        return glyph
+
+    def _evict(self):
+        oldest = None
+        for key, glyph in self._glyphs.items():
+            if oldest is None or glyph.used < self._glyphs[oldest].used:
+                oldest = key
+        self._bytes -= len(self._glyphs.pop(oldest).buffer)
+        self.evictions += 1
+
+    def text(self, framebuffer, string, x, y, c, s=2) -> tuple[int, int]:
+        """Draw string scaled by s, like FrameBuffer.text. Return the end x and bottom y."""
+        for char in string:
+            glyph = self.get(char, s, c)
+            framebuffer.blit(glyph, x, y, glyph.key)
+            x += glyph.width
+        return (x, y + self._font.height * s)
+
+    def clear(self):
+        self._glyphs = {}
+        self._bytes = 0
+
+    def size(self) -> int:
+        """Bytes of pixel data currently cached."""
+        return self._bytes
+
+    def _rasterize(self, char: str, scale: int, color: int) -> Glyph:
+        font = self._font
+        glyph = Glyph(font.width * scale, font.height * scale, color)
+        glyph.fill(glyph.key)
+        for column_offset in range(font.width):
+            column = font.column(char, column_offset)
+            for pixel_offset in range(font.height):
+                if (column >> pixel_offset) & 1:
+                    glyph.fill_rect(
+                        column_offset * scale,
+                        pixel_offset * scale,
+                        scale,
+                        scale,
+                        color,
+                    )
+        return glyph
+
+
+glyph_cache = GlyphCache()
@@ -1,8 +1,8 @@
 from framebuf import FrameBuffer, RGB565
-from display.fonts.font16x16 import font
-from display.fonts.petme128_8x8 import font as petme
+from display.dirty import TrackedFrameBuffer
+from display.glyphs import glyph_cache
 from machine import Pin, SPI
-from time import sleep
+from time import sleep, sleep_ms
 
 ILI9225_DRIVER_OUTPUT_CTRL = 0x01  # Driver Output Control
 ILI9225_LCD_AC_DRIVING_CTRL = 0x02  # LCD AC Driving Control
@@ -47,6 +47,65 @@ ILI9225C_INVON = 0x21
 
 ILI9225_START_BYTE = 0x005C
 
+# Register writes of _init_display(), 4 bytes each as they go on the bus: the
+# register index, then its value, both big endian. An index of _DELAY waits
+# for value ms instead.
+_DELAY = 0xFF
+_INIT_SEQUENCE = (
+    b"\x00\x01\x03\x1c"  # driver output: display line number and direction
+    b"\x00\x02\x01\x00"  # LCD AC driving: 1 line inversion
+    b"\x00\x03\x00\x10"  # entry mode: GRAM write direction and BGR=1
+    b"\x00\x08\x08\x08"  # blank period: back porch and front porch
+    b"\x00\x0c\x00\x00"  # interface: CPU interface
+    b"\x00\x0f\x08\x01"  # oscillator
+    b"\x00\x20\x00\x00"  # RAM address, horizontal
+    b"\x00\x21\x00\x00"  # RAM address, vertical
+    b"\xff\xff\x00\x32"  # 50 ms, power on sequence
+    b"\x00\x10\x0a\x00"  # power 1: SAP, DSTB, STB
+    b"\x00\x11\x10\x38"  # power 2: APON, PON, AON, VCI1EN, VC
+    b"\xff\xff\x00\x32"  # 50 ms
+    b"\x00\x12\x11\x21"  # power 3: BT, DC1, DC2, DC3
+    b"\x00\x13\x00\x66"  # power 4: GVDD
+    b"\x00\x14\x5f\x60"  # power 5: VCOMH/VCOML voltage
+    b"\x00\x30\x00\x00"  # gate scan, then the GRAM area
+    b"\x00\x31\x00\xdb"  # vertical scroll 1
+    b"\x00\x32\x00\x00"  # vertical scroll 2
+    b"\x00\x33\x00\x00"  # vertical scroll 3
+    b"\x00\x34\x00\xdb"  # partial driving position 1
+    b"\x00\x35\x00\x00"  # partial driving position 2
+    b"\x00\x36\x00\xaf"  # horizontal window address 1
+    b"\x00\x37\x00\x00"  # horizontal window address 2
+    b"\x00\x38\x00\xdb"  # vertical window address 1
+    b"\x00\x39\x00\x00"  # vertical window address 2
+    b"\x00\x50\x40\x00"  # gamma 1 to 10
+    b"\x00\x51\x06\x0b"
+    b"\x00\x52\x0c\x0a"
+    b"\x00\x53\x01\x05"
+    b"\x00\x54\x0a\x0c"
+    b"\x00\x55\x0b\x06"
+    b"\x00\x56\x00\x04"
+    b"\x00\x57\x05\x01"
+    b"\x00\x58\x0e\x00"
+    b"\x00\x59\x00\x0e"
+    b"\xff\xff\x00\x32"  # 50 ms
+    b"\x00\x07\x10\x17"  # display control 1: display on
+)
+
+# set_window() writes these registers like writeRegister(), in this order. The
+# window address 1 registers hold the end of the window, as in _INIT_SEQUENCE.
+_WINDOW_COMMANDS = (
+    ILI9225_HORIZONTAL_WINDOW_ADDR1,  # x1
+    ILI9225_HORIZONTAL_WINDOW_ADDR2,  # x0
+    ILI9225_VERTICAL_WINDOW_ADDR1,  # y1
+    ILI9225_VERTICAL_WINDOW_ADDR2,  # y0
+    ILI9225_RAM_ADDR_SET1,  # x0
+    ILI9225_RAM_ADDR_SET2,  # y0
+)
+
+# rectangles up to this many rows keep their row slices between updates
+_CACHED_ROWS = 16
+_CACHED_RECTS = 12
+
 
 class ILI9225:
     def __init__(
@@ -66,116 +125,213 @@ class ILI9225:
         self._reset = Pin(reset_pin, Pin.OUT, value=1)
         self._width = width
         self._height = height
+        self._bytes_sent = 0
+        self._frame_bytes = 0
+        # reused for every command and register write instead of new bytes
+        self._byte = bytearray(1)
+        self._word = bytearray(2)
+        # index and value words of every window register, see _send_window()
+        self._window = bytearray(4 * len(_WINDOW_COMMANDS))
+        for i in range(len(_WINDOW_COMMANDS)):
+            self._window[4 * i + 1] = _WINDOW_COMMANDS[i]
+        window = memoryview(self._window)
+        self._window_views = [window[i : i + 2] for i in range(0, len(self._window), 2)]
+        # x0, y0, x1, y1 and the buffer slices of recently flushed rectangles
+        self._views = [[-1, -1, -1, -1, None] for _ in range(_CACHED_RECTS)]
+        self._next_view = 0
 
         if framebuffer and buffer:
             self._buffer = buffer
             self._fb = framebuffer
         else:
             self._buffer = bytearray(width * height * 2)  # 2 bytes per pixel (RGB565)
-            self._fb = FrameBuffer(self._buffer, self._width, self._height, RGB565)
+            self._fb = TrackedFrameBuffer(
+                self._buffer, self._width, self._height, RGB565
+            )
+        self._buffer_view = memoryview(self._buffer)
+        # a BandedFrameBuffer only keeps a strip of rows, see _update_bands()
+        self._render_band = getattr(self._fb, "render_band", None)
+        if self._render_band:
+            self._fb.attach(self)
 
         self._init_display()
 
     def _init_display(self):
-        """Initialize the display."""
-        self.writeRegister(
-            ILI9225_DRIVER_OUTPUT_CTRL, 0x031C
-        )  # set the display line number and display direction
-        self.writeRegister(ILI9225_LCD_AC_DRIVING_CTRL, 0x0100)  # set 1 line inversion
-        self.writeRegister(
-            ILI9225_ENTRY_MODE, 0x0010
-        )  # set GRAM write direction and BGR=1.
-        self.writeRegister(
-            ILI9225_BLANK_PERIOD_CTRL1, 0x0808
-        )  # set the back porch and front porch
-
-        self.writeRegister(ILI9225_INTERFACE_CTRL, 0x0000)  # CPU interface
-        self.writeRegister(ILI9225_OSC_CTRL, 0x0801)  # set Osc  /*0e01*/
-        self.writeRegister(ILI9225_RAM_ADDR_SET1, 0x0000)  # RAM Address
-        self.writeRegister(ILI9225_RAM_ADDR_SET2, 0x0000)  # RAM Address
-        # Power On sequence
-        sleep(0.05)
-        self.writeRegister(ILI9225_POWER_CTRL1, 0x0A00)  # set SAP,DSTB,STB
-        self.writeRegister(ILI9225_POWER_CTRL2, 0x1038)  # set APON,PON,AON,VCI1EN,VC
-        sleep(0.05)
-        self.writeRegister(ILI9225_POWER_CTRL3, 0x1121)  # set BT,DC1,DC2,DC3
-        self.writeRegister(ILI9225_POWER_CTRL4, 0x0066)  # set GVDD
-        self.writeRegister(ILI9225_POWER_CTRL5, 0x5F60)  # set VCOMH/VCOML voltage
-
-        # Set GRAM area
-        self.writeRegister(ILI9225_GATE_SCAN_CTRL, 0x0000)
-        self.writeRegister(ILI9225_VERTICAL_SCROLL_CTRL1, 0x00DB)
-        self.writeRegister(ILI9225_VERTICAL_SCROLL_CTRL2, 0x0000)
-        self.writeRegister(ILI9225_VERTICAL_SCROLL_CTRL3, 0x0000)
-        self.writeRegister(ILI9225_PARTIAL_DRIVING_POS1, 0x00DB)
-        self.writeRegister(ILI9225_PARTIAL_DRIVING_POS2, 0x0000)
-        self.writeRegister(ILI9225_HORIZONTAL_WINDOW_ADDR1, 0x00AF)
-        self.writeRegister(ILI9225_HORIZONTAL_WINDOW_ADDR2, 0x0000)
-        self.writeRegister(ILI9225_VERTICAL_WINDOW_ADDR1, 0x00DB)
-        self.writeRegister(ILI9225_VERTICAL_WINDOW_ADDR2, 0x0000)
-
-        # Adjust GAMMA curve
-        self.writeRegister(ILI9225_GAMMA_CTRL1, 0x4000)
-        self.writeRegister(ILI9225_GAMMA_CTRL2, 0x060B)
-        self.writeRegister(ILI9225_GAMMA_CTRL3, 0x0C0A)
-        self.writeRegister(ILI9225_GAMMA_CTRL4, 0x0105)
-        self.writeRegister(ILI9225_GAMMA_CTRL5, 0x0A0C)
-        self.writeRegister(ILI9225_GAMMA_CTRL6, 0x0B06)
-        self.writeRegister(ILI9225_GAMMA_CTRL7, 0x0004)
-        self.writeRegister(ILI9225_GAMMA_CTRL8, 0x0501)
-        self.writeRegister(ILI9225_GAMMA_CTRL9, 0x0E00)
-        self.writeRegister(ILI9225_GAMMA_CTRL10, 0x000E)
-
-        sleep(0.05)
-
-        self.writeRegister(ILI9225_DISP_CTRL1, 0x1017)
+        """Initialize the display from _INIT_SEQUENCE, chip selected throughout."""
+        sequence = memoryview(_INIT_SEQUENCE)
+        self._chip_select(0)
+        for i in range(0, len(sequence), 4):
+            if sequence[i] == _DELAY:
+                sleep_ms(sequence[i + 2] << 8 | sequence[i + 3])
+                continue
+            self._data_command(0)
+            self._write(sequence[i : i + 2])
+            self._data_command(1)
+            self._write(sequence[i + 2 : i + 4])
+        self._chip_select(1)
 
     def writeRegister(self, command, value):
+        word = self._word
         self._chip_select(0)
         self._data_command(0)
-        self._spi.write(command.to_bytes(2, "big"))
+        word[0] = command >> 8
+        word[1] = command & 0xFF
+        self._write(word)
         self._data_command(1)
-        self._spi.write(value.to_bytes(2, "big"))
+        word[0] = value >> 8
+        word[1] = value & 0xFF
+        self._write(word)
         self._chip_select(1)
 
     def write_command(self, command: int):
         self._data_command.value(0)
         self._chip_select.value(0)
-        self._spi.write(bytearray([command]))
+        self._byte[0] = command
+        self._write(self._byte)
         self._chip_select.value(1)
 
     def write_data(self, data: bytearray | int):
         self._data_command.value(1)
         self._chip_select.value(0)
         if isinstance(data, int):
-            self._spi.write(bytearray([data]))
+            self._byte[0] = data
+            self._write(self._byte)
         else:
-            self._spi.write(data)
+            self._write(data)
         self._chip_select.value(1)
 
+    def _write(self, data):
+        self._spi.write(data)
+        self._bytes_sent += len(data)
+
     def set_window(self, x0, y0, x1, y1):
         """Set the window region for drawing."""
-        self.write_command(0x36)  # Horizontal address start position
-        self.write_data(x0)
-        self.write_command(0x37)  # Horizontal address end position
-        self.write_data(x1)
-        self.write_command(0x38)  # Vertical address start position
-        self.write_data(y0)
-        self.write_command(0x39)  # Vertical address end position
-        self.write_data(y1)
-        self.write_command(0x20)  # RAM address set (X)
-        self.write_data(x0)
-        self.write_command(0x21)  # RAM address set (Y)
-        self.write_data(y0)
+        self._chip_select.value(0)
+        self._send_window(x0, y0, x1, y1)
+        self._chip_select.value(1)
+
+    def _send_window(self, x0: int, y0: int, x1: int, y1: int):
+        # 16 bit index and value pairs, see _WINDOW_COMMANDS
+        self._set_word(2, x1)
+        self._set_word(6, x0)
+        self._set_word(10, y1)
+        self._set_word(14, y0)
+        self._set_word(18, x0)
+        self._set_word(22, y0)
+        views = self._window_views
+        for i in range(0, len(views), 2):
+            self._data_command.value(0)
+            self._write(views[i])
+            self._data_command.value(1)
+            self._write(views[i + 1])
+
+    def _set_word(self, i: int, value: int):
+        window = self._window
+        window[i] = value >> 8
+        window[i + 1] = value & 0xFF
+
+    def set_scroll_area(self, top: int, bottom: int):
+        """Limit hardware scrolling to the rows top to bottom, inclusive."""
+        self.writeRegister(ILI9225_VERTICAL_SCROLL_CTRL1, bottom)
+        self.writeRegister(ILI9225_VERTICAL_SCROLL_CTRL2, top)
+
+    def scroll(self, lines: int):
+        """Shift the scroll area up by lines rows, wrapping around.
+
+        The display shows GRAM row top + (row - top + lines) % height of the area
+        at row, the GRAM itself and the framebuffer stay untouched.
+        """
+        self.writeRegister(ILI9225_VERTICAL_SCROLL_CTRL3, lines)
 
     def framebuffer(self):
         return self._fb
 
     def update(self):
-        """Write the framebuffer content to the display."""
-        self.set_window(0, 0, self._width - 1, self._height - 1)
-        self.write_command(0x22)  # RAM write
-        self.write_data(self._buffer)  # Write entire framebuffer
+        """Write the parts of the framebuffer changed since the last update to the display."""
+        self._bytes_sent = 0
+        dirty = getattr(self._fb, "dirty", None)
+        if dirty is None:
+            self._flush(0, 0, self._width - 1, self._height - 1)
+        elif self._render_band:
+            self._update_bands(dirty)
+        else:
+            rects = dirty.rects()
+            for i in range(dirty.count()):
+                j = 4 * i
+                self._flush(rects[j], rects[j + 1], rects[j + 2], rects[j + 3])
+            dirty.clear()
+        self._frame_bytes = self._bytes_sent
+
+    def _update_bands(self, dirty):
+        # the buffer holds one band of rows, drawn anew for every band the
+        # changed areas reach into
+        rows = self._fb.rows
+        rects = dirty.rects()
+        count = dirty.count()
+        for top in range(0, self._height, rows):
+            bottom = top + rows - 1
+            rendered = False
+            for i in range(count):
+                j = 4 * i
+                y0 = max(rects[j + 1], top)
+                y1 = min(rects[j + 3], bottom)
+                if y0 > y1:
+                    continue
+                if not rendered:
+                    self._render_band(top)
+                    rendered = True
+                self._flush(rects[j], y0, rects[j + 2], y1, top)
+        self._fb.reset()
+
+    def bytes_sent(self) -> int:
+        """Number of bytes written over SPI by the last update."""
+        return self._frame_bytes
+
+    def _flush(self, x0: int, y0: int, x1: int, y1: int, top: int = 0):
+        # top is the screen row of the buffer's first row
+        if y1 - y0 < _CACHED_ROWS:
+            views = self._cached_views(x0, y0 - top, x1, y1 - top)
+        else:
+            views = self._slice(x0, y0 - top, x1, y1 - top)
+        # window, RAM write command and pixels in one chip select
+        self._chip_select.value(0)
+        self._send_window(x0, y0, x1, y1)
+        self._data_command.value(0)
+        self._byte[0] = ILI9225_GRAM_DATA_REG
+        self._write(self._byte)
+        self._data_command.value(1)
+        for view in views:
+            self._write(view)
+        self._chip_select.value(1)
+
+    def _cached_views(self, x0: int, y0: int, x1: int, y1: int) -> list:
+        """Slices of a small rectangle, reused while it keeps being flushed,
+        as a blinking or counting widget does."""
+        for entry in self._views:
+            if entry[0] == x0 and entry[1] == y0 and entry[2] == x1 and entry[3] == y1:
+                return entry[4]
+        entry = self._views[self._next_view]
+        self._next_view = (self._next_view + 1) % _CACHED_RECTS
+        entry[0] = x0
+        entry[1] = y0
+        entry[2] = x1
+        entry[3] = y1
+        entry[4] = self._slice(x0, y0, x1, y1)
+        return entry[4]
+
+    def _slice(self, x0: int, y0: int, x1: int, y1: int) -> list:
+        """The parts of the buffer to send for a rectangle, in order."""
+        stride = self._width * 2
+        start = y0 * stride + x0 * 2
+        if x0 == 0 and x1 == self._width - 1:
+            # full rows are contiguous in the buffer
+            return [self._buffer_view[start : (y1 + 1) * stride]]
+        row_bytes = (x1 - x0 + 1) * 2
+        views = []
+        for _ in range(y1 - y0 + 1):
+            views.append(self._buffer_view[start : start + row_bytes])
+            start += stride
+        return views
 
     def fill(self, color):
         """Fill the screen with the specified color."""
@@ -191,23 +347,7 @@ class ILI9225:
         return (x + (len(string) * 8), y + 8)
 
     def scaled_text(self, string, x, y, c, s=2) -> tuple[int, int]:
-        x0 = x
-        y0 = y
-        iterator = list(range(8)) * s
-        iterator.sort()
-        for char in string:
-            char_index = (ord(char) - 32) * 8
-            for column_offset in iterator:
-                column = petme[char_index + column_offset]
-                # todo loop s times
-                for pixel_offset in range(8):
-                    pixel = column >> pixel_offset
-                    if pixel & 1:
-                        y00 = pixel_offset * s + y0
-                        for y_offset in range(s):
-                            self._fb.pixel(x0, y00 + y_offset, c)
-                x0 = x0 + 1
-        return (x0, y + 8 * s)
+        return glyph_cache.text(self._fb, string, x, y, c, s)
 
     def rect(
         self, x: int, y: int, width: int, height: int, color: int, fill: bool = True
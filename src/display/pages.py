@@ -1,8 +1,13 @@
 from framebuf import FrameBuffer
+from accounting import ACTUATORS, Accounting
 from config import Config
-from display.fonts.petme128_8x8 import font as petme
+from history import NO_VALUE, History
+from profiling import Histogram, Profiler
+from display.glyphs import glyph_cache
 import errno
 
+from display.widgets import Decimal, Duration, Indicator, Label, Value, Widget
+
 from display.ili9225 import (
     COLOR_BLACK,
     COLOR_CYAN,
@@ -15,45 +20,66 @@ from display.ili9225 import (
     COLOR_LIGHTBLUE as COLOR_LIGHTGREEN,
     COLOR_YELLOW,
     COLOR_BROWN,
+    COLOR_GRAY,
 )
 
 
 class Page:
+    in_rotation: bool = True  # reachable with the page button
     _framebuffer: FrameBuffer
     _width: int
     _height: int
     _cleared: bool = False
+    _widgets: list[Widget]
+    _display = None
 
     def __init__(self, framebuffer: FrameBuffer, width: int, height: int):
         self._framebuffer = framebuffer
         self._width = width
         self._height = height
+        self._widgets = []
+
+    def framebuffer(self) -> FrameBuffer:
+        return self._framebuffer
+
+    def attach(self, display):
+        """Give the page the display driver, for pages using its hardware features."""
+        self._display = display
+
+    def activate(self):
+        """Called when the page is shown."""
+        self.invalidate()
+
+    def deactivate(self):
+        """Called when another page is shown instead."""
+
+    def add(self, widget):
+        self._widgets.append(widget)
+        return widget
+
+    def invalidate(self):
+        """Clear the screen and repaint every widget on the next render."""
+        self._cleared = False
 
     def clear(self):
         self._framebuffer.rect(0, 0, self._width, self._height, COLOR_BLACK, True)
         self._cleared = True
+        for widget in self._widgets:
+            widget.invalidate(True)
+
+    def text(self, string: str, x: int, y: int, c: int) -> tuple[int, int]:
+        self._framebuffer.text(string, x, y, c)
+        return (x + len(string) * 8, y + 8)
 
     def scaled_text(self, string, x, y, c, s=2) -> tuple[int, int]:
-        x0 = x
-        y0 = y
-        iterator = list(range(8)) * s
-        iterator.sort()
-        for char in string:
-            char_index = (ord(char) - 32) * 8
-            for column_offset in iterator:
-                column = petme[char_index + column_offset]
-                # todo loop s times
-                for pixel_offset in range(8):
-                    pixel = column >> pixel_offset
-                    if pixel & 1:
-                        y00 = pixel_offset * s + y0
-                        for y_offset in range(s):
-                            self._framebuffer.pixel(x0, y00 + y_offset, c)
-                x0 = x0 + 1
-        return (x0, y + 8 * s)
+        return glyph_cache.text(self._framebuffer, string, x, y, c, s)
 
     def render(self):
-        pass
+        """Repaint the widgets whose data changed, everything after invalidate()."""
+        if not self._cleared:
+            self.clear()
+        for widget in self._widgets:
+            widget.render(self)
 
     def handle_button_up(self):
         pass
@@ -66,20 +92,42 @@ class Page:
 
 
 class OverviewPage(Page):
-    _temperature: float = 0.0
-    _humidity: float = 0.0
-    _target_temperature: float = 0.0
-    _target_humidity: float = 0.0
-    _fan_state: bool = False
-    _fan_on_time: int = 0
-    _fan_off_time: int = 0
-    _counter: int = 0
+    """The readings, their targets and the fan cycle.
+
+    The readings are given in tenths, as they change all the time and are
+    drawn without allocating, see Decimal.
+    """
+
     _blink: bool = True
 
+    def __init__(self, framebuffer: FrameBuffer, width: int, height: int):
+        super().__init__(framebuffer, width, height)
+        self._blink_indicator = self.add(
+            Indicator(width - 15, 5, 10, 10, COLOR_GREEN, COLOR_BLACK)
+        )
+
+        self.add(Label(2, 2, "Temperatur", COLOR_WHITE))
+        self._temperature = self.add(Decimal(5, 16, COLOR_GREEN, 2, degree=(8, 0, 4)))
+        self.add(Label(5, 42, "Soll", COLOR_WHITE))
+        self._target_temperature = self.add(Value(5, 54, "{:03.1f}", COLOR_LIGHTGREEN))
+
+        offset = int(height / 3)
+        self.add(Label(2, offset, "Feuchtigkeit", COLOR_WHITE))
+        self._humidity = self.add(Decimal(5, offset + 16, COLOR_BLUE, 2, " %"))
+        self.add(Label(5, offset + 42, "Soll", COLOR_WHITE))
+        self._target_humidity = self.add(
+            Value(5, offset + 54, "{:03.1f}", COLOR_LIGHTBLUE)
+        )
+
+        offset = 2 * int(height / 3)
+        self.add(Label(2, offset, "Luefter", COLOR_WHITE))
+        self._fan_state = self.add(Value(5, offset + 16, self._fan_label, COLOR_WHITE))
+        self._fan_remaining = self.add(Duration(5 + 7 * 8, offset + 16, COLOR_WHITE))
+
     def set_data(
         self,
-        temperature: float,
-        humidity: float,
+        temperature: int,
+        humidity: int,
         target_temperature: float,
         target_humidity: float,
         fan_state: bool,
@@ -87,63 +135,22 @@ class OverviewPage(Page):
         fan_off_time: int,
         counter: int,
     ):
-        self._temperature = temperature
-        self._humidity = humidity
-        self._target_temperature = target_temperature
-        self._target_humidity = target_humidity
-        self._fan_state = fan_state
-        self._fan_on_time = fan_on_time
-        self._fan_off_time = fan_off_time
-        self._counter = counter
-
-    def _remaining_time(self, minutes: int, seconds: int):
-        # Convert total time in seconds
-        total_seconds = minutes * 60 - seconds
-
-        # Handle negative values
-        if total_seconds < 0:
-            return "0:00"
-
-        # Convert back to minutes and seconds
-        m = total_seconds // 60
-        s = total_seconds % 60
-
-        return f"{m}:{s:02}"
+        self._temperature.set_data(temperature)
+        self._humidity.set_data(humidity)
+        self._target_temperature.set_data(target_temperature)
+        self._target_humidity.set_data(target_humidity)
+        self._fan_state.set_data(fan_state)
+        time = fan_on_time if fan_state else fan_off_time
+        self._fan_remaining.set_data(time * 60 - counter)
+
+    @staticmethod
+    def _fan_label(fan_state: bool) -> str:
+        return "Aus in" if fan_state else "An in"
 
     def render(self):
-        self.clear()
-
-        color = COLOR_GREEN if self._blink else COLOR_BLACK
+        self._blink_indicator.set_data(self._blink)
         self._blink = not self._blink
-        self._framebuffer.rect(self._width - 15, 5, 10, 10, color, True)
-
-        self._framebuffer.text("Temperatur", 2, 2, COLOR_WHITE)
-        x, y = self.scaled_text(f"{self._temperature:03.1f}", 5, 16, COLOR_GREEN)
-        self._framebuffer.ellipse(x + 8, 16, 4, 4, COLOR_GREEN, False)
-        self._framebuffer.text("Soll", 5, 42, COLOR_WHITE)
-        self._framebuffer.text(
-            f"{self._target_temperature:03.1f}", 5, 54, COLOR_LIGHTGREEN
-        )
-
-        offset = int(self._height / 3)
-        self._framebuffer.text("Feuchtigkeit", 2, offset, COLOR_WHITE)
-
-        self.scaled_text(f"{self._humidity:.1f} %", 5, offset + 16, COLOR_BLUE)
-        self._framebuffer.text("Soll", 5, offset + 42, COLOR_WHITE)
-        self._framebuffer.text(
-            f"{self._target_humidity:03.1f}", 5, offset + 54, COLOR_LIGHTBLUE
-        )
-        self._cleared = False
-
-        offset = 2 * int(self._height / 3)
-        self._framebuffer.text("Luefter", 2, offset, COLOR_WHITE)
-        time = self._fan_on_time if self._fan_state else self._fan_off_time
-        self._framebuffer.text(
-            f"{'Aus' if self._fan_state else 'An'} in {self._remaining_time(time, self._counter)}",
-            5,
-            offset + 16,
-            COLOR_WHITE,
-        )
+        super().render()
 
 
 class ConfigValue:
@@ -198,6 +205,23 @@ class ConfigPage(Page):
         ]
         super().__init__(framebuffer, width, height)
 
+        self.add(Label(2, 2, "Konfiguration", COLOR_WHITE))
+        self.add(Label(5, 16, "Temperatur", COLOR_LIGHTBLUE))
+        self.add(Label(2, 60, "Luftfeuchtigkeit", COLOR_LIGHTBLUE))
+        self.add(Label(2, 104, "Luefter", COLOR_LIGHTBLUE))
+        self._rows = [
+            self.add(
+                Value(5, 30, "Soll:     {:03.1f} C", COLOR_WHITE, degree=(-11, 1, 2))
+            ),
+            self.add(
+                Value(5, 44, "Toleranz: {:03.1f} C", COLOR_WHITE, degree=(-11, 0, 2))
+            ),
+            self.add(Value(5, 74, "Soll:     {:03.1f} %", COLOR_WHITE)),
+            self.add(Value(5, 88, "Toleranz: {:03.1f} %", COLOR_WHITE)),
+            self.add(Value(5, 118, "An:       {} min", COLOR_WHITE)),
+            self.add(Value(5, 132, "Aus:      {} min", COLOR_WHITE)),
+        ]
+
     def set_data(self, cursor: int):
         self._cursor = cursor
 
@@ -214,55 +238,9 @@ class ConfigPage(Page):
         return self._config_value_accessors[config_accessor].get()
 
     def render(self):
-        self.clear()
-        self._framebuffer.text("Konfiguration", 2, 2, COLOR_WHITE)
-
-        self._framebuffer.text("Temperatur", 5, 16, COLOR_LIGHTBLUE)
-        text = f"Soll:     {self._get_config_value(self._TEMPERATURE_TARGET):03.1f} C"
-        self._framebuffer.text(text, 5, 30, self._get_color(0))
-        self._framebuffer.ellipse(
-            (len(text) + -1) * 8 + 2, 31, 2, 2, self._get_color(0), False
-        )
-
-        self._framebuffer.text(
-            f"Toleranz: {self._get_config_value(self._TEMPERATURE_TOLERANCE):03.1f} C",
-            5,
-            44,
-            self._get_color(1),
-        )
-        self._framebuffer.ellipse(
-            (len(text) + -1) * 8 + 2, 44, 2, 2, self._get_color(1), False
-        )
-
-        self._framebuffer.text("Luftfeuchtigkeit", 2, 60, COLOR_LIGHTBLUE)
-        self._framebuffer.text(
-            f"Soll:     {self._get_config_value(self._HUMIDITY_TARGET):03.1f} %",
-            5,
-            74,
-            self._get_color(2),
-        )
-        self._framebuffer.text(
-            f"Toleranz: {self._get_config_value(self._TEMPERATURE_TOLERANCE):03.1f} %",
-            5,
-            88,
-            self._get_color(3),
-        )
-
-        self._framebuffer.text("Luefter", 2, 104, COLOR_LIGHTBLUE)
-        self._framebuffer.text(
-            f"An:       {self._get_config_value(self._FAN_ON_INTERVAL)} min",
-            5,
-            118,
-            self._get_color(4),
-        )
-        self._framebuffer.text(
-            f"Aus:      {self._get_config_value(self._FAN_OFF_INTERVAL)} min",
-            5,
-            132,
-            self._get_color(5),
-        )
-
-        self._framebuffer.text
+        for line, row in enumerate(self._rows):
+            row.set_data(self._get_config_value(line), self._get_color(line))
+        super().render()
 
     def handle_button_down(self):
         if self._edit_mode:
@@ -291,16 +269,228 @@ class ConfigPage(Page):
 
 
 class ErrorPage(Page):
+    in_rotation = False
     _error: Exception | None = None
 
+    def __init__(self, framebuffer: FrameBuffer, width: int, height: int):
+        super().__init__(framebuffer, width, height)
+        self.add(Label(2, 2, "Error", COLOR_RED, 2))
+        self._code = self.add(Label(5, 20, "", COLOR_RED))
+        self._message = self.add(Label(5, 40, "", COLOR_RED))
+
     def set_data(self, error: Exception | None):
         self._error = error
+        if isinstance(error, OSError) and isinstance(error.errno, int):
+            self._code.set_data(str(error.errno))
+            self._message.set_data(errno.errorcode[error.errno])
+        else:
+            self._code.set_data("")
+            self._message.set_data(str(error))
+
+
+class TrendPage(Page):
+    """Minute averages of temperature and humidity, newest at the bottom.
+
+    Each minute is one row of the framebuffer, plotted around the targets.
+    Rows are written round robin into the scroll area and the display's
+    hardware scrolling moves the newest one to the bottom, so a new minute
+    costs a single row on the SPI bus instead of a redrawn chart.
+    """
+
+    _HEADER = 12
+    _TEMPERATURE_SPAN = 100  # tenths of a degree across the width
+    _HUMIDITY_SPAN = 500  # tenths of a percent across the width
+
+    def __init__(
+        self,
+        framebuffer: FrameBuffer,
+        width: int,
+        height: int,
+        history: History,
+        config: Config,
+    ):
+        super().__init__(framebuffer, width, height)
+        self._history = history
+        self._config = config
+        self._rows = height - self._HEADER
+        self._next = 0
+        self._seen = 0
+        self._temperature_low = 0
+        self._humidity_low = 0
+        self._previous_temperature = -1
+        self._previous_humidity = -1
+        self.add(Label(2, 2, "Temperatur", COLOR_GREEN))
+        self.add(Label(width - 2 - 7 * 8, 2, "Feuchte", COLOR_BLUE))
+
+    def activate(self):
+        super().activate()
+        if self._display:
+            self._display.set_scroll_area(self._HEADER, self._height - 1)
+
+    def deactivate(self):
+        if self._display:
+            self._display.set_scroll_area(0, self._height - 1)
+            self._display.scroll(0)
+
+    def clear(self):
+        super().clear()
+        self._temperature_low = (
+            int(self._config.get_target_temperature() * 10)
+            - self._TEMPERATURE_SPAN // 2
+        )
+        self._humidity_low = (
+            int(self._config.get_target_humidity() * 10) - self._HUMIDITY_SPAN // 2
+        )
+        self._next = 0
+        self._seen = 0
+        self._previous_temperature = -1
+        self._previous_humidity = -1
 
     def render(self):
-        self.clear()
-        self.scaled_text("Error", 2, 2, COLOR_RED)
-        if isinstance(self._error, OSError) and isinstance(self._error.errno, int):
-            self._framebuffer.text(str(self._error.errno), 5, 20, COLOR_RED)
-            self._framebuffer.text(errno.errorcode[self._error.errno], 5, 40, COLOR_RED)
+        redraw = not self._cleared
+        super().render()
+        # rows have to be in GRAM before they are scrolled into view
+        if (self._draw_new_rows() or redraw) and self._display:
+            self._display.update()
+            self._display.scroll(self._next % self._rows)
+
+    def _draw_new_rows(self) -> bool:
+        temperature = self._history.temperature.minutes.avg
+        humidity = self._history.humidity.minutes.avg
+        count = min(temperature.total() - self._seen, len(temperature), self._rows)
+        self._seen = temperature.total()
+        for i in range(count - 1, -1, -1):
+            self._draw_row(temperature.get(i), humidity.get(i))
+        return count > 0
+
+    def _draw_row(self, temperature: int, humidity: int):
+        y = self._HEADER + self._next % self._rows
+        self._framebuffer.hline(0, y, self._width, COLOR_BLACK)
+        self._framebuffer.pixel(self._width // 2, y, COLOR_GRAY)
+        self._previous_humidity = self._plot(
+            y,
+            humidity,
+            self._previous_humidity,
+            self._humidity_low,
+            self._HUMIDITY_SPAN,
+            COLOR_BLUE,
+        )
+        self._previous_temperature = self._plot(
+            y,
+            temperature,
+            self._previous_temperature,
+            self._temperature_low,
+            self._TEMPERATURE_SPAN,
+            COLOR_GREEN,
+        )
+        self._next += 1
+
+    def _plot(
+        self, y: int, value: int, previous: int, low: int, span: int, color: int
+    ) -> int:
+        """Draw value in row y, joined to the previous row's x. Return its x."""
+        if value == NO_VALUE:
+            return -1
+        x = (value - low) * (self._width - 1) // span
+        x = min(max(x, 0), self._width - 1)
+        if previous < 0:
+            self._framebuffer.pixel(x, y, color)
         else:
-            self._framebuffer.text(self._error, 5, 16, COLOR_RED)
+            self._framebuffer.hline(min(x, previous), y, abs(x - previous) + 1, color)
+        return x
+
+
+class StatsPage(Page):
+    """Duty cycle of the last hour and day, switch count and energy per actuator."""
+
+    _NAMES = ("Kuehlung", "Befeuchter", "Heizung", "Luefter")
+
+    def __init__(
+        self, framebuffer: FrameBuffer, width: int, height: int, accounting: Accounting
+    ):
+        super().__init__(framebuffer, width, height)
+        self._accounting = accounting
+        self.add(Label(2, 2, "Statistik", COLOR_WHITE))
+        self._rows = []
+        for index, name in enumerate(self._NAMES):
+            y = 18 + index * 44
+            self.add(Label(2, y, name, COLOR_LIGHTBLUE))
+            self._rows.append(
+                (
+                    self.add(Value(5, y + 12, "1h  {:3}%", COLOR_WHITE)),
+                    self.add(Value(5 + 10 * 8, y + 12, "24h {:3}%", COLOR_WHITE)),
+                    self.add(Value(5, y + 24, "{} x", COLOR_WHITE)),
+                    self.add(Value(5 + 10 * 8, y + 24, "{:.2f} kWh", COLOR_WHITE)),
+                )
+            )
+        self._total = self.add(Value(2, height - 12, "Gesamt {:.2f} kWh", COLOR_YELLOW))
+
+    def render(self):
+        accounting = self._accounting
+        for index in range(len(ACTUATORS)):
+            hour, day, switches, energy = self._rows[index]
+            hour.set_data(int(accounting.hour_duty(index) * 100 + 0.5))
+            day.set_data(int(accounting.day_duty(index) * 100 + 0.5))
+            switches.set_data(accounting.switches(index))
+            energy.set_data(accounting.energy_wh(index) / 1000)
+        self._total.set_data(accounting.energy_wh() / 1000)
+        super().render()
+
+
+class DiagnosticsPage(Page):
+    """Median, 99th percentile and maximum duration of the main loop stages.
+
+    Durations are in ms, with one decimal below 10 ms and in whole seconds
+    from 1 s on, so none takes more than 3 of the 13 characters right of
+    _VALUE_X. The enter button clears the histograms.
+    """
+
+    _VALUE_X = 2 + 8 * 8
+
+    def __init__(
+        self, framebuffer: FrameBuffer, width: int, height: int, profiler: Profiler
+    ):
+        super().__init__(framebuffer, width, height)
+        self.in_rotation = profiler.enabled
+        self._profiler = profiler
+        self._rows = []
+        self.add(Label(2, 2, "Diagnose (ms)", COLOR_WHITE))
+        self.add(Label(self._VALUE_X, 16, " p50 p99  max", COLOR_LIGHTBLUE))
+
+    def render(self):
+        histograms = self._profiler.histograms()
+        while len(self._rows) < len(histograms):
+            histogram = histograms[len(self._rows)]
+            y = 30 + len(self._rows) * 12
+            self.add(Label(2, y, histogram.name[:7], COLOR_LIGHTBLUE))
+            self._rows.append(
+                self.add(Value(self._VALUE_X, y, self._summary(histogram), COLOR_WHITE))
+            )
+            self.invalidate()
+        for index in range(len(self._rows)):
+            self._rows[index].set_data(histograms[index].count)
+        super().render()
+
+    @staticmethod
+    def _summary(histogram: Histogram):
+        def summary(count: int) -> str:
+            if not count:
+                return "-"
+            return (
+                f"{DiagnosticsPage._ms(histogram.percentile(50)):>4}"
+                f"{DiagnosticsPage._ms(histogram.percentile(99)):>4}"
+                f"{DiagnosticsPage._ms(histogram.max_us):>5}"
+            )
+
+        return summary
+
+    @staticmethod
+    def _ms(us: int) -> str:
+        if us < 9950:
+            return f"{us / 1000:.1f}"
+        if us < 999500:
+            return str(round(us / 1000))
+        return f"{min(round(us / 1000000), 99)}s"
+
+    def handle_button_enter(self):
+        self._profiler.reset()
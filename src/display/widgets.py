@@ -0,0 +1,291 @@
+from display.glyphs import glyph_cache
+from display.ili9225 import COLOR_BLACK
+
+# the characters Duration and Decimal draw, they keep indices into this
+_DIGITS = ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9", ":", ".", "-", " ", "%")
+_COLON = 10
+_POINT = 11
+_MINUS = 12
+
+
+class Widget:
+    """A retained element of a page.
+
+    A widget remembers the area it painted last. It only repaints (erasing
+    that area first) after set_data handed it something that looks different.
+    """
+
+    _x: int
+    _y: int
+    _bounds: tuple[int, int, int, int] | None = None
+    _dirty: bool = True
+
+    def __init__(self, x: int, y: int):
+        self._x = x
+        self._y = y
+
+    def invalidate(self, erased: bool = False):
+        """Force a repaint on the next render, erased means the screen was already cleared."""
+        self._dirty = True
+        if erased:
+            self._bounds = None
+
+    def bounds(self) -> tuple[int, int, int, int] | None:
+        return self._bounds
+
+    def render(self, page) -> bool:
+        """Repaint the widget if needed. Return whether anything was drawn."""
+        if not self._dirty:
+            return False
+        if self._bounds:
+            x, y, width, height = self._bounds
+            page.framebuffer().fill_rect(x, y, width, height, COLOR_BLACK)
+        self._bounds = self.paint(page)
+        self._dirty = False
+        return True
+
+    def paint(self, page) -> tuple[int, int, int, int] | None:
+        """Draw the widget and return the x, y, width, height it covers."""
+        return None
+
+
+class Label(Widget):
+    def __init__(self, x: int, y: int, text: str, color: int, scale: int = 1):
+        super().__init__(x, y)
+        self._text = text
+        self._color = color
+        self._scale = scale
+
+    def set_data(self, text: str, color: int | None = None):
+        if color is None:
+            color = self._color
+        if text != self._text or color != self._color:
+            self._text = text
+            self._color = color
+            self._dirty = True
+
+    def paint(self, page):
+        if not self._text:
+            return None
+        if self._scale == 1:
+            x, y = page.text(self._text, self._x, self._y, self._color)
+        else:
+            x, y = page.scaled_text(
+                self._text, self._x, self._y, self._color, self._scale
+            )
+        return (self._x, self._y, x - self._x, y - self._y)
+
+
+class Value(Label):
+    """A label showing a value run through a format string or function.
+
+    degree draws a small circle after the text, given as (dx, dy, radius)
+    relative to the end of the text.
+    """
+
+    _value = None
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        formatter,
+        color: int,
+        scale: int = 1,
+        degree: tuple[int, int, int] | None = None,
+    ):
+        super().__init__(x, y, "", color, scale)
+        self._formatter = formatter
+        self._degree = degree
+
+    def set_data(self, value, color: int | None = None):
+        if value != self._value:
+            self._value = value
+            if isinstance(self._formatter, str):
+                text = self._formatter.format(value)
+            else:
+                text = self._formatter(value)
+        else:
+            text = self._text
+        super().set_data(text, color)
+
+    def paint(self, page):
+        bounds = super().paint(page)
+        if bounds is None or self._degree is None:
+            return bounds
+        x, y, width, height = bounds
+        dx, dy, radius = self._degree
+        cx = x + width + dx
+        cy = y + dy
+        page.framebuffer().ellipse(cx, cy, radius, radius, self._color, False)
+        right = max(x + width, cx + radius + 1)
+        top = min(y, cy - radius)
+        bottom = max(y + height, cy + radius + 1)
+        return (x, top, right - x, bottom - top)
+
+
+class Duration(Widget):
+    """Seconds shown as minutes:seconds, negative ones as 0:00.
+
+    It changes every second, so it is formatted into a fixed buffer and drawn
+    digit by digit instead of building a new string each time.
+    """
+
+    _seconds: int = -1
+    _length: int = 0
+
+    def __init__(self, x: int, y: int, color: int, size: int = 8):
+        super().__init__(x, y)
+        self._color = color
+        self._chars = bytearray(size)  # indices into _DIGITS, right aligned
+        self._areas = tuple((x, y, length * 8, 8) for length in range(size + 1))
+
+    def set_data(self, seconds: int):
+        seconds = max(seconds, 0)
+        if seconds == self._seconds:
+            return
+        self._seconds = seconds
+        chars = self._chars
+        i = len(chars) - 1
+        chars[i] = seconds % 10
+        chars[i - 1] = seconds % 60 // 10
+        chars[i - 2] = _COLON
+        i -= 3
+        minutes = seconds // 60
+        while True:
+            chars[i] = minutes % 10
+            minutes //= 10
+            if not minutes or i == 0:
+                break
+            i -= 1
+        self._length = len(chars) - i
+        self._dirty = True
+
+    def paint(self, page):
+        framebuffer = page.framebuffer()
+        chars = self._chars
+        x = self._x
+        for i in range(len(chars) - self._length, len(chars)):
+            framebuffer.text(_DIGITS[chars[i]], x, self._y, self._color)
+            x += 8
+        return self._areas[self._length]
+
+
+class Decimal(Widget):
+    """A value given in tenths, shown with one decimal and a fixed suffix.
+
+    Like Duration it is formatted into a fixed buffer and drawn character by
+    character, and it paints into the same bounds list every time, so a
+    changing reading repaints without allocating. The suffix may only use the
+    characters of _DIGITS, degree is drawn as for Value. Values are clamped to
+    -999.9 and 9999.9.
+    """
+
+    _tenths: int | None = None
+    _length: int = 0
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        color: int,
+        scale: int = 1,
+        suffix: str = "",
+        degree: tuple[int, int, int] | None = None,
+    ):
+        super().__init__(x, y)
+        self._color = color
+        self._scale = scale
+        self._degree = degree
+        self._suffix = bytes(_DIGITS.index(char) for char in suffix)
+        # indices into _DIGITS, left aligned, "-999.9" and the suffix
+        self._chars = bytearray(6 + len(suffix))
+        self._area = [x, y, 0, 0]
+
+    def set_data(self, tenths: int):
+        if tenths == self._tenths:
+            return
+        self._tenths = tenths
+        tenths = min(max(tenths, -9999), 99999)
+        chars = self._chars
+        i = 0
+        if tenths < 0:
+            chars[0] = _MINUS
+            tenths = -tenths
+            i = 1
+        whole = tenths // 10
+        digits = 1
+        while whole >= 10**digits:
+            digits += 1
+        point = i + digits
+        for j in range(point - 1, i - 1, -1):
+            chars[j] = whole % 10
+            whole //= 10
+        chars[point] = _POINT
+        chars[point + 1] = tenths % 10
+        i = point + 2
+        for index in self._suffix:
+            chars[i] = index
+            i += 1
+        self._length = i
+        self._dirty = True
+
+    def paint(self, page):
+        if not self._length:
+            return None
+        framebuffer = page.framebuffer()
+        scale = self._scale
+        step = 8 * scale
+        chars = self._chars
+        color = self._color
+        cache = glyph_cache
+        x = self._x
+        y = self._y
+        for i in range(self._length):
+            char = _DIGITS[chars[i]]
+            if scale == 1:
+                framebuffer.text(char, x, y, color)
+            else:
+                glyph = cache.get(char, scale, color)
+                framebuffer.blit(glyph, x, y, glyph.key)
+            x += step
+        area = self._area
+        area[1] = y
+        area[2] = x - self._x
+        area[3] = step
+        if self._degree is not None:
+            dx, dy, radius = self._degree
+            cx = x + dx
+            cy = y + dy
+            framebuffer.ellipse(cx, cy, radius, radius, color, False)
+            top = min(y, cy - radius)
+            area[1] = top
+            area[2] = max(x, cx + radius + 1) - self._x
+            area[3] = max(y + step, cy + radius + 1) - top
+        return area
+
+
+class Indicator(Widget):
+    """A filled square that shows one of two colors."""
+
+    _state: bool = False
+
+    def __init__(
+        self, x: int, y: int, width: int, height: int, on_color: int, off_color: int
+    ):
+        super().__init__(x, y)
+        self._width = width
+        self._height = height
+        self._on_color = on_color
+        self._off_color = off_color
+        self._area = (x, y, width, height)
+
+    def set_data(self, state: bool):
+        if state != self._state:
+            self._state = state
+            self._dirty = True
+
+    def paint(self, page):
+        color = self._on_color if self._state else self._off_color
+        page.framebuffer().fill_rect(self._x, self._y, self._width, self._height, color)
+        return self._area
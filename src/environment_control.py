@@ -1,5 +1,6 @@
 from machine import Pin
 from neopixel import NeoPixel
+from config import Config, Thresholds
 
 
 class EnvironmentControl:
@@ -19,6 +20,7 @@ class EnvironmentControl:
     _prev_atomizer_state: bool
     _prev_heater_state: bool
     _neo_pixel: NeoPixel
+    _thresholds: Thresholds
 
     def __init__(self, fan, atomizer, fridge, heater, config):
         self._fan = fan
@@ -28,8 +30,13 @@ class EnvironmentControl:
         self._led_atomizer = Pin(6, Pin.OUT, value=0)
         self._led_fridge = Pin(4, Pin.OUT, value=0)
         self._config = config
+        self._thresholds = config.get_thresholds()
+        config.add_listener(self._config_changed)
         # self._neo_pixel = NeoPixel(Pin(0), 10)
 
+    def _config_changed(self, config: Config):
+        self._thresholds = config.get_thresholds()
+
     def control(self, temperature: float, humidity: float):
         if not self._prev_humidity:
             self._prev_humidity = humidity
@@ -49,61 +56,46 @@ class EnvironmentControl:
         self._prev_atomizer_state = self._atomizer.value()
 
     def _control_fan(self, humidity: float):
-        if humidity >= (
-            self._config.get_target_humidity() + self._config.get_humidity_tolerance()
-        ) and self._prev_humidity >= (
-            self._config.get_target_humidity() + self._config.get_humidity_tolerance()
-        ):
+        thresholds = self._thresholds
+        if humidity >= thresholds.fan_on and self._prev_humidity >= thresholds.fan_on:
             self._fan.value(1)
             # self._neo_pixel[self._FAN_LED_INDEX] = self._COLOR_ACTIVE_FAN
-        if (
-            humidity <= self._config.get_target_humidity()
-            and self._prev_humidity <= self._config.get_target_humidity()
-        ):
+        if humidity <= thresholds.fan_off and self._prev_humidity <= thresholds.fan_off:
             self._fan.value(0)
             # self._neo_pixel[self._FAN_LED_INDEX] = self._LED_OFF
 
     def _control_atomizer(self, humidity: float):
-        if humidity <= (
-            self._config.get_target_humidity() - self._config.get_humidity_tolerance()
-        ):
+        thresholds = self._thresholds
+        if humidity <= thresholds.atomizer_on:
             self._atomizer.value(1)
-            self._led_atomizer.value(1)
             # self._neo_pixel[self._ATOMIZER_LED_INDEX] = self._COLOR_ACTIVE_ATOMIZER
-        if humidity >= self._config.get_target_humidity():
+        if humidity >= thresholds.atomizer_off:
             self._atomizer.value(0)
-            self._led_atomizer.value(0)
             # self._neo_pixel[self._ATOMIZER_LED_INDEX] = self._LED_OFF
+        # the relay may be guarded and hold back a change, show what it does
+        self._led_atomizer.value(self._atomizer.value())
 
     def _control_fridge(self, temperature: float):
-        if temperature >= (
-            self._config.get_target_temperature()
-            + self._config.get_temperature_tolerance()
-        ) and self._prev_temperature >= (
-            self._config.get_target_temperature()
-            + self._config.get_temperature_tolerance()
+        thresholds = self._thresholds
+        if (
+            temperature >= thresholds.fridge_on
+            and self._prev_temperature >= thresholds.fridge_on
         ):
             self._fridge.value(0)
-            self._led_fridge.value(1)
             # self._neo_pixel[self._COOLER_LED_INDEX] = self._COLOR_ACTIVE_COOLING
         if (
-            temperature <= self._config.get_target_temperature()
-            and self._prev_temperature <= self._config.get_target_temperature()
+            temperature <= thresholds.fridge_off
+            and self._prev_temperature <= thresholds.fridge_off
         ):
             self._fridge.value(1)
-            self._led_fridge.value(0)
             # self._neo_pixel[self._COOLER_LED_INDEX] = self._LED_OFF
+        self._led_fridge.value(not self._fridge.value())
 
     def _control_heater(self, temperature: float):
-        if temperature <= (
-            self._config.get_target_temperature()
-            - self._config.get_temperature_tolerance()
-        ):
+        thresholds = self._thresholds
+        if temperature <= thresholds.heater_on:
             self._heater.value(1)
-        if temperature >= (
-            self._config.get_target_temperature()
-            + self._config.get_temperature_tolerance() / 2
-        ):
+        if temperature >= thresholds.heater_off:
             self._heater.value(0)
 
     def get_fan_state(self) -> bool:
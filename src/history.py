@@ -0,0 +1,156 @@
+from array import array
+
+NO_VALUE = -32768  # marks a rollup period without any sample
+
+
+def to_tenths(value: float) -> int:
+    return round(value * 10)
+
+
+class Ring:
+    """Fixed size ring over an array. Index 0 is the newest entry."""
+
+    def __init__(self, typecode: str, capacity: int):
+        self._data = array(typecode, [0]) * capacity
+        self._capacity = capacity
+        self._head = 0
+        self._count = 0
+        self._total = 0
+
+    def push(self, value: int):
+        self._data[self._head] = value
+        self._head += 1
+        if self._head == self._capacity:
+            self._head = 0
+        if self._count < self._capacity:
+            self._count += 1
+        self._total += 1
+
+    def get(self, index: int) -> int:
+        if index < 0 or index >= self._count:
+            raise IndexError("ring index out of range")
+        index = self._head - 1 - index
+        if index < 0:
+            index += self._capacity
+        return self._data[index]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def capacity(self) -> int:
+        return self._capacity
+
+    def total(self) -> int:
+        """Number of entries pushed since construction, including overwritten ones."""
+        return self._total
+
+    def footprint(self) -> int:
+        return len(self._data) * self._data.itemsize
+
+
+class Rollup:
+    """Minimum, average and maximum of a value per period of period_s seconds.
+
+    Samples are folded into the running period as they arrive. When a sample
+    belongs to a later period the running one is pushed to the rings, periods
+    without samples in between are pushed as NO_VALUE.
+    """
+
+    def __init__(self, period_s: int, capacity: int):
+        self._period_s = period_s
+        self.min = Ring("h", capacity)
+        self.avg = Ring("h", capacity)
+        self.max = Ring("h", capacity)
+        self._period = -1
+        self._sum = 0
+        self._count = 0
+        self._min = 0
+        self._max = 0
+
+    def add(self, timestamp: int, value: int):
+        period = timestamp // self._period_s
+        if period != self._period:
+            if self._period >= 0 and period > self._period:
+                self._close()
+                gaps = min(period - self._period - 1, self.min.capacity())
+                for _ in range(gaps):
+                    self.min.push(NO_VALUE)
+                    self.avg.push(NO_VALUE)
+                    self.max.push(NO_VALUE)
+            self._period = period
+            self._sum = 0
+            self._count = 0
+            self._min = value
+            self._max = value
+        self._sum += value
+        self._count += 1
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def _close(self):
+        self.min.push(self._min)
+        self.avg.push(self._sum // self._count)
+        self.max.push(self._max)
+
+    def newest_start(self) -> int:
+        """Start timestamp of the period at index 0."""
+        return (self._period - 1) * self._period_s
+
+    def __len__(self) -> int:
+        return len(self.avg)
+
+    def footprint(self) -> int:
+        return self.min.footprint() + self.avg.footprint() + self.max.footprint()
+
+
+class Channel:
+    def __init__(self, raw_capacity: int, minute_capacity: int, hour_capacity: int):
+        self.raw = Ring("h", raw_capacity)
+        self.minutes = Rollup(60, minute_capacity)
+        self.hours = Rollup(3600, hour_capacity)
+
+    def add(self, timestamp: int, value: int):
+        self.raw.push(value)
+        self.minutes.add(timestamp, value)
+        self.hours.add(timestamp, value)
+
+    def footprint(self) -> int:
+        return self.raw.footprint() + self.minutes.footprint() + self.hours.footprint()
+
+
+class History:
+    """Readings of the last hour plus minute and hour rollups, in fixed size arrays.
+
+    Values are stored in tenths (23.4 is 234). Every lookup is O(1) by index,
+    0 being the newest. The default sizes keep an hour of raw samples at one
+    sample every 3.5 s, 6 hours of minutes and a week of hours in about 15 KB.
+    """
+
+    def __init__(
+        self,
+        raw_capacity: int = 1024,
+        minute_capacity: int = 360,
+        hour_capacity: int = 168,
+    ):
+        self.timestamps = Ring("l", raw_capacity)
+        self.temperature = Channel(raw_capacity, minute_capacity, hour_capacity)
+        self.humidity = Channel(raw_capacity, minute_capacity, hour_capacity)
+
+    def add(self, timestamp: int, temperature: float, humidity: float):
+        self.add_tenths(timestamp, to_tenths(temperature), to_tenths(humidity))
+
+    def add_tenths(self, timestamp: int, temperature: int, humidity: int):
+        self.timestamps.push(timestamp)
+        self.temperature.add(timestamp, temperature)
+        self.humidity.add(timestamp, humidity)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def footprint(self) -> int:
+        """Bytes held by the arrays, fixed from construction on."""
+        return (
+            self.timestamps.footprint()
+            + self.temperature.footprint()
+            + self.humidity.footprint()
+        )
@@ -1,42 +1,114 @@
-from sys import stdin
-from select import select
-from time import sleep
-from framebuf import RGB565, FrameBuffer
-from micropython import schedule
-from machine import Pin, Timer
+import asyncio
+from sys import stdin, stdout
+from select import POLLIN, poll
+from time import ticks_add, ticks_diff, ticks_ms, ticks_us, time
+from machine import Pin
 from dht import DHT22
+from accounting import ACTUATORS, Accounting
+from commands import (
+    CommandInterpreter,
+    register_config,
+    register_history,
+    register_log,
+)
 from config import Config
+from datalog import (
+    ERROR_CONTROL,
+    ERROR_NO_READING,
+    ERROR_SENSOR,
+    RecordLog,
+    actuator_mask,
+)
+from history import History
+from profiling import Profiler
+from relay_guard import RelayGuard
 from debounce import DebouncedSwitch
-from _thread import start_new_thread
-
-from display.pages import ConfigPage, ErrorPage, OverviewPage
+from sensor import Reading, SensorWorker
+from telemetry import Telemetry
+
+from display.banded import BandedFrameBuffer
+from display.pages import (
+    ConfigPage,
+    DiagnosticsPage,
+    ErrorPage,
+    OverviewPage,
+    StatsPage,
+    TrendPage,
+)
 from output import Pager
 from environment_control import EnvironmentControl
 
+SENSOR_INTERVAL_MS = 3500
+CONTROL_INTERVAL_MS = 1000
+FRAME_INTERVAL_MS = 250
+SERIAL_INTERVAL_MS = 50
+CONFIG_POLL_MS = 500
+FAN_TICK_MS = 1000
+LOG_INTERVAL_MS = 60000
+TELEMETRY_POLL_MS = 100
+GC_INTERVAL_MS = 5000
+
 dht = DHT22(Pin(22, Pin.PULL_UP))
-timer = Timer(-1)
 up = Pin(17, Pin.IN, Pin.PULL_DOWN)
 down = Pin(21, Pin.IN, Pin.PULL_DOWN)
 edit = Pin(18, Pin.IN, Pin.PULL_DOWN)
 page_button = Pin(16, Pin.IN, Pin.PULL_DOWN)
 dht_enable = Pin(13, Pin.OUT, value=1)
-fan = Pin(12, mode=Pin.OUT, value=0)
 
+profiler = Profiler()
 config = Config("config.json")
+history = History()
+datalog = RecordLog("log")
+accounting = Accounting("stats.json", config)
+# the fridge relay is active low: 0 runs the compressor
+fridge_guard = RelayGuard(
+    Pin(14, mode=Pin.OUT, value=0),
+    min_on_ms=3 * 60 * 1000,
+    min_off_ms=5 * 60 * 1000,
+    max_starts_per_hour=6,
+    active_low=True,
+)
+atomizer_guard = RelayGuard(
+    Pin(15, mode=Pin.OUT, value=0), min_on_ms=10 * 1000, min_off_ms=10 * 1000
+)
+# heater and fan do not short cycle, their guards without limits never hold
+# a change back and only keep the guard command's report complete
+heater_guard = RelayGuard(Pin(28, mode=Pin.OUT, value=0))
+fan = RelayGuard(Pin(12, mode=Pin.OUT, value=0))
+relay_guards = {
+    "fridge": fridge_guard,
+    "atomizer": atomizer_guard,
+    "heater": heater_guard,
+    "fan": fan,
+}
 environment_control = EnvironmentControl(
     fan=fan,
-    atomizer=Pin(15, mode=Pin.OUT, value=0),
-    fridge=Pin(14, mode=Pin.OUT, value=0),
-    heater=Pin(28, mode=Pin.OUT, value=0),
+    atomizer=atomizer_guard,
+    fridge=fridge_guard,
+    heater=heater_guard,
     config=config,
 )
-buffer = bytearray(176 * 220 * 2)  # 2 bytes per pixel (RGB565)
-framebuffer = FrameBuffer(buffer, 176, 220, RGB565)
+# the pages' drawing is recorded and sent 16 rows at a time, through a strip
+# of 5.5 KB instead of a 77 KB framebuffer of the whole screen
+framebuffer = BandedFrameBuffer(176, 220, rows=16)
+buffer = framebuffer.buffer
 overview_page = OverviewPage(framebuffer, 176, 220)
 config_page = ConfigPage(framebuffer, 176, 220, config)
+trend_page = TrendPage(framebuffer, 176, 220, history, config)
+stats_page = StatsPage(framebuffer, 176, 220, accounting)
+diagnostics_page = DiagnosticsPage(framebuffer, 176, 220, profiler)
 error_page = ErrorPage(framebuffer, 176, 220)
-pages = [overview_page, config_page, error_page]
+pages = [
+    overview_page,
+    config_page,
+    trend_page,
+    stats_page,
+    diagnostics_page,
+    error_page,
+]
 pager = Pager(environment_control, pages, framebuffer, buffer)
+render_page = profiler.timed("page", pager.render_page)
+update_display = profiler.timed("display", pager.update_display)
 
 
 def button_handler(pin: Pin):
@@ -50,49 +122,34 @@ def button_handler(pin: Pin):
         pager.next_page()
 
 
-should_run = False
-is_running = False
+loop_lag_ms = 0  # worst lateness of a periodic task since the last telemetry
 
 
-class Scheduler:
-    _err_cnt = 0
-    _is_measuring = False
+async def periodic(period_ms: int, callback):
+    """Call callback every period_ms, sleeping until the next deadline in between."""
+    global loop_lag_ms
+    deadline = ticks_ms()
+    while True:
+        deadline = ticks_add(deadline, period_ms)
+        delay = ticks_diff(deadline, ticks_ms())
+        if delay > 0:
+            await asyncio.sleep_ms(delay)
+        else:
+            # fell behind, skip the missed deadlines instead of bursting
+            loop_lag_ms = max(loop_lag_ms, -delay)
+            deadline = ticks_ms()
+            await asyncio.sleep_ms(0)
+        callback()
 
-    def __init__(self, dht: DHT22, dht_enable: Pin, fan_control):
-        # self._running = False
-        # self._thread_runing = False
+
+class Scheduler:
+    def __init__(self, fan_control):
         self._increment_counter = 0
-        self._dht_enable = dht_enable
-        self._timer = Timer()
-        self._measure_timer = Timer()
-        self._dht = dht
         self._fan_control = fan_control
+        self._tasks = []
 
     def start(self):
-        global should_run
-        should_run = True
-        self._timer.init(mode=Timer.PERIODIC, period=1000, callback=self._timer_cb)
-        self._measure_timer.init(
-            mode=Timer.PERIODIC, period=3500, callback=self._run_new_thread
-        )
-        # start_new_thread(self._run, ())
-
-    def _run_new_thread(self, timer):
-        if self._is_measuring:
-            return
-        self._is_measuring = True
-        start_new_thread(self._measure, ())
-
-    def _run(self):
-        global should_run
-        global is_running
-        is_running = True
-        while should_run:
-            sleep(3)
-            self._measure()
-            # self._dht.measure()
-        is_running = False
-        print(f"exited loop: {is_running}")
+        self._tasks = [asyncio.create_task(periodic(FAN_TICK_MS, self.tick))]
 
     def reset_counter(self):
         self._increment_counter = 0
@@ -101,31 +158,16 @@ class Scheduler:
         return self._increment_counter
 
     def stop(self):
-        global should_run
-        should_run = False
-        print("attempt stopping the thread")
-        self._timer.deinit()
-        while is_running:
-            sleep(0.1)
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
         print("Scheduler stopped")
 
-    def _timer_cb(self, timer):
+    def tick(self):
+        """Count a second of fan time, checking the fan cycle once a minute."""
         self._increment_counter = self._increment_counter + 1
         if self._increment_counter % 60 == 0:
-            schedule(self._fan_control, self)
-
-    def _measure(self):
-        try:
-            if self._dht_enable.value() == 1:
-                self._dht.measure()
-            else:
-                self._dht_enable.value(1)
-        except OSError as e:
-            self._err_cnt = self._err_cnt + 1
-            print(f"{e} {self._err_cnt}")
-            self._dht_enable.value(0)
-        finally:
-            self._is_measuring = False
+            self._fan_control(self)
 
 
 page_handler = DebouncedSwitch(page_button, button_handler)
@@ -150,64 +192,228 @@ def fan_control(scheduler: Scheduler):
             scheduler.reset_counter()
 
 
-def read_serial():
-    if stdin in select([stdin], [], [], 0)[0]:
-        return stdin.readline().strip()
-    return None
-
-
-scheduler = Scheduler(dht, dht_enable, fan_control)
-
-
-def main():
-    tmp = 0.0
-    humidity = 0.0
-    log = True
-    scheduler.start()
-    while True:
-        # if scheduler.counter() % 10 == 0:
-        #     if log:
-        #         print(f"Temperatur:\t\t {dht.temperature()}")
-        #         print(f"Luftfeuchtigkeit:\t {dht.humidity()}")
-        #         print(f"Soll Temperatur:\t {config.get_target_temperature()}")
-        #         print(f"Soll Luftfeuchtigkeit:\t {config.get_target_humidity()}")
-        #         print(
-        #             f"Lüfter:\t\t\t {'An' if environment_control.get_fan_state() else 'Aus'}"
-        #         )
-        #         print(f"Lüfter an für:\t\t {config.get_fan_on_interval()} Minuten")
-        #         print(f"Lüfter aus für:\t\t {config.get_fan_off_interval()} Minuten\n")
-        #         log = False
-        # else:
-        #     log = True
-        overview_page.set_data(
-            dht.temperature(),
-            dht.humidity(),
-            config.get_target_temperature(),
-            config.get_target_humidity(),
-            environment_control.get_fan_state(),
-            config.get_fan_on_interval(),
-            config.get_fan_off_interval(),
-            scheduler.counter(),
-        )
-        tmp = dht.temperature()
-        humidity = dht.humidity()
-        msg = read_serial()
-        if msg:
-            print(f"Pico received: {msg}")
+serial_poll = poll()
+serial_poll.register(stdin, POLLIN)
+# ipoll() reuses its result where poll() allocates a list, CPython only has poll()
+poll_serial = getattr(serial_poll, "ipoll", serial_poll.poll)
+telemetry = Telemetry(stdout.buffer)
+control_us = 0
+render_us = 0
+
+
+scheduler = Scheduler(fan_control)
+sensor = SensorWorker(dht, dht_enable, SENSOR_INTERVAL_MS)
+reading = Reading()
+_recorded = -1
+_control_failed = False
+
+
+def control():
+    global _recorded, _control_failed, control_us
+    start = ticks_us()
+    sensor.read_into(reading)
+    if reading.valid:
+        if reading.timestamp != _recorded:
+            _recorded = reading.timestamp
+            history.add_tenths(
+                reading.seconds, reading.temperature_tenths, reading.humidity_tenths
+            )
         try:
-            environment_control.control(tmp, humidity)
-        except KeyboardInterrupt:
-            scheduler.stop()
-            print("stopped timer")
+            control_relays()
+            _control_failed = False
         except OSError as e:
+            _control_failed = True
             print(e)
-
-        pager.display()
+    accounting.update(actuators())
+    control_us = ticks_diff(ticks_us(), start)
+
+
+def switch_relays():
+    environment_control.control(reading.temperature, reading.humidity)
+
+
+control_relays = profiler.timed("relays", switch_relays)
+
+
+def error_flags() -> int:
+    errors = 0
+    if reading.error:
+        errors |= ERROR_SENSOR
+    if not reading.valid:
+        errors |= ERROR_NO_READING
+    if _control_failed:
+        errors |= ERROR_CONTROL
+    return errors
+
+
+def actuators() -> int:
+    return actuator_mask(
+        environment_control.get_fridge_status(),
+        environment_control.get_atomizer_state(),
+        environment_control.get_heater_status(),
+        environment_control.get_fan_state(),
+    )
+
+
+def log_record():
+    sensor.read_into(reading)
+    datalog.append(
+        int(time()),
+        reading.temperature_tenths,
+        reading.humidity_tenths,
+        actuators(),
+        error_flags(),
+    )
+
+
+def send_telemetry():
+    global loop_lag_ms
+    if not telemetry.due():
+        return
+    sensor.read_into(reading)
+    telemetry.send(
+        reading.temperature_tenths,
+        reading.humidity_tenths,
+        actuators(),
+        error_flags(),
+        scheduler.counter(),
+        control_us,
+        render_us,
+        loop_lag_ms,
+    )
+    loop_lag_ms = 0
+
+
+def render():
+    global render_us
+    start = ticks_us()
+    sensor.read_into(reading)
+    overview_page.set_data(
+        reading.temperature_tenths,
+        reading.humidity_tenths,
+        config.get_target_temperature(),
+        config.get_target_humidity(),
+        environment_control.get_fan_state(),
+        config.get_fan_on_interval(),
+        config.get_fan_off_interval(),
+        scheduler.counter(),
+    )
+    render_page()
+    update_display()
+    render_us = ticks_diff(ticks_us(), start)
+
+
+def snapshot_command(args: list) -> str:
+    sensor.read_into(reading)
+    return (
+        f"t={reading.temperature} h={reading.humidity} valid={int(reading.valid)}"
+        f" err={reading.error}"
+        f" fridge={int(environment_control.get_fridge_status())}"
+        f" atomizer={int(environment_control.get_atomizer_state())}"
+        f" heater={int(environment_control.get_heater_status())}"
+        f" fan={int(environment_control.get_fan_state())}"
+        f" counter={scheduler.counter()} page={pager.page()}"
+    )
+
+
+def page_command(args: list) -> str:
+    """page [next|index]"""
+    if not args or args[0] == "next":
+        pager.next_page()
+    else:
+        pager.set_page(pages[int(args[0])])
+    return f"page={pager.page()}"
+
+
+def telemetry_command(args: list) -> str:
+    """telemetry [on|off] [interval_ms]"""
+    if args:
+        if args[0] not in ("on", "off"):
+            raise ValueError("expected on or off")
+        if len(args) > 1:
+            telemetry.set_interval(int(args[1]))
+        telemetry.enabled = args[0] == "on"
+    return f"telemetry={int(telemetry.enabled)} interval={telemetry.interval()}"
+
+
+def guard_command(args: list) -> str:
+    return " ".join(
+        f"{name}_denied={guard.denied} {name}_delayed={guard.delayed}"
+        f" {name}_delay_ms={guard.delay_ms}"
+        for name, guard in relay_guards.items()
+    )
+
+
+def stats_command(args: list) -> str:
+    return " ".join(
+        f"{name}_on_s={accounting.on_seconds(i)}"
+        f" {name}_switches={accounting.switches(i)}"
+        f" {name}_duty_h={accounting.hour_duty(i):.3f}"
+        f" {name}_duty_d={accounting.day_duty(i):.3f}"
+        f" {name}_wh={accounting.energy_wh(i):.1f}"
+        for i, (name, _) in enumerate(ACTUATORS)
+    )
+
+
+def diagnostics_command(args: list) -> str:
+    """diag [reset]: count/p50/p99/max in us per main loop stage"""
+    if args and args[0] == "reset":
+        profiler.reset()
+    return profiler.report()
+
+
+interpreter = CommandInterpreter()
+register_config(interpreter, config)
+register_history(interpreter, history)
+register_log(interpreter, datalog)
+interpreter.register("snap", snapshot_command)
+interpreter.register("page", page_command)
+interpreter.register("telemetry", telemetry_command)
+interpreter.register("guard", guard_command)
+interpreter.register("stats", stats_command)
+interpreter.register("diag", diagnostics_command)
+
+
+def serial_ready() -> bool:
+    for _ in poll_serial(0):
+        return True
+    return False
+
+
+def handle_serial():
+    # bounded, so a flood of input cannot starve the other tasks
+    for _ in range(64):
+        if not serial_ready():
+            return
+        try:
+            interpreter.feed(stdin.buffer.read(1))
+        except Exception as e:  # noqa: BLE001 - reported, the loop goes on
+            # a failing command must never stop the control loop
+            print(f"ERR {e}")
 
 
-try:
-    main()
-except KeyboardInterrupt:
-    scheduler.stop()
-    print("stopped timer")
-scheduler.stop()
+async def main():
+    sensor.start()
+    scheduler.start()
+    await asyncio.gather(
+        periodic(CONTROL_INTERVAL_MS, profiler.timed("control", control)),
+        periodic(FRAME_INTERVAL_MS, profiler.timed("render", render)),
+        periodic(SERIAL_INTERVAL_MS, profiler.timed("serial", handle_serial)),
+        periodic(CONFIG_POLL_MS, profiler.timed("config", config.poll)),
+        periodic(LOG_INTERVAL_MS, profiler.timed("log", log_record)),
+        periodic(TELEMETRY_POLL_MS, profiler.timed("telem", send_telemetry)),
+        periodic(GC_INTERVAL_MS, profiler.collect),
+    )
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("stopped")
+    finally:
+        scheduler.stop()
+        sensor.stop()
+        config.flush()
+        datalog.flush()
+        accounting.checkpoint()
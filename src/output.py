@@ -34,15 +34,27 @@ class Pager:
         spi = SPI(0, baudrate=40000000, sck=Pin(2), mosi=Pin(3))
         self._display = ILI9225(spi, 5, 8, 9, framebuffer, buffer)
         self._pages = pages
+        for page in pages:
+            page.attach(self._display)
+        pages[self._page].activate()
 
     def next_page(self):
+        """Show the next page in rotation, wrapping around to the first one."""
         self._clear = True
-        if self._page == 0:
-            self._page = 1
-        else:
-            self._page = 0
+        index = self._page
+        for _ in range(len(self._pages)):
+            index = (index + 1) % len(self._pages)
+            if self._pages[index].in_rotation:
+                break
+        if index == 0:
             self._edit_mode = False
             self._edit_value = 0
+        self._show(index)
+
+    def _show(self, index: int):
+        self._pages[self._page].deactivate()
+        self._page = index
+        self._pages[index].activate()
 
     def cursor_up(self):
         self._pages[self._page].handle_button_up()
@@ -50,10 +62,13 @@ class Pager:
     def cursor_down(self):
         self._pages[self._page].handle_button_down()
 
+    def page(self) -> int:
+        """Index of the page shown."""
+        return self._page
+
     def set_page(self, page: Page):
         try:
-            index = self._pages.index(page)
-            self._page = index
+            self._show(self._pages.index(page))
         except ValueError as e:
             print(e)
 
@@ -61,7 +76,15 @@ class Pager:
         self._pages[self._page].handle_button_enter()
 
     def display(self):
+        self.render_page()
+        self.update_display()
+
+    def render_page(self):
+        """Draw the current page into the framebuffer."""
         self._pages[self._page].render()
+
+    def update_display(self):
+        """Send what changed in the framebuffer to the display."""
         self._display.update()
 
     def toggle_power(self):
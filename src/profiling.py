@@ -0,0 +1,145 @@
+import gc
+from array import array
+from time import ticks_diff, ticks_us
+
+# False makes Profiler.timed() return the functions unchanged, so a firmware
+# built without profiling pays nothing per call
+ENABLED = True
+
+_BUCKETS = 24  # the last one collects everything from 2**22 us, about 4 s, on
+
+# MicroPython's heap counter, CPython has none and is profiled for time only
+_mem_alloc = getattr(gc, "mem_alloc", None)
+
+
+class Histogram:
+    """Durations of one stage in log2 buckets, without allocating per sample.
+
+    Bucket 0 counts durations of 0 us, bucket i those from 2**(i-1) up to
+    2**i us. Where the heap can be measured, it also keeps how many calls
+    allocated, the most bytes one call allocated and how many calls a
+    garbage collection ran in (the heap shrank).
+    """
+
+    count: int = 0
+    max_us: int = 0
+    last_us: int = 0
+    allocating: int = 0
+    max_alloc: int = 0
+    collections: int = 0
+
+    def __init__(self, name: str):
+        self.name = name
+        self._counts = array("L", [0]) * _BUCKETS
+
+    def add(self, us: int):
+        self.count += 1
+        self.last_us = us
+        self.max_us = max(self.max_us, us)
+        bucket = 0
+        while us > 0 and bucket < _BUCKETS - 1:
+            us >>= 1
+            bucket += 1
+        self._counts[bucket] += 1
+
+    def add_alloc(self, allocated: int):
+        """Take the change of the allocated heap over one call."""
+        if allocated < 0:
+            self.collections += 1
+        elif allocated > 0:
+            self.allocating += 1
+            self.max_alloc = max(self.max_alloc, allocated)
+
+    def percentile(self, percent: int) -> int:
+        """Upper bound in us of the bucket holding the given percentile."""
+        rank = (self.count * percent + 99) // 100
+        seen = 0
+        for bucket in range(_BUCKETS):
+            seen += self._counts[bucket]
+            if seen >= rank:
+                return min(1 << bucket, self.max_us)
+        return self.max_us
+
+    def reset(self):
+        for bucket in range(_BUCKETS):
+            self._counts[bucket] = 0
+        self.count = 0
+        self.max_us = 0
+        self.last_us = 0
+        self.allocating = 0
+        self.max_alloc = 0
+        self.collections = 0
+
+
+class Profiler:
+    """Histograms of how long the stages of the main loop take and what they
+    allocate. collect() runs the garbage collector at a time of the caller's
+    choosing and keeps its pauses in the "gc" histogram.
+    """
+
+    def __init__(self, enabled: bool = ENABLED):
+        self.enabled = enabled
+        self._histograms = []
+
+    def histograms(self) -> list:
+        return self._histograms
+
+    def histogram(self, name: str) -> Histogram:
+        for histogram in self._histograms:
+            if histogram.name == name:
+                return histogram
+        histogram = Histogram(name)
+        self._histograms.append(histogram)
+        return histogram
+
+    def timed(self, name: str, function):
+        """Return function, timed into the histogram name if profiling is enabled.
+
+        function takes no arguments, passing them on would allocate a tuple.
+        """
+        if not self.enabled:
+            return function
+        histogram = self.histogram(name)
+        mem_alloc = _mem_alloc
+
+        if mem_alloc is None:
+
+            def timed_function():
+                start = ticks_us()
+                result = function()
+                histogram.add(ticks_diff(ticks_us(), start))
+                return result
+
+            return timed_function
+
+        def measured_function():
+            allocated = mem_alloc()
+            start = ticks_us()
+            result = function()
+            histogram.add(ticks_diff(ticks_us(), start))
+            histogram.add_alloc(mem_alloc() - allocated)
+            return result
+
+        return measured_function
+
+    def collect(self):
+        """Run the garbage collector now, rather than in the middle of a stage."""
+        if not self.enabled:
+            gc.collect()
+            return
+        start = ticks_us()
+        gc.collect()
+        self.histogram("gc").add(ticks_diff(ticks_us(), start))
+
+    def reset(self):
+        for histogram in self._histograms:
+            histogram.reset()
+
+    def report(self) -> str:
+        """One name=count/p50/p99/max_us/allocating/max_alloc/collections entry
+        per stage."""
+        return " ".join(
+            f"{h.name}={h.count}/{h.percentile(50)}/{h.percentile(99)}/{h.max_us}"
+            f"/{h.allocating}/{h.max_alloc}/{h.collections}"
+            for h in self._histograms
+        )
@@ -0,0 +1,93 @@
+from time import ticks_diff, ticks_ms
+
+_HOUR_MS = 3600 * 1000
+
+
+class RelayGuard:
+    """Stands in for a relay pin and holds back switching that would short cycle it.
+
+    A requested change is refused until the relay has been on for min_on_ms or
+    off for min_off_ms, and switching on is refused while max_starts_per_hour
+    starts happened within the last hour (0 disables a limit). Times are taken
+    from ticks_ms, not from the number of calls. The caller keeps requesting
+    the state it wants on every control step, a refused change goes through
+    on the first step it is allowed.
+
+    denied counts the changes that were refused at first, delayed those of
+    them that went through later and delay_ms how long they were held back.
+    The rest were withdrawn before they were allowed: the short cycles saved.
+    """
+
+    denied: int = 0
+    delayed: int = 0
+    delay_ms: int = 0
+
+    def __init__(
+        self,
+        pin,
+        min_on_ms: int = 0,
+        min_off_ms: int = 0,
+        max_starts_per_hour: int = 0,
+        active_low: bool = False,
+    ):
+        self._pin = pin
+        self._on_level = 0 if active_low else 1
+        self._min_on_ms = min_on_ms
+        self._min_off_ms = min_off_ms
+        self._held = False  # changed less than min_on_ms or min_off_ms ago
+        self._changed_at = 0
+        self._starts = [0] * max_starts_per_hour
+        self._next_start = 0
+        self._start_count = 0
+        self._denied_at = 0
+        self._pending = False
+
+    def is_on(self) -> bool:
+        return self._pin.value() == self._on_level
+
+    def value(self, value: int | None = None):
+        if value is None:
+            return self._pin.value()
+        now = ticks_ms()
+        self._expire(now)
+        on = value == self._on_level
+        if on == self.is_on():
+            self._pending = False  # withdrawn, or never needed
+            self._pin.value(value)
+            return
+        if not self._allowed(on, now):
+            if not self._pending:
+                self._pending = True
+                self._denied_at = now
+                self.denied += 1
+            return
+        if self._pending:
+            self._pending = False
+            self.delayed += 1
+            self.delay_ms += ticks_diff(now, self._denied_at)
+        self._pin.value(value)
+        self._held = True
+        self._changed_at = now
+        if on and self._starts:
+            self._starts[self._next_start] = now
+            self._next_start = (self._next_start + 1) % len(self._starts)
+            self._start_count = min(self._start_count + 1, len(self._starts))
+
+    def _allowed(self, on: bool, now: int) -> bool:
+        if self._held:
+            minimum = self._min_off_ms if on else self._min_on_ms
+            if ticks_diff(now, self._changed_at) < minimum:
+                return False
+        return not (on and self._starts and self._start_count == len(self._starts))
+
+    def _expire(self, now: int):
+        # forget what can no longer matter, before ticks_diff() could overflow
+        if self._held and ticks_diff(now, self._changed_at) >= max(
+            self._min_on_ms, self._min_off_ms
+        ):
+            self._held = False
+        while self._start_count:
+            oldest = (self._next_start - self._start_count) % len(self._starts)
+            if ticks_diff(now, self._starts[oldest]) < _HOUR_MS:
+                break
+            self._start_count -= 1
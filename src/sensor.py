@@ -0,0 +1,113 @@
+from _thread import allocate_lock, start_new_thread
+from time import sleep_ms, ticks_ms, time
+from dht import DHT22
+from machine import Pin
+from history import to_tenths
+
+
+class Reading:
+    """One published sample of the DHT22.
+
+    timestamp is the ticks_ms of the last successful measurement and seconds
+    its time(), error the errno of the last failed one (0 once a measurement
+    succeeds again). The tenths fields hold the values as ints, converted once
+    by the worker so the main loop does no float arithmetic on them; seconds
+    is taken there too, being past the small int range of MicroPython.
+    """
+
+    temperature: float = 0.0
+    humidity: float = 0.0
+    temperature_tenths: int = 0
+    humidity_tenths: int = 0
+    timestamp: int = 0
+    seconds: int = 0
+    error: int = 0
+    valid: bool = False
+
+    def copy_from(self, other: "Reading"):
+        self.temperature = other.temperature
+        self.humidity = other.humidity
+        self.temperature_tenths = other.temperature_tenths
+        self.humidity_tenths = other.humidity_tenths
+        self.timestamp = other.timestamp
+        self.seconds = other.seconds
+        self.error = other.error
+        self.valid = other.valid
+
+
+class SensorWorker:
+    """Measures the DHT22 from one long-lived thread on the second core.
+
+    Readings are double buffered: the worker fills the back slot and swaps it
+    to the front under a lock, readers copy the front slot under the same lock.
+    """
+
+    _err_cnt = 0
+    _running = False
+    _stopped = True
+
+    def __init__(self, dht: DHT22, dht_enable: Pin, interval_ms: int):
+        self._dht = dht
+        self._dht_enable = dht_enable
+        self._interval_ms = interval_ms
+        self._lock = allocate_lock()
+        self._slots = (Reading(), Reading())
+        self._front = 0
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._stopped = False
+        start_new_thread(self._run, ())
+
+    def stop(self):
+        self._running = False
+        while not self._stopped:
+            sleep_ms(10)
+
+    def read_into(self, reading: Reading):
+        """Copy the latest reading into reading without allocating."""
+        with self._lock:
+            reading.copy_from(self._slots[self._front])
+
+    def snapshot(self) -> Reading:
+        reading = Reading()
+        self.read_into(reading)
+        return reading
+
+    def error_count(self) -> int:
+        return self._err_cnt
+
+    def _run(self):
+        try:
+            while self._running:
+                self.measure()
+                sleep_ms(self._interval_ms)
+        finally:
+            self._stopped = True
+
+    def measure(self):
+        """Take one measurement and publish it."""
+        back = self._slots[1 - self._front]
+        back.copy_from(self._slots[self._front])
+        try:
+            if self._dht_enable.value() == 1:
+                self._dht.measure()
+                back.temperature = self._dht.temperature()
+                back.humidity = self._dht.humidity()
+                back.temperature_tenths = to_tenths(back.temperature)
+                back.humidity_tenths = to_tenths(back.humidity)
+                back.timestamp = ticks_ms()
+                back.seconds = int(time())
+                back.error = 0
+                back.valid = True
+            else:
+                self._dht_enable.value(1)
+        except OSError as e:
+            self._err_cnt = self._err_cnt + 1
+            print(f"{e} {self._err_cnt}")
+            back.error = e.errno if isinstance(e.errno, int) else -1
+            self._dht_enable.value(0)
+        with self._lock:
+            self._front = 1 - self._front
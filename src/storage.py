@@ -0,0 +1,14 @@
+import os
+from binascii import crc32
+
+
+def checksum(text: str) -> int:
+    return crc32(text.encode()) & 0xFFFFFFFF
+
+
+def write_atomic(path: str, text: str):
+    """Replace path with text so a power loss leaves either the old or the new file."""
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as file:
+        file.write(text)
+    os.rename(temp_path, path)
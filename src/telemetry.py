@@ -0,0 +1,105 @@
+import struct
+from binascii import crc32
+from time import ticks_add, ticks_diff, ticks_ms, ticks_us
+
+SYNC = b"\xa5\x5a"
+FRAME_STATUS = 1
+# type, sequence, ticks_ms, temperature and humidity in tenths, actuator mask,
+# error flags, fan counter, control and render duration in us, loop lag in ms
+STATUS = "<BHIhhBBHIIH"
+STATUS_SIZE = struct.calcsize(STATUS)
+# sync, payload length, payload, crc32 of length and payload
+FRAME_SIZE = len(SYNC) + 1 + STATUS_SIZE + 4
+
+
+def _u16(value: int) -> int:
+    return min(max(value, 0), 0xFFFF)
+
+
+class Telemetry:
+    """Status frames written to a binary stream, usually the USB serial port.
+
+    A frame is SYNC, a length byte, the STATUS payload and a little endian
+    crc32 over length and payload, so a reader can find frame boundaries in a
+    stream mixed with text. Frames go out every interval_ms at most. When
+    writing a frame takes longer than budget_us, e.g. because nobody reads
+    the port, or the main loop reports lag, the interval doubles up to
+    max_interval_ms, and shrinks back while both stay calm.
+    """
+
+    enabled: bool = False
+
+    def __init__(
+        self,
+        stream,
+        interval_ms: int = 1000,
+        max_interval_ms: int = 30000,
+        budget_us: int = 2000,
+    ):
+        self._stream = stream
+        self._frame = bytearray(FRAME_SIZE)
+        self._frame[0:2] = SYNC
+        self._frame[2] = STATUS_SIZE
+        self._view = memoryview(self._frame)
+        self._max_interval_ms = max_interval_ms
+        self._budget_us = budget_us
+        self._sequence = 0
+        self.set_interval(interval_ms)
+
+    def set_interval(self, interval_ms: int):
+        if interval_ms <= 0:
+            raise ValueError("interval must be positive")
+        self._interval_ms = interval_ms
+        self._current_ms = interval_ms
+        self._deadline = ticks_ms()
+
+    def interval(self) -> int:
+        """The interval currently used, after adapting to the load."""
+        return self._current_ms
+
+    def due(self) -> bool:
+        return self.enabled and ticks_diff(ticks_ms(), self._deadline) >= 0
+
+    def send(
+        self,
+        temperature: int,
+        humidity: int,
+        actuators: int,
+        errors: int,
+        counter: int,
+        control_us: int,
+        render_us: int,
+        lag_ms: int,
+    ):
+        """Write a status frame, temperature and humidity in tenths."""
+        start = ticks_us()
+        self._sequence = (self._sequence + 1) & 0xFFFF
+        struct.pack_into(
+            STATUS,
+            self._frame,
+            3,
+            FRAME_STATUS,
+            self._sequence,
+            ticks_ms(),
+            temperature,
+            humidity,
+            actuators,
+            errors,
+            _u16(counter),
+            control_us,
+            render_us,
+            _u16(lag_ms),
+        )
+        crc = crc32(self._view[2 : 3 + STATUS_SIZE]) & 0xFFFFFFFF
+        struct.pack_into("<I", self._frame, 3 + STATUS_SIZE, crc)
+        self._stream.write(self._frame)
+        self._adapt(ticks_diff(ticks_us(), start), lag_ms)
+        self._deadline = ticks_add(ticks_ms(), self._current_ms)
+
+    def _adapt(self, cost_us: int, lag_ms: int):
+        if cost_us > self._budget_us or lag_ms > 0:
+            self._current_ms = min(self._current_ms * 2, self._max_interval_ms)
+        elif self._current_ms > self._interval_ms:
+            self._current_ms = max(
+                self._current_ms - self._current_ms // 4, self._interval_ms
+            )
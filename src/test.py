@@ -2,12 +2,10 @@ from display.fonts.font16x16 import font
 
 
 def print_character(char):
-    for column in range(16):
-        ascii_no = ord(char)
-        character_index = (ascii_no - 32) * 16
-        char_data = font[character_index + column]
+    for column in range(font.width):
+        char_data = font.column(char, column)
         row_chars = ""
-        for row in range(16):
+        for row in range(font.height):
             pixel = char_data >> row
             if pixel & 1:
                 row_chars = row_chars + "X"
@@ -0,0 +1,64 @@
+from clock import clock
+
+from accounting import Accounting
+from config import Config
+from datalog import ATOMIZER, FAN, FRIDGE
+
+FRIDGE_INDEX = 0
+ATOMIZER_INDEX = 1
+FAN_INDEX = 3
+
+
+def run(accounting, mask, seconds):
+    """Switch to mask now and keep it for seconds, one control step per second."""
+    accounting.update(mask)
+    for _ in range(seconds):
+        clock.advance(1000)
+        accounting.update(mask)
+
+
+def test_on_time_switches_and_duty():
+    accounting = Accounting("", Config(""))
+    run(accounting, FRIDGE, 15 * 60)
+    run(accounting, 0, 45 * 60)
+
+    assert accounting.on_seconds(FRIDGE_INDEX) == 15 * 60
+    assert accounting.switches(FRIDGE_INDEX) == 2
+    assert accounting.on_seconds(ATOMIZER_INDEX) == 0
+    assert accounting.hour_duty(FRIDGE_INDEX) == 0.25
+    assert accounting.day_duty(FRIDGE_INDEX) == 0.25
+
+    # the fridge stays off, the last hour forgets it, the day does not
+    run(accounting, 0, 60 * 60)
+    assert accounting.hour_duty(FRIDGE_INDEX) == 0.0
+    assert accounting.day_duty(FRIDGE_INDEX) == 0.125
+
+
+def test_energy_uses_the_configured_wattage():
+    config = Config("")
+    accounting = Accounting("", config)
+    run(accounting, ATOMIZER | FAN, 30 * 60)
+
+    assert accounting.energy_wh(ATOMIZER_INDEX) == config.get_atomizer_watts() / 2
+    config.set_fan_watts(10)
+    assert accounting.energy_wh(FAN_INDEX) == 5.0
+    assert accounting.energy_wh() == config.get_atomizer_watts() / 2 + 5.0
+
+
+def test_totals_survive_a_restart(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config("")
+    accounting = Accounting("stats.json", config, checkpoint_minutes=10)
+    run(accounting, FRIDGE, 9 * 60)
+    assert accounting.checkpoint_count() == 0
+    run(accounting, 0, 60)
+    assert accounting.checkpoint_count() == 1
+    run(accounting, 0, 5 * 60)
+
+    restarted = Accounting("stats.json", config)
+    assert restarted.on_seconds(FRIDGE_INDEX) == 9 * 60
+    assert restarted.switches(FRIDGE_INDEX) == 2
+    assert restarted.hour_duty(FRIDGE_INDEX) == 0.0
+
+    (tmp_path / "stats.json").write_text('{"totals": [[1], [1]], "checksum": 1}')
+    assert Accounting("stats.json", config).on_seconds(FRIDGE_INDEX) == 0
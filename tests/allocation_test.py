@@ -0,0 +1,145 @@
+"""The main loop allocates nothing once it runs steadily.
+
+CPython cannot count MicroPython's heap, so the loop runs under tracemalloc
+with opcode tracing instead. Heap growth between two opcodes of the firmware
+is blamed on the first one, leaving out what CPython allocates where
+MicroPython does not: the frame objects of traced calls, code of the host
+stand-ins, ints up to 2**30, for loop iterators, with statements and
+super() objects. What is left are lists, tuples of more than one item,
+bytearrays, strings and memoryview slices created on the way.
+"""
+
+import dis
+import itertools
+import os
+import sys
+import tracemalloc
+from contextlib import contextmanager
+
+from clock import clock
+from hostenv import SRC_DIR
+from simulation import load_firmware
+
+_INT_SIZE = 32  # bytes of a boxed int up to 2**60
+_INT_RESULTS = ("BINARY_OP", "BINARY_SUBSCR", "UNARY_NEGATIVE", "UNARY_INVERT")
+_FREE_ON_MICROPYTHON = ("GET_ITER", "FOR_ITER", "BEFORE_WITH")
+
+
+class Audit:
+    """Heap growth per opcode of the code in directory."""
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self.found = {}
+        self._instructions = {}
+        # traced memory after the last event, file, line and opcode of the
+        # instruction running since then, file and line calling super() last
+        self._state = [0, None, None]
+
+    def __enter__(self):
+        tracemalloc.start()
+        sys.settrace(self._call)
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.settrace(None)
+        tracemalloc.stop()
+
+    @contextmanager
+    def paused(self):
+        """Leave out code that does not run in the main loop."""
+        sys.settrace(None)
+        try:
+            yield
+        finally:
+            self._state[1] = None
+            sys.settrace(self._call)
+
+    def _call(self, frame, event, arg):
+        # the call allocates the frame object tracing needs, and code
+        # outside the firmware is not its to blame
+        self._state[1] = None
+        if not frame.f_code.co_filename.startswith(self._directory):
+            return None
+        frame.f_trace_opcodes = True
+        self._state[0] = tracemalloc.get_traced_memory()[0]
+        return self._event
+
+    def _event(self, frame, event, arg):
+        # nothing of this function may be alive at the two measurements
+        state = self._state
+        delta = tracemalloc.get_traced_memory()[0] - state[0]
+        where = state[1]
+        instruction = self._instruction(frame) if event == "opcode" else None
+        if (
+            where is not None
+            and delta > 0
+            and not (instruction and instruction.opname in _FREE_ON_MICROPYTHON)
+            and not (where[2] in _INT_RESULTS and delta <= _INT_SIZE)
+            and where[:2] != state[2]
+        ):
+            self.found[where] = self.found.get(where, 0) + delta
+        state[1] = None
+        if instruction is not None:
+            location = (frame.f_code.co_filename, frame.f_lineno)
+            if instruction.opname == "LOAD_GLOBAL" and instruction.argval == "super":
+                state[2] = location
+            elif instruction.opname not in _FREE_ON_MICROPYTHON:
+                state[1] = location + (instruction.opname,)
+            del location
+        del delta, where, instruction
+        state[0] = tracemalloc.get_traced_memory()[0]
+        return self._event
+
+    def _instruction(self, frame):
+        code = frame.f_code
+        instructions = self._instructions.get(code)
+        if instructions is None:
+            instructions = {i.offset: i for i in dis.get_instructions(code)}
+            self._instructions[code] = instructions
+        return instructions[frame.f_lasti]
+
+    def report(self) -> str:
+        return "\n".join(
+            f"{os.path.relpath(path, self._directory)}:{line} {opname} {size} bytes"
+            for (path, line, opname), size in self.found.items()
+        )
+
+
+def test_steady_main_loop_does_not_allocate(firmware_directory, monkeypatch):
+    monkeypatch.chdir(firmware_directory)
+    main = load_firmware(firmware_directory)
+    main.dht.source = itertools.cycle(
+        [(12.0, 70.0), (12.3, 70.4), (-0.5, 100.0), (11.9, 71.0)]
+    )
+    main.sensor.measure()
+    main.pager.set_page(main.overview_page)
+    audit = Audit(SRC_DIR)
+
+    def run(frames, traced=True):
+        # the overview blinks every frame and counts the fan down every second,
+        # the readings change every 8 frames
+        for frame in range(frames):
+            if frame % 8 == 0:
+                # the sensor worker runs on the other core, outside the loop
+                if traced:
+                    with audit.paused():
+                        main.sensor.measure()
+                else:
+                    main.sensor.measure()
+            clock.advance(main.FRAME_INTERVAL_MS)
+            main.render()
+            main.handle_serial()
+            main.config.poll()
+            main.send_telemetry()
+            if frame % 4 == 0:
+                main.control()
+                main.scheduler.tick()
+
+    run(40, traced=False)  # fill the caches
+    with audit:
+        run(8)
+        audit.found.clear()  # what tracing itself set up
+        run(40)
+
+    assert not audit.found, audit.report()
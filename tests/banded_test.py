@@ -0,0 +1,94 @@
+from framebuf import RGB565
+from machine import SPI
+
+from config import Config
+from display.banded import BandedFrameBuffer
+from display.dirty import TrackedFrameBuffer
+from display.ili9225 import ILI9225
+from display.pages import ConfigPage, OverviewPage, TrendPage
+from history import History
+
+WIDTH = 176
+HEIGHT = 220
+
+
+class Panel(ILI9225):
+    """Keeps what the driver sends in a copy of the display's RAM."""
+
+    def __init__(self, framebuffer, buffer):
+        self.ram = bytearray(WIDTH * HEIGHT * 2)
+        self.flushed = []
+        super().__init__(SPI(0), 5, 8, 9, framebuffer, buffer)
+
+    def _flush(self, x0, y0, x1, y1, top=0):
+        self.flushed.append((x0, y0, x1, y1))
+        row_bytes = (x1 - x0 + 1) * 2
+        for y in range(y0, y1 + 1):
+            source = ((y - top) * WIDTH + x0) * 2
+            target = (y * WIDTH + x0) * 2
+            self.ram[target : target + row_bytes] = self._buffer[
+                source : source + row_bytes
+            ]
+
+
+def make_panels():
+    buffer = bytearray(WIDTH * HEIGHT * 2)
+    full = Panel(TrackedFrameBuffer(buffer, WIDTH, HEIGHT, RGB565), buffer)
+    framebuffer = BandedFrameBuffer(WIDTH, HEIGHT)
+    return full, Panel(framebuffer, framebuffer.buffer)
+
+
+def test_overview_looks_the_same_in_bands():
+    panels = make_panels()
+    pages = [OverviewPage(panel.framebuffer(), WIDTH, HEIGHT) for panel in panels]
+    for page in pages:
+        page.activate()
+    for second in range(20):
+        for page, panel in zip(pages, panels):
+            page.set_data(
+                120 + min(second, 9), 700, 12.0, 75.0, second > 9, 2, 3, second
+            )
+            page.render()
+            panel.flushed.clear()
+            panel.update()
+        full, banded = panels
+        assert banded.ram == full.ram, second
+    # then only the blink indicator and the countdown change
+    assert banded.flushed == [
+        (161, 5, 170, 14),
+        (61, 162, 92, 169),
+    ]
+
+
+def test_config_page_looks_the_same_in_bands():
+    panels = make_panels()
+    config = Config("")
+    pages = [ConfigPage(panel.framebuffer(), WIDTH, HEIGHT, config) for panel in panels]
+    for page in pages:
+        page.activate()
+    for step in range(8):
+        for page, panel in zip(pages, panels):
+            page.handle_button_down()
+            page.render()
+            panel.update()
+        full, banded = panels
+        assert banded.ram == full.ram, step
+
+
+def test_more_drawing_than_recorded_operations_updates_early():
+    panels = make_panels()
+    history = History()
+    for minute in range(HEIGHT):
+        history.add(minute * 60, 6.0 + minute % 7 / 10, 70.0 + minute % 5)
+    pages = [
+        TrendPage(panel.framebuffer(), WIDTH, HEIGHT, history, Config(""))
+        for panel in panels
+    ]
+    for page, panel in zip(pages, panels):
+        page.attach(panel)
+        page.activate()
+        page.render()
+        panel.update()
+    full, banded = panels
+    assert banded.ram == full.ram
+    assert banded.framebuffer().operations() == 0
@@ -0,0 +1,34 @@
+from codec import MAX_RECORD_SIZE, BlockEncoder, decode_block, unzigzag, zigzag
+
+
+def test_zigzag_round_trip():
+    for value in (0, 1, -1, 63, -64, 300, -300, 2**31 - 1, -(2**31)):
+        assert unzigzag(zigzag(value)) == value
+    assert [zigzag(v) for v in (0, -1, 1, -2)] == [0, 1, 2, 3]
+
+
+def test_block_round_trip_with_negative_deltas():
+    records = [
+        (1700000000, 62, 751, 1, 0),
+        (1700000060, 58, 760, 9, 0),
+        (1700000120, -35, 0, 0, 7),
+        (1700000119, 32767, -32768, 15, 1),
+    ]
+    encoder = BlockEncoder(128)
+    for record in records:
+        assert encoder.add(*record)
+    assert list(decode_block(encoder.block())) == records
+
+
+def test_full_block_refuses_records_and_starts_with_keyframe_after_reset():
+    encoder = BlockEncoder(64)
+    count = 0
+    while encoder.add(count * 60, 60, 750, 0, 0):
+        count += 1
+    assert encoder.used() <= 64
+    # slow data takes four bytes per delta record, up to the space kept free
+    # for a worst case record
+    assert count == 1 + (64 - MAX_RECORD_SIZE - 2 - 6) // 4 + 1
+    encoder.reset()
+    encoder.add(123456, 61, 749, 2, 0)
+    assert list(decode_block(encoder.block())) == [(123456, 61, 749, 2, 0)]
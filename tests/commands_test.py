@@ -0,0 +1,95 @@
+import pytest
+
+from commands import CommandInterpreter, register_config
+from config import Config
+
+
+def make_interpreter(config, size=128):
+    replies = []
+    interpreter = CommandInterpreter(replies.append, size)
+    register_config(interpreter, config)
+    return interpreter, replies
+
+
+def test_lines_are_assembled_from_partial_reads():
+    interpreter, replies = make_interpreter(Config(""))
+    interpreter.feed(b"get target_tem")
+    assert replies == []
+    interpreter.feed(b"perature\r\n\nset fan_on_interval 5\n")
+    assert replies == ["OK target_temperature=6.0", "OK fan_on_interval=5"]
+
+
+def test_errors_are_reported_and_the_parser_recovers():
+    interpreter, replies = make_interpreter(Config(""), size=24)
+    interpreter.feed(b"get nothing\nfoo\nset target_humidity wet\n")
+    interpreter.feed(b"get " + b"x" * 40 + b"\nget fan_on_interval\n")
+    assert replies == [
+        "ERR unknown field nothing",
+        "ERR unknown command foo",
+        "ERR set: could not convert string to float: 'wet'",
+        "ERR line too long",
+        "OK fan_on_interval=2",
+    ]
+
+
+def test_mset_writes_once_and_is_all_or_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config("config.json", write_delay_ms=0)
+    changes = []
+    config.add_listener(changes.append)
+    interpreter, replies = make_interpreter(config)
+    writes = config.write_count()
+
+    interpreter.feed(b"mset target_temperature=12 target_humidity=80.5\n")
+    assert replies[-1] == "OK target_temperature=12.0 target_humidity=80.5"
+    assert config.write_count() == writes + 1
+    assert len(changes) == 1
+
+    interpreter.feed(b"mset target_temperature=3 fan_on_interval=x\n")
+    assert replies[-1].startswith("ERR mset")
+    assert config.get("target_temperature") == 12.0
+
+
+def test_rejected_mset_neither_writes_nor_notifies(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config("config.json", write_delay_ms=0)
+    changes = []
+    config.add_listener(changes.append)
+    interpreter, replies = make_interpreter(config)
+    writes = config.write_count()
+
+    interpreter.feed(
+        b"mset target_temperature=3 target_humidity=85 fan_on_interval=x\n"
+    )
+    assert replies[-1].startswith("ERR mset")
+    assert config.write_count() == writes
+    assert changes == []
+    assert config.get("target_humidity") == 70.0
+
+    # the next change is saved as usual
+    interpreter.feed(b"set target_temperature 8\n")
+    assert config.write_count() == writes + 1
+    assert len(changes) == 1
+
+
+def test_undecodable_lines_and_empty_mset_are_errors():
+    interpreter, replies = make_interpreter(Config(""))
+    interpreter.feed(b"get \xff\nget fan_on_interval\nmset\n")
+    assert replies == [
+        "ERR line is not UTF-8",
+        "OK fan_on_interval=2",
+        "ERR mset: expected: mset field=value ...",
+    ]
+
+
+def test_failing_handler_does_not_break_the_next_line():
+    interpreter, replies = make_interpreter(Config(""))
+
+    def broken(args):
+        raise RuntimeError("broken")
+
+    interpreter.register("broken", broken)
+    with pytest.raises(RuntimeError):
+        interpreter.feed(b"broken\n")
+    interpreter.feed(b"get fan_on_interval\n")
+    assert replies == ["OK fan_on_interval=2"]
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from clock import clock
+
+from config import Config
+from storage import checksum
+
+
+def test_setters_coalesce_into_one_write(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config("config.json", write_delay_ms=2000)
+    assert config.write_count() == 1  # created with the defaults
+
+    config.set_target_temperature(8.0)
+    clock.advance(1000)
+    config.poll()
+    config.set_target_humidity(80.0)
+    config.set_fan_on_interval(5)
+    clock.advance(1999)
+    config.poll()
+    assert config.write_count() == 1
+
+    clock.advance(1)
+    config.poll()
+    assert config.write_count() == 2
+    assert not (tmp_path / "config.json.tmp").exists()
+
+    stored = Config("config.json")
+    assert stored.get_target_temperature() == 8.0
+    assert stored.get_target_humidity() == 80.0
+    assert stored.get_fan_on_interval() == 5
+
+
+def test_file_with_wrong_checksum_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config("config.json", write_delay_ms=0)
+    config.set_target_temperature(8.0)
+    data = json.loads((tmp_path / "config.json").read_text())
+    data["target_temperature"] = 30.0
+    (tmp_path / "config.json").write_text(json.dumps(data))
+
+    assert Config("config.json").get_target_temperature() == 6.0
+
+
+def test_file_without_checksum_is_read(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.json").write_text(json.dumps({"target_temperature": 4}))
+
+    config = Config("config.json")
+    assert config.get_target_temperature() == 4
+    assert config.get_target_humidity() == 70.0
+
+
+def test_file_from_before_a_field_was_added_is_read(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config("config.json", write_delay_ms=0)
+    config.set_target_temperature(8.0)
+    data = json.loads((tmp_path / "config.json").read_text())
+    del data["fan_watts"]
+    values = [data[name] for name in Config._FIELDS if name in data]
+    data["checksum"] = checksum(json.dumps(values))
+    (tmp_path / "config.json").write_text(json.dumps(data))
+
+    config = Config("config.json")
+    assert config.get_target_temperature() == 8.0
+    assert config.get_fan_watts() == 5
+
+
+def test_values_outside_their_range_are_rejected(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Config("config.json", write_delay_ms=0)
+    writes = config.write_count()
+    for name, value in (
+        ("target_temperature", "nan"),
+        ("target_temperature", "inf"),
+        ("target_humidity", "120"),
+        ("temperature_tolerance", "0"),
+        ("fan_on_interval", "0"),
+        ("fan_off_interval", "-5"),
+        ("fridge_watts", "-1"),
+    ):
+        with pytest.raises(ValueError):
+            config.set(name, value)
+    assert config.write_count() == writes
+    assert config.get_target_temperature() == 6.0
+
+    config.set("target_temperature", "-2.5")
+    assert config.get_target_temperature() == -2.5
+
+
+def test_out_of_range_values_in_the_file_are_ignored(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.json").write_text(
+        '{"target_temperature": NaN, "fan_on_interval": 0, "target_humidity": 80}'
+    )
+
+    config = Config("config.json")
+    assert config.get_target_temperature() == 6.0
+    assert config.get_fan_on_interval() == 2
+    assert config.get_target_humidity() == 80
@@ -0,0 +1,26 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "host")
+)
+
+import hostenv
+
+hostenv.install()
+
+
+@pytest.fixture(scope="session")
+def firmware_directory(tmp_path_factory):
+    """Working directory of the firmware, imported once per session."""
+    return str(tmp_path_factory.mktemp("firmware"))
+
+
+@pytest.fixture(autouse=True)
+def fresh_pins():
+    """Forget the pins earlier tests created."""
+    from machine import Pin
+
+    Pin.pins.clear()
@@ -0,0 +1,80 @@
+from datalog import FAN, FRIDGE, RecordLog, actuator_mask
+
+
+def test_records_are_written_in_whole_blocks(tmp_path):
+    log = RecordLog(str(tmp_path / "log"), block_size=64)
+    for i in range(40):
+        log.append(
+            i * 60, 60 + i % 3, 700 - i, actuator_mask(True, False, False, True), 0
+        )
+    assert log.flush_count() > 0
+    size = (tmp_path / "log" / "00000001.log").stat().st_size
+    assert size == 64 * log.flush_count()
+
+    records = list(log.records())
+    assert len(records) == 40
+    assert records[39] == (39 * 60, 60, 661, FRIDGE | FAN, 0)
+
+    log.flush()
+    reopened = RecordLog(str(tmp_path / "log"), block_size=64)
+    assert [r[0] for r in reopened.records()] == [i * 60 for i in range(40)]
+
+
+def test_segments_rotate_and_oldest_are_dropped(tmp_path):
+    log = RecordLog(
+        str(tmp_path / "log"), block_size=32, segment_size=64, max_segments=2
+    )
+    for i in range(100):
+        log.append(i, 0, 0, 0, 0)
+    assert len(log.segments()) == 2
+    timestamps = [r[0] for r in log.records()]
+    assert timestamps == list(range(timestamps[0], 100))
+    assert timestamps[0] > 0
+
+
+def test_query_returns_the_range_across_segments(tmp_path):
+    log = RecordLog(
+        str(tmp_path / "log"), block_size=64, segment_size=256, max_segments=50
+    )
+    for i in range(500):
+        log.append(i * 60, 60, 750, 0, 0)
+    assert len(log.segments()) > 3
+
+    timestamps = [r[0] for r in log.query(100 * 60, 130 * 60 + 59)]
+    assert timestamps == [i * 60 for i in range(100, 131)]
+    assert [r[0] for r in log.query(495 * 60, 10**9)] == [
+        i * 60 for i in range(495, 500)
+    ]
+    assert list(log.query(-100, -1)) == []
+
+
+def test_missing_index_is_rebuilt(tmp_path):
+    log = RecordLog(str(tmp_path / "log"), block_size=64)
+    for i in range(100):
+        log.append(i, 0, 0, 0, 0)
+    log.flush()
+    index = tmp_path / "log" / "00000001.idx"
+    size = index.stat().st_size
+    index.unlink()
+
+    reopened = RecordLog(str(tmp_path / "log"), block_size=64)
+    assert index.stat().st_size == size
+    assert [r[0] for r in reopened.query(40, 44)] == [40, 41, 42, 43, 44]
+
+
+def test_log_command_pages_through_a_range(tmp_path):
+    from commands import CommandInterpreter, register_log
+
+    log = RecordLog(str(tmp_path / "log"), block_size=64)
+    for i in range(40):
+        log.append(i * 60, 60, 700 + i, FRIDGE, 0)
+    replies = []
+    interpreter = CommandInterpreter(replies.append)
+    register_log(interpreter, log, limit=2)
+    interpreter.feed(b"log 600 720\nlog 600 1200 1\nlog 5000 6000\nlog 1\n")
+    assert replies == [
+        "OK 600,60,710,1,0 660,60,711,1,0 next=720",
+        "OK 600,60,710,1,0 next=660",
+        "OK",
+        "ERR log: expected: log from to [count]",
+    ]
@@ -0,0 +1,69 @@
+from machine import SPI
+
+from display.dirty import DirtyRegion
+from display.ili9225 import ILI9225
+
+
+def test_overlapping_and_adjacent_areas_merge():
+    dirty = DirtyRegion(176, 220)
+    dirty.add(10, 10, 10, 10)
+    dirty.add(15, 15, 10, 10)
+    assert dirty.take() == [[10, 10, 24, 24]]
+    dirty.add(0, 0, 5, 5)
+    dirty.add(5, 0, 5, 5)
+    assert dirty.take() == [[0, 0, 9, 4]]
+    # a gap of one pixel keeps them apart
+    dirty.add(0, 0, 5, 5)
+    dirty.add(6, 0, 5, 5)
+    assert dirty.count() == 2
+
+
+def test_growing_area_picks_up_earlier_ones():
+    dirty = DirtyRegion(176, 220)
+    dirty.add(0, 0, 4, 4)
+    dirty.add(20, 0, 4, 4)
+    assert dirty.count() == 2
+    dirty.add(4, 0, 16, 4)
+    assert dirty.take() == [[0, 0, 23, 3]]
+
+
+def test_areas_are_clipped_to_the_screen():
+    dirty = DirtyRegion(176, 220)
+    dirty.add(-5, -5, 10, 10)
+    dirty.add(170, 215, 20, 20)
+    dirty.add(200, 0, 5, 5)
+    assert dirty.take() == [[0, 0, 4, 4], [170, 215, 175, 219]]
+
+
+def test_cap_merges_the_pair_wasting_fewest_pixels():
+    dirty = DirtyRegion(176, 220, max_rects=2)
+    dirty.add(0, 0, 2, 2)
+    dirty.add(100, 100, 2, 2)
+    assert not dirty.is_empty()
+    assert dirty.full()
+    dirty.add(0, 10, 2, 2)
+    assert dirty.count() == 2
+    assert sorted(dirty.take()) == [[0, 0, 1, 11], [100, 100, 101, 101]]
+
+
+def test_add_all_replaces_every_area():
+    dirty = DirtyRegion(176, 220)
+    dirty.add(0, 0, 2, 2)
+    dirty.add(100, 100, 2, 2)
+    dirty.add_all()
+    assert dirty.take() == [[0, 0, 175, 219]]
+    assert dirty.is_empty()
+
+
+def test_partial_update_sends_only_the_changed_area():
+    display = ILI9225(SPI(0), 5, 8, 9)
+    framebuffer = display.framebuffer()
+    display.update()
+    assert display.bytes_sent() == 24 + 1 + 176 * 220 * 2
+    framebuffer.fill_rect(10, 20, 8, 4, 0xFFFF)
+    framebuffer.pixel(100, 100, 0xFFFF)
+    display.update()
+    # window and RAM write command, then the pixels of both areas
+    assert display.bytes_sent() == 2 * (24 + 1) + (8 * 4 + 1) * 2
+    display.update()
+    assert display.bytes_sent() == 0
@@ -1,15 +1,12 @@
-from unittest.mock import Mock, MagicMock
-
 import pytest
+from machine import Pin
 
 from config import Config
 from environment_control import EnvironmentControl
 
 
-def get_control_mock() -> Mock:
-    mock = Mock()
-    mock.value = Mock()
-    return mock
+def get_control_pin(id: int) -> Pin:
+    return Pin(id, Pin.OUT)
 
 
 @pytest.mark.parametrize(
@@ -26,9 +23,9 @@ def get_control_mock() -> Mock:
             },
             {
                 "fan": None,
-                "atomizer": None,
-                "fridge": 1,
-                "heater": 0
+                "atomizer": 0,
+                "fridge": 0,
+                "heater": None
             }
         ),        (
             24,
@@ -40,54 +37,62 @@ def get_control_mock() -> Mock:
                 "humidity_tolerance": 5
             },
             {
-                "fan": 1,
+                "fan": None,
                 "atomizer": 0,
-                "fridge": 1,
-                "heater": 0
+                "fridge": 0,
+                "heater": None
             }
         ),
     ]
 )
 def test_control(temperature, humidity, config_values, expected):
-    fan_mock = get_control_mock()
-    atomizer_mock = get_control_mock()
-    fridge_mock = get_control_mock()
-    heater_mock = get_control_mock()
-    config = Config()
+    fan_pin = get_control_pin(12)
+    atomizer_pin = get_control_pin(15)
+    fridge_pin = get_control_pin(14)
+    heater_pin = get_control_pin(28)
+    config = Config("")
     config.set_target_temperature(config_values["target_temperature"])
     config.set_temperature_tolerance(config_values["temperature_tolerance"])
     config.set_target_humidity(config_values["target_humidity"])
     config.set_humidity_tolerance(config_values["humidity_tolerance"])
 
     subject = EnvironmentControl(
-        fan_mock,
-        atomizer_mock,
-        fridge_mock,
-        heater_mock,
-        get_control_mock(),
-        get_control_mock(),
-        get_control_mock(),
-        get_control_mock(),
+        fan_pin,
+        atomizer_pin,
+        fridge_pin,
+        heater_pin,
         config
     )
     subject.control(temperature, humidity)
 
-    if expected["fan"] is None:
-        fan_mock.value.assert_not_called()
-    else:
-        fan_mock.value.assert_called_with(expected["fan"])
+    for name, pin in (
+        ("fan", fan_pin),
+        ("atomizer", atomizer_pin),
+        ("fridge", fridge_pin),
+        ("heater", heater_pin),
+    ):
+        if expected[name] is None:
+            assert pin.history == []
+        else:
+            assert pin.history[-1] == expected[name]
+
 
-    if expected["atomizer"] is None:
-        atomizer_mock.value.assert_not_called()
-    else:
-        atomizer_mock.value.assert_called_with(expected["atomizer"])
+def test_control_follows_config_changes():
+    fridge_pin = get_control_pin(14)
+    config = Config("")
+    config.set_target_temperature(6.0)
+    config.set_temperature_tolerance(1.0)
+    subject = EnvironmentControl(
+        get_control_pin(12),
+        get_control_pin(15),
+        fridge_pin,
+        get_control_pin(28),
+        config
+    )
 
-    if expected["fridge"] is None:
-        fridge_mock.value.assert_not_called()
-    else:
-        fridge_mock.value.assert_called_with(expected["fridge"])
+    subject.control(6.5, 70)
+    assert fridge_pin.history == []
 
-    if expected["heater"] is None:
-        heater_mock.value.assert_not_called()
-    else:
-        heater_mock.value.assert_called_with(expected["heater"])
+    config.set_temperature_tolerance(0.5)
+    subject.control(6.5, 70)
+    assert fridge_pin.history[-1] == 0
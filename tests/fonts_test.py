@@ -0,0 +1,29 @@
+from display.fonts.bitmap import BitmapFont
+from display.fonts.font16x16 import font as font16
+from display.fonts.petme128_8x8 import font as petme
+
+
+def test_columns_are_read_little_endian_top_row_first():
+    # two 3x10 glyphs, "A" and "B", behind a one byte header
+    data = b"\xee" + b"\x01\x00\x02\x02\xff\x03" + b"\x00\x00\x00\x00\x80\x01"
+    font = BitmapFont(data, 3, 10, first=65, header=1)
+    assert len(font) == 2
+    assert [font.column("A", i) for i in range(3)] == [0x001, 0x202, 0x3FF]
+    assert font.column("B", 2) == 0x180
+    assert bytes(font.glyph("B")) == data[7:]
+    # outside the font falls back to the first glyph
+    assert font.column("z", 0) == font.column("A", 0)
+
+
+def test_glyph_header_holds_the_proportional_width():
+    data = b"\x02\x0f\xf0" + b"\x01\xaa\x00"
+    font = BitmapFont(data, 2, 8, first=48, glyph_header=1)
+    assert (font.char_width("0"), font.char_width("1")) == (2, 1)
+    assert bytes(font.glyph("1")) == b"\xaa\x00"
+
+
+def test_built_in_fonts_cover_ascii():
+    assert (petme.width, petme.height, len(petme)) == (8, 8, 96)
+    assert (font16.width, font16.height) == (16, 16)
+    assert petme.column(" ", 0) == 0
+    assert any(font16.column("8", i) for i in range(16))
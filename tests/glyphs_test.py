@@ -0,0 +1,40 @@
+from framebuf import RGB565, FrameBuffer
+
+from display.glyphs import GlyphCache
+
+GLYPH_BYTES = 16 * 16 * 2  # petme128 at scale 2
+
+
+def test_glyphs_are_rasterized_once_per_color():
+    cache = GlyphCache()
+    framebuffer = FrameBuffer(bytearray(176 * 32 * 2), 176, 32, RGB565)
+    assert cache.text(framebuffer, "12.5", 0, 0, 0x07E0) == (64, 16)
+    cache.text(framebuffer, "12.5", 0, 16, 0x07E0)
+    cache.text(framebuffer, "12.5", 0, 16, 0x001F)
+    assert (cache.hits, cache.misses, cache.evictions) == (4, 8, 0)
+    assert cache.size() == 8 * GLYPH_BYTES
+    assert framebuffer.pixel(0, 0) == 0  # the key stays transparent
+
+
+def test_least_recently_used_glyph_is_evicted_at_the_cap():
+    cache = GlyphCache(max_bytes=3 * GLYPH_BYTES)
+    for char in "abc":
+        cache.get(char, 2, 0xFFFF)
+    cache.get("a", 2, 0xFFFF)
+    cache.get("d", 2, 0xFFFF)  # b was used longest ago
+    assert cache.evictions == 1
+    assert cache.size() == 3 * GLYPH_BYTES
+    cache.get("a", 2, 0xFFFF)
+    cache.get("c", 2, 0xFFFF)
+    assert (cache.hits, cache.misses) == (3, 4)
+    cache.get("b", 2, 0xFFFF)
+    assert (cache.misses, cache.evictions) == (5, 2)
+    assert cache.size() <= 3 * GLYPH_BYTES
+
+
+def test_overview_numbers_fit_the_default_cap():
+    cache = GlyphCache()
+    for color in (0x07E0, 0x001F):
+        for char in "-0123456789. %":
+            cache.get(char, 2, color)
+    assert cache.evictions == 0
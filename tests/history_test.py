@@ -0,0 +1,59 @@
+from history import NO_VALUE, History, Ring
+
+
+def test_ring_keeps_newest_entries():
+    ring = Ring("h", 3)
+    for value in range(5):
+        ring.push(value)
+    assert len(ring) == 3
+    assert [ring.get(i) for i in range(3)] == [4, 3, 2]
+
+
+def test_rollups_close_periods_and_mark_gaps():
+    history = History(raw_capacity=8, minute_capacity=4, hour_capacity=2)
+    history.add(0, 20.0, 70.0)
+    history.add(30, 21.0, 71.0)
+    history.add(150, 22.5, 72.0)
+    history.add(170, 23.0, 72.0)
+
+    minutes = history.temperature.minutes
+    assert len(minutes) == 2
+    assert (minutes.min.get(1), minutes.avg.get(1), minutes.max.get(1)) == (
+        200,
+        205,
+        210,
+    )
+    assert minutes.avg.get(0) == NO_VALUE
+    assert minutes.newest_start() == 60
+    assert history.temperature.raw.get(0) == 230
+    assert len(history.temperature.hours) == 0
+
+
+def test_footprint_does_not_grow():
+    history = History()
+    size = history.footprint()
+    for second in range(0, 20000, 4):
+        history.add(second, 20.0, 70.0)
+    assert history.footprint() == size
+    assert len(history) == 1024
+
+
+def test_history_command_reads_the_rings():
+    from commands import CommandInterpreter, register_history
+
+    history = History(raw_capacity=8, minute_capacity=4, hour_capacity=2)
+    for second, temperature in ((0, 20.0), (30, 21.0), (150, 22.5), (170, 23.0)):
+        history.add(second, temperature, 70.0)
+    replies = []
+    interpreter = CommandInterpreter(replies.append)
+    register_history(interpreter, history)
+    interpreter.feed(
+        b"history temperature raw 2\nhistory temperature minutes\n"
+        b"history humidity hours\nhistory pressure\n"
+    )
+    assert replies == [
+        "OK 170:230 150:225",
+        "OK newest=60 period=60 - 205",
+        "OK period=3600",
+        "ERR history: unknown channel pressure",
+    ]
@@ -0,0 +1,60 @@
+from clock import clock
+from machine import SPI, Pin
+
+from display.ili9225 import ILI9225
+
+CHIP_SELECT = 5
+
+
+def test_init_writes_the_register_table_and_waits():
+    spi = SPI(0)
+    start = clock.ticks_ms()
+    ILI9225(spi, CHIP_SELECT, 8, 9)
+    assert clock.ticks_ms() - start == 150
+    writes = [spi.log[i : i + 4] for i in range(0, len(spi.log), 4)]
+    assert len(writes) == 34
+    assert writes[0] == b"\x00\x01\x03\x1c"  # driver output control
+    assert writes[-1] == b"\x00\x07\x10\x17"  # display on
+    # one chip select around the whole sequence
+    assert Pin.pins[CHIP_SELECT].history == [1, 0, 1]
+
+
+def test_update_sends_window_and_pixels_in_one_chip_select():
+    spi = SPI(0)
+    display = ILI9225(spi, CHIP_SELECT, 8, 9)
+    framebuffer = display.framebuffer()
+    framebuffer.dirty.clear()
+    framebuffer.rect(10, 20, 2, 2, 0xFFFF, True)
+    spi.log = bytearray()
+    chip_select = Pin.pins[CHIP_SELECT]
+    chip_select.history.clear()
+    display.update()
+    window = (
+        b"\x00\x36\x00\x0b"
+        b"\x00\x37\x00\x0a"
+        b"\x00\x38\x00\x15"
+        b"\x00\x39\x00\x14"
+        b"\x00\x20\x00\x0a"
+        b"\x00\x21\x00\x14"
+    )
+    assert spi.log == window + b"\x22" + b"\xff" * 8
+    assert chip_select.history == [0, 1]
+
+
+def test_set_window_writes_end_then_start_like_the_init_table():
+    spi = SPI(0)
+    display = ILI9225(spi, CHIP_SELECT, 8, 9)
+    spi.log = bytearray()
+    display.set_window(5, 16, 60, 219)
+    # window address 1 is the end, 2 the start, then the GRAM address
+    assert spi.log == (
+        b"\x00\x36\x00\x3c"
+        b"\x00\x37\x00\x05"
+        b"\x00\x38\x00\xdb"
+        b"\x00\x39\x00\x10"
+        b"\x00\x20\x00\x05"
+        b"\x00\x21\x00\x10"
+    )
+    data_command = Pin.pins[8]
+    # every index word as a command, every value word as data
+    assert data_command.history[-12:] == [0, 1] * 6
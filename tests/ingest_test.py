@@ -0,0 +1,63 @@
+import os
+
+from ingest import FrameDecoder, Ingester, Store
+from telemetry import FRAME_SIZE, Telemetry
+
+
+class Port:
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data):
+        self.data += data
+
+
+def frames(count: int) -> bytes:
+    port = Port()
+    telemetry = Telemetry(port)
+    for i in range(count):
+        telemetry.send(60 + i, 750, 1, 0, i, 100, 200, 0)
+    return bytes(port.data)
+
+
+def test_decoder_resyncs_after_text_partial_and_corrupt_frames():
+    data = frames(3)
+    corrupt = bytearray(data[FRAME_SIZE : 2 * FRAME_SIZE])
+    corrupt[10] ^= 0xFF
+    stream = (
+        b"OK telemetry=1\n"
+        + data[:FRAME_SIZE]
+        + data[:7]  # a frame cut short by a reset
+        + bytes(corrupt)
+        + data[2 * FRAME_SIZE :]
+    )
+    decoder = FrameDecoder()
+    decoded = []
+    for i in range(0, len(stream), 5):
+        decoded += decoder.feed(stream[i : i + 5])
+    assert [status[3] for status in decoded] == [60, 62]
+    assert decoder.errors > 0
+
+
+def test_ingests_from_a_pty_in_batches_and_notices_the_disconnect(tmp_path):
+    master, slave = os.openpty()
+    store = Store(str(tmp_path / "telemetry.db"), batch_size=4)
+    ingester = Ingester(os.ttyname(slave), store, enable=True)
+    ingester.connect()
+    assert os.read(master, 100) == b"telemetry on\n"
+
+    data = frames(6)
+    os.write(master, data[:100])
+    assert ingester.poll(1.0) == 100 // FRAME_SIZE
+    os.write(master, data[100:])
+    while ingester.decoder.frames < 6:
+        ingester.poll(1.0)
+    assert store.count() == 4  # one full batch, two rows pending
+
+    os.close(master)
+    os.close(slave)
+    while ingester.connected():
+        ingester.poll(1.0)
+    assert store.count() == 6
+    assert list(store.readings())[:2] == [(6.0, 75.0), (6.1, 75.0)]
+    store.close()
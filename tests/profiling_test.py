@@ -0,0 +1,56 @@
+from clock import clock
+
+from display.pages import DiagnosticsPage
+from profiling import Histogram, Profiler
+
+
+def test_histogram_percentiles_are_bucket_bounds():
+    histogram = Histogram("stage")
+    for us in [100] * 98 + [5000, 70000]:
+        histogram.add(us)
+
+    assert histogram.count == 100
+    assert histogram.percentile(50) == 128
+    assert histogram.percentile(99) == 8192
+    assert histogram.percentile(100) == 70000
+    assert histogram.max_us == 70000
+
+    histogram.reset()
+    assert histogram.count == 0
+    assert histogram.percentile(50) == 0
+
+
+def test_timed_functions_record_their_duration():
+    profiler = Profiler(enabled=True)
+
+    def work():
+        clock.advance(3)
+        return 3
+
+    timed = profiler.timed("work", work)
+    assert timed() == 3
+    histogram = profiler.histogram("work")
+    assert histogram.count == 1
+    assert histogram.last_us == 3000
+    assert profiler.report() == "work=1/3000/3000/3000/0/0/0"
+
+
+def test_disabled_profiler_returns_the_function():
+    profiler = Profiler(enabled=False)
+
+    def work():
+        pass
+
+    assert profiler.timed("work", work) is work
+    assert profiler.histograms() == []
+
+
+def test_diagnostics_columns_stay_apart():
+    histogram = Histogram("render")
+    for us in (16400, 16400, 32800, 40000):
+        histogram.add(us)
+    summary = DiagnosticsPage._summary(histogram)(histogram.count)
+    assert summary == "  33  40   40"
+    histogram.add(5_000_000)
+    assert DiagnosticsPage._summary(histogram)(histogram.count) == "  66  5s   5s"
+    assert DiagnosticsPage._ms(400) == "0.4"
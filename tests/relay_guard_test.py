@@ -0,0 +1,44 @@
+from clock import clock
+from machine import Pin
+
+from relay_guard import RelayGuard
+
+
+def test_minimum_on_and_off_times_delay_changes():
+    pin = Pin(14, Pin.OUT, value=1)
+    guard = RelayGuard(pin, min_on_ms=3000, min_off_ms=5000, active_low=True)
+
+    guard.value(0)  # the first change is never held back
+    assert pin.value() == 0 and guard.is_on()
+    clock.advance(1000)
+    guard.value(1)
+    assert pin.value() == 0
+    clock.advance(1999)
+    guard.value(1)
+    assert pin.value() == 0
+    clock.advance(1)
+    guard.value(1)
+    assert pin.value() == 1
+    assert (guard.denied, guard.delayed, guard.delay_ms) == (1, 1, 2000)
+
+    clock.advance(1000)
+    guard.value(0)  # wants on again after 1 s off, then changes its mind
+    guard.value(1)
+    assert pin.value() == 1
+    assert (guard.denied, guard.delayed) == (2, 1)
+
+
+def test_starts_per_hour_are_limited():
+    pin = Pin(15, Pin.OUT, value=0)
+    guard = RelayGuard(pin, max_starts_per_hour=2)
+    for _ in range(2):
+        guard.value(1)
+        clock.advance(60 * 1000)
+        guard.value(0)
+        clock.advance(60 * 1000)
+    guard.value(1)
+    assert pin.value() == 0
+    clock.advance(3600 * 1000 - 4 * 60 * 1000)
+    guard.value(1)
+    assert pin.value() == 1
+    assert guard.delay_ms == 3600 * 1000 - 4 * 60 * 1000
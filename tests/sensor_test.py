@@ -0,0 +1,34 @@
+from dht import DHT22
+from machine import Pin
+
+from sensor import Reading, SensorWorker
+
+
+def get_worker(readings) -> SensorWorker:
+    return SensorWorker(
+        DHT22(Pin(22), source=readings), Pin(13, Pin.OUT, value=1), 3500
+    )
+
+
+def test_measure_publishes_reading():
+    worker = get_worker([(6.5, 74.0)])
+    assert not worker.snapshot().valid
+
+    worker.measure()
+
+    reading = worker.snapshot()
+    assert reading.valid
+    assert (reading.temperature, reading.humidity, reading.error) == (6.5, 74.0, 0)
+
+
+def test_failed_measure_keeps_last_values():
+    worker = get_worker([(6.5, 74.0), OSError(110, "ETIMEDOUT")])
+    worker.measure()
+    worker.measure()
+
+    reading = Reading()
+    worker.read_into(reading)
+    assert reading.valid
+    assert (reading.temperature, reading.humidity) == (6.5, 74.0)
+    assert reading.error == 110
+    assert worker.error_count() == 1
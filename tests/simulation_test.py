@@ -0,0 +1,24 @@
+import pytest
+
+from simulation import Chamber, Simulation, load_firmware
+
+
+def test_a_day_in_closed_loop(firmware_directory):
+    simulation = Simulation(Chamber(), warmup_s=3 * 3600, directory=firmware_directory)
+    simulation.run(27 * 3600)
+
+    assert simulation.temperature.time_in_band() > 0.8
+    assert simulation.humidity.time_in_band() > 0.8
+    fridge, heater, atomizer, fan = simulation.relays
+    assert fridge.switches > 0
+    assert heater.switches == 0
+    assert atomizer.switches > 0
+    # the fan runs fan_on_interval minutes out of every on + off interval
+    assert 40 <= fan.switches <= 50
+    assert "switches" in simulation.report()
+
+
+def test_firmware_runs_in_one_directory(firmware_directory, tmp_path):
+    assert load_firmware(firmware_directory) is load_firmware()
+    with pytest.raises(ValueError):
+        load_firmware(str(tmp_path))
@@ -0,0 +1,57 @@
+import struct
+from binascii import crc32
+
+from clock import clock
+
+from telemetry import FRAME_SIZE, STATUS, STATUS_SIZE, SYNC, Telemetry
+
+
+class Port:
+    def __init__(self, delay_ms=0):
+        self.data = bytearray()
+        self.delay_ms = delay_ms
+
+    def write(self, data):
+        clock.advance(self.delay_ms)
+        self.data += data
+
+
+def send(telemetry, lag_ms=0):
+    telemetry.send(62, 751, 9, 0, 120, 800, 15000, lag_ms)
+
+
+def test_frame_layout_and_checksum():
+    port = Port()
+    telemetry = Telemetry(port)
+    send(telemetry)
+    frame = bytes(port.data)
+    assert len(frame) == FRAME_SIZE
+    assert frame[:2] == SYNC
+    assert frame[2] == STATUS_SIZE
+    payload = frame[3 : 3 + STATUS_SIZE]
+    (crc,) = struct.unpack("<I", frame[3 + STATUS_SIZE :])
+    assert crc == crc32(frame[2 : 3 + STATUS_SIZE])
+    status = struct.unpack(STATUS, payload)
+    assert status[0:2] == (1, 1)
+    assert status[3:] == (62, 751, 9, 0, 120, 800, 15000, 0)
+
+
+def test_interval_backs_off_while_slow_and_recovers():
+    port = Port(delay_ms=5)
+    telemetry = Telemetry(port, interval_ms=1000, max_interval_ms=8000)
+    telemetry.enabled = True
+    assert telemetry.due()
+    send(telemetry)
+    assert telemetry.interval() == 2000
+    clock.advance(1000)
+    assert not telemetry.due()
+    for _ in range(4):
+        send(telemetry)
+    assert telemetry.interval() == 8000
+
+    port.delay_ms = 0
+    for _ in range(10):
+        send(telemetry)
+    assert telemetry.interval() == 1000
+    send(telemetry, lag_ms=30)
+    assert telemetry.interval() == 2000
@@ -0,0 +1,66 @@
+from framebuf import RGB565
+
+from config import Config
+from display.dirty import TrackedFrameBuffer
+from display.pages import TrendPage
+from history import History
+
+WIDTH = 176
+HEIGHT = 220
+
+
+class DisplayStub:
+    def __init__(self, framebuffer):
+        self._framebuffer = framebuffer
+        self.area = None
+        self.scrolls = []
+        self.flushed = []
+
+    def set_scroll_area(self, top, bottom):
+        self.area = (top, bottom)
+
+    def scroll(self, lines):
+        self.scrolls.append(lines)
+
+    def update(self):
+        self.flushed.append(self._framebuffer.dirty.take())
+
+
+def make_page():
+    buffer = bytearray(WIDTH * HEIGHT * 2)
+    framebuffer = TrackedFrameBuffer(buffer, WIDTH, HEIGHT, RGB565)
+    history = History()
+    page = TrendPage(framebuffer, WIDTH, HEIGHT, history, Config(""))
+    display = DisplayStub(framebuffer)
+    page.attach(display)
+    page.activate()
+    return page, history, display
+
+
+def test_new_minute_flushes_one_row_and_scrolls():
+    page, history, display = make_page()
+    for second in range(0, 180, 4):
+        history.add(second, 6.0, 70.0)
+    page.render()
+    assert display.area == (12, HEIGHT - 1)
+    assert display.scrolls == [2]
+
+    page.render()
+    assert display.scrolls == [2]
+
+    for second in range(180, 240, 4):
+        history.add(second, 6.5, 72.0)
+    page.render()
+    assert display.flushed[-1] == [[0, 14, WIDTH - 1, 14]]
+    assert display.scrolls == [2, 3]
+
+
+def test_rows_wrap_around_the_scroll_area():
+    page, history, display = make_page()
+    rows = HEIGHT - 12
+    page.render()
+    for minute in range(rows + 5):
+        history.add(minute * 60, 6.0, 70.0)
+        page.render()
+    assert display.scrolls[-1] == (rows + 4) % rows
+    assert display.flushed[-1] == [[0, 12 + 3, WIDTH - 1, 12 + 3]]
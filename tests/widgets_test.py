@@ -0,0 +1,83 @@
+from framebuf import RGB565
+
+from display.dirty import TrackedFrameBuffer
+from display.pages import Page
+from display.widgets import Decimal, Duration, Indicator, Label, Value
+
+WIDTH = 176
+HEIGHT = 64
+
+
+def make_page(*widgets) -> Page:
+    framebuffer = TrackedFrameBuffer(
+        bytearray(WIDTH * HEIGHT * 2), WIDTH, HEIGHT, RGB565
+    )
+    page = Page(framebuffer, WIDTH, HEIGHT)
+    for widget in widgets:
+        page.add(widget)
+    page.render()
+    framebuffer.dirty.clear()
+    return page
+
+
+def test_widgets_repaint_only_after_a_visible_change():
+    label = Label(2, 2, "Temperatur", 0xFFFF)
+    value = Value(2, 20, "{:.1f} %", 0x07E0, 2)
+    indicator = Indicator(150, 2, 10, 10, 0x07E0, 0x0000)
+    page = make_page(label, value, indicator)
+    value.set_data(70.0)
+    page.render()
+    dirty = page.framebuffer().dirty
+    # erased where "" was painted, nothing, then painted
+    assert dirty.take() == [[2, 20, 2 + 6 * 16 - 1, 35]]
+
+    label.set_data("Temperatur")
+    value.set_data(70.0)
+    indicator.set_data(False)
+    page.render()
+    assert dirty.is_empty()
+
+    value.set_data(70.04)  # a different value, the same text
+    page.render()
+    assert dirty.is_empty()
+
+
+def test_repaint_erases_the_area_painted_before():
+    label = Label(2, 2, "Temperatur", 0xFFFF)
+    page = make_page(label)
+    framebuffer = page.framebuffer()
+    label.set_data("Hi")
+    page.render()
+    assert framebuffer.dirty.take() == [[2, 2, 81, 9]]
+    assert framebuffer.pixel(2 + 3 * 8 + 1, 4) == 0
+    assert label.bounds() == (2, 2, 16, 8)
+
+
+def test_duration_shows_minutes_and_seconds():
+    duration = Duration(0, 0, 0xFFFF)
+    page = make_page(duration)
+    duration.set_data(-3)
+    page.render()
+    assert duration.bounds() == (0, 0, 4 * 8, 8)  # 0:00
+    duration.set_data(754)
+    page.render()
+    assert duration.bounds() == (0, 0, 5 * 8, 8)  # 12:34
+
+
+def test_decimal_draws_tenths_like_value():
+    decimal = Decimal(2, 20, 0x07E0, 2, " %")
+    value = Value(2, 20, "{:.1f} %", 0x07E0, 2)
+    for tenths in (705, -5, 1000, 0):
+        expected = make_page(value)
+        value.set_data(tenths / 10)
+        expected.render()
+        page = make_page(decimal)
+        decimal.set_data(tenths)
+        page.render()
+        assert tuple(decimal.bounds()) == value.bounds()
+        assert pixels(page) == pixels(expected)
+
+
+def pixels(page: Page) -> list:
+    framebuffer = page.framebuffer()
+    return [framebuffer.pixel(x, y) for y in range(HEIGHT) for x in range(WIDTH)]